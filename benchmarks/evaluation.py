@@ -0,0 +1,106 @@
+"""
+Micro-benchmarks of the flag evaluation hot path.
+
+Run with ``uv run poe bench``.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+
+from openfeature import api
+from openfeature.evaluation_context import EvaluationContext
+from openfeature.flag_evaluation import FlagEvaluationOptions, FlagType
+from openfeature.hook import Hook
+from openfeature.hook.deferred_hook import DeferredHook
+from openfeature.provider.in_memory_provider import InMemoryFlag, InMemoryProvider
+
+ITERATIONS = 100_000
+# hooks blocking on I/O are benchmarked with fewer iterations
+BLOCKING_ITERATIONS = 2_000
+
+
+class _AfterHook(Hook):
+    def after(self, hook_context, details, hints):  # type: ignore[no-untyped-def]
+        pass
+
+
+class _BlockingAfterHook(Hook):
+    """Stands for a hook exporting every evaluation, e.g. over the network."""
+
+    def after(self, hook_context, details, hints):  # type: ignore[no-untyped-def]
+        time.sleep(0.0001)
+
+
+def _report(name: str, elapsed: float, iterations: int = ITERATIONS) -> None:
+    print(f"{name:<52} {elapsed / iterations * 1e6:8.3f} us/op")
+
+
+def _bench(name: str, func: Callable[[], object], iterations: int = ITERATIONS) -> None:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    _report(name, time.perf_counter() - start, iterations)
+
+
+def _bench_async(name: str, func: Callable[[], object]) -> None:
+    async def run() -> float:
+        start = time.perf_counter()
+        for _ in range(ITERATIONS):
+            await func()  # type: ignore[misc]
+        return time.perf_counter() - start
+
+    _report(name, asyncio.run(run()))
+
+
+def main() -> None:
+    api.set_provider_and_wait(
+        InMemoryProvider({"flag": InMemoryFlag("on", {"on": True, "off": False})})
+    )
+    client = api.get_client()
+    # hooks only count once they implement a stage, so an invocation hook with
+    # an empty after stage forces the regular, hooked evaluation path
+    hooked = FlagEvaluationOptions(hooks=[_AfterHook()])
+    handle = client.flag_handle("flag", FlagType.BOOLEAN, False)
+
+    _bench(
+        "sync, no hooks (fast path)", lambda: client.get_boolean_details("flag", False)
+    )
+    _bench(
+        "sync, one no-op after hook",
+        lambda: client.get_boolean_details("flag", False, None, hooked),
+    )
+    _bench("sync, flag handle, no hooks", handle.details)
+    _bench_async(
+        "async, no hooks (fast path)",
+        lambda: client.get_boolean_details_async("flag", False),
+    )
+    _bench_async(
+        "async, one no-op after hook",
+        lambda: client.get_boolean_details_async("flag", False, None, hooked),
+    )
+
+    # deferring a hook must not cost the caller more than running it inline
+    evaluation_context = EvaluationContext(
+        "user", {f"attribute-{i}": i for i in range(8)} | {"tags": ["a", "b"]}
+    )
+    inline = FlagEvaluationOptions(hooks=[_BlockingAfterHook()])
+    deferred_hook = DeferredHook(
+        _BlockingAfterHook(), max_queue_size=BLOCKING_ITERATIONS
+    )
+    deferred = FlagEvaluationOptions(hooks=[deferred_hook])
+    _bench(
+        "sync, 10 attributes, blocking after hook inline",
+        lambda: client.get_boolean_details("flag", False, evaluation_context, inline),
+        BLOCKING_ITERATIONS,
+    )
+    _bench(
+        "sync, 10 attributes, blocking after hook deferred",
+        lambda: client.get_boolean_details("flag", False, evaluation_context, deferred),
+        BLOCKING_ITERATIONS,
+    )
+    deferred_hook.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Micro-benchmarks of evaluation context serialization, against the previous
+approach of dumping the context converted with dataclasses.asdict.
+
+Run with ``uv run poe bench-serialization``.
+"""
+
+import json
+import time
+from collections.abc import Callable
+from dataclasses import asdict
+from datetime import datetime, timezone
+
+from openfeature.evaluation_context import EvaluationContext
+from openfeature.evaluation_context.serialization import to_bytes, to_json
+
+ITERATIONS = 20_000
+
+
+def _bench(name: str, func: Callable[[], object]) -> None:
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        func()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<48} {elapsed / ITERATIONS * 1e6:8.3f} us/op")
+
+
+def _asdict_json(evaluation_context: EvaluationContext) -> str:
+    return json.dumps(asdict(evaluation_context), default=str)
+
+
+def main() -> None:
+    api_context = EvaluationContext(
+        None,
+        {
+            "service": "checkout",
+            "region": "eu-west-1",
+            "version": "1.2.3",
+            "started_at": datetime(2024, 1, 1, tzinfo=timezone.utc),
+            "features": ["a", "b", "c"],
+        },
+    )
+    invocation_context = EvaluationContext(
+        "user-1", {"plan": "pro", "country": "FR", "beta": True, "age": 42}
+    )
+    merged = api_context.merge(invocation_context)
+    flat = EvaluationContext(merged.targeting_key, dict(merged.attributes))
+    frozen = flat.freeze()
+    merged_frozen = api_context.freeze().merge(invocation_context.freeze())
+
+    _bench("asdict + json.dumps", lambda: _asdict_json(flat))
+    _bench("to_json, mutable context", lambda: to_json(flat))
+    _bench("to_json, merged frozen contexts", lambda: to_json(merged_frozen))
+    _bench("to_json, frozen context (memoized)", lambda: to_json(frozen))
+    _bench("to_bytes, mutable context", lambda: to_bytes(flat))
+    _bench("to_bytes, merged frozen contexts", lambda: to_bytes(merged_frozen))
+    _bench("to_bytes, frozen context (memoized)", lambda: to_bytes(frozen))
+
+
+if __name__ == "__main__":
+    main()
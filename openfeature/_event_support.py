@@ -3,6 +3,7 @@ from __future__ import annotations
 import atexit
 import threading
 import typing
+import weakref
 from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
@@ -31,6 +32,11 @@ _client_handlers: dict[OpenFeatureClient, dict[ProviderEvent, list[EventHandler]
     defaultdict(lambda: defaultdict(list))
 )
 
+# clients with an evaluation cache, whose entries are invalidated before any
+# handler runs, so handlers reading a changed flag never see a cached value
+_cache_lock = threading.RLock()
+_cached_clients: weakref.WeakSet[OpenFeatureClient] = weakref.WeakSet()
+
 
 def run_client_handlers(
     client: OpenFeatureClient, event: ProviderEvent, details: EventDetails
@@ -86,11 +92,34 @@ def remove_global_handler(event: ProviderEvent, handler: EventHandler) -> None:
         _global_handlers[event].remove(handler)
 
 
+def add_cached_client(client: OpenFeatureClient) -> None:
+    with _cache_lock:
+        _cached_clients.add(client)
+
+
+def remove_cached_client(client: OpenFeatureClient) -> None:
+    with _cache_lock:
+        _cached_clients.discard(client)
+
+
+def _invalidate_caches(
+    provider: FeatureProvider, flags_changed: list[str] | None
+) -> None:
+    with _cache_lock:
+        clients = tuple(_cached_clients)
+
+    for client in clients:
+        if client.cache is not None and client.provider == provider:
+            client.cache.invalidate(client.domain, flags_changed)
+
+
 def run_handlers_for_provider(
     provider: FeatureProvider,
     event: ProviderEvent,
     provider_details: ProviderEventDetails,
 ) -> None:
+    if event == ProviderEvent.PROVIDER_CONFIGURATION_CHANGED:
+        _invalidate_caches(provider, provider_details.flags_changed)
     details = EventDetails.from_provider_event_details(
         provider.get_metadata().name, provider_details
     )
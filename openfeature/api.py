@@ -1,4 +1,5 @@
 from openfeature import _event_support
+from openfeature.cache import EvaluationCache
 from openfeature.client import OpenFeatureClient
 from openfeature.evaluation_context import (
     clear_evaluation_context,
@@ -10,9 +11,13 @@ from openfeature.event import (
     ProviderEvent,
 )
 from openfeature.hook import add_hooks, clear_hooks, get_hooks
+from openfeature.hook.deferred_hook import flush_deferred_hooks
+from openfeature.hook.summary_hook import shutdown_summary_hooks
+from openfeature.instrumentation import EvaluationInstrumentation
 from openfeature.provider import FeatureProvider
 from openfeature.provider._registry import provider_registry
 from openfeature.provider.metadata import Metadata
+from openfeature.telemetry.exporter import shutdown_event_exporters
 from openfeature.transaction_context import (
     clear_transaction_context_propagator,
     get_transaction_context,
@@ -39,11 +44,19 @@ __all__ = [
     "shutdown",
 ]
 
+# the number of seconds shutdown waits for background work to be flushed
+_SHUTDOWN_TIMEOUT = 5.0
+
 
 def get_client(
-    domain: str | None = None, version: str | None = None
+    domain: str | None = None,
+    version: str | None = None,
+    cache: EvaluationCache | None = None,
+    instrumentation: EvaluationInstrumentation | None = None,
 ) -> OpenFeatureClient:
-    return OpenFeatureClient(domain=domain, version=version)
+    return OpenFeatureClient(
+        domain=domain, version=version, cache=cache, instrumentation=instrumentation
+    )
 
 
 def set_provider(provider: FeatureProvider, domain: str | None = None) -> None:
@@ -72,6 +85,12 @@ def get_provider_metadata(domain: str | None = None) -> Metadata:
 def shutdown() -> None:
     # shutdown -> remove providers -> set default provider to NoOp -> remove event handlers
     clear_providers()
+    # run the after and finally_after stages still queued by deferred hooks
+    flush_deferred_hooks(_SHUTDOWN_TIMEOUT)
+    # hand the current windows of summary hooks over
+    shutdown_summary_hooks(_SHUTDOWN_TIMEOUT)
+    # ship the evaluation events still buffered
+    shutdown_event_exporters(_SHUTDOWN_TIMEOUT)
     # remove hooks
     clear_hooks()
     # set evaluation context to default
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import threading
+import time
+import typing
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, replace
+
+from openfeature.exception import GeneralError
+from openfeature.flag_evaluation import FlagEvaluationDetails, FlagType, Reason
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from openfeature.provider import FeatureProvider
+
+__all__ = ["CacheKey", "CacheStatistics", "EvaluationCache"]
+
+CacheKey = tuple[str | None, str, FlagType, str]
+"""(domain, flag key, flag type, evaluation context fingerprint)"""
+
+
+@dataclass(frozen=True)
+class CacheStatistics:
+    hits: int = 0
+    misses: int = 0
+    size: int = 0
+
+
+@dataclass(frozen=True)
+class _CacheEntry:
+    details: FlagEvaluationDetails[typing.Any]
+    # the provider that resolved the flag, entries of a replaced provider are
+    # treated as missing
+    provider: FeatureProvider
+    expires_at: float | None
+
+
+class EvaluationCache:
+    """
+    A bounded cache of flag evaluation results, keyed by domain, flag key, flag
+    type and the fingerprint of the evaluation context sent to the provider.
+
+    Once the cache holds ``max_size`` entries, the least recently used entry is
+    evicted. Entries expire ``ttl`` seconds after they were stored, or never if
+    no ``ttl`` is given. A cache can be passed to one or more clients; entries
+    are invalidated whenever the provider bound to the domain emits
+    ``PROVIDER_CONFIGURATION_CHANGED``.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_size < 1:
+            raise GeneralError(error_message="max_size must be at least 1")
+        if ttl is not None and ttl <= 0:
+            raise GeneralError(error_message="ttl must be positive")
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[CacheKey, _CacheEntry] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        # incremented by every invalidation
+        self._generation = 0
+
+    def get_generation(self) -> int:
+        """
+        Returns a counter that changes every time entries are invalidated or the
+        cache is cleared. Read it before resolving a flag and pass it to set(),
+        so that a result resolved before an invalidation is not stored after it.
+        """
+        return self._generation
+
+    def get(
+        self, key: CacheKey, provider: FeatureProvider
+    ) -> FlagEvaluationDetails[typing.Any] | None:
+        """
+        Returns the cached details for the key with the reason set to CACHED, or
+        None if there is no live entry resolved by the given provider.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (
+                entry.provider is not provider
+                or (entry.expires_at is not None and entry.expires_at <= self._clock())
+            ):
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return replace(entry.details, reason=Reason.CACHED)
+
+    def set(
+        self,
+        key: CacheKey,
+        provider: FeatureProvider,
+        details: FlagEvaluationDetails[typing.Any],
+        generation: int | None = None,
+    ) -> None:
+        """
+        Stores the details of a successful evaluation. Errors and results
+        resolved to the default value are not cached, since their details hold
+        the default value, which may differ between calls.
+
+        :param generation: the value of get_generation() read before the flag
+        was resolved; the details are dropped if entries were invalidated since
+        """
+        if details.error_code or details.reason in (Reason.ERROR, Reason.DEFAULT):
+            return
+        expires_at = None if self.ttl is None else self._clock() + self.ttl
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            # a copy, so callers changing the details they got cannot alter the entry
+            self._entries[key] = _CacheEntry(replace(details), provider, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(
+        self, domain: str | None, flag_keys: Iterable[str] | None = None
+    ) -> None:
+        """
+        Removes the entries of a domain, or only those of the given flag keys.
+
+        :param domain: the domain of the client the entries were cached for
+        :param flag_keys: the keys of the flags to remove, or None to remove all
+        the entries of the domain
+        """
+        flag_keys = None if flag_keys is None else frozenset(flag_keys)
+        with self._lock:
+            self._generation += 1
+            stale = [
+                key
+                for key in self._entries
+                if key[0] == domain and (flag_keys is None or key[1] in flag_keys)
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def get_statistics(self) -> CacheStatistics:
+        with self._lock:
+            return CacheStatistics(
+                hits=self._hits, misses=self._misses, size=len(self._entries)
+            )
+
+    def reset_statistics(self) -> None:
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
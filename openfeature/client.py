@@ -1,15 +1,23 @@
+import asyncio
+import functools
 import logging
 import threading
 import typing
-from collections.abc import Awaitable, Mapping, Sequence
-from dataclasses import dataclass
-from itertools import chain
+from collections.abc import Awaitable, Callable, Collection, Mapping, Sequence
+from dataclasses import dataclass, field, replace
 
 from openfeature import _event_support
-from openfeature.evaluation_context import EvaluationContext, get_evaluation_context
+from openfeature.cache import CacheKey, EvaluationCache
+from openfeature.evaluation_context import (
+    EvaluationContext,
+    _MemoizedAttributes,
+    get_evaluation_context,
+    get_evaluation_context_version,
+)
 from openfeature.event import EventHandler, ProviderEvent
 from openfeature.exception import (
     ErrorCode,
+    FlagNotFoundError,
     GeneralError,
     OpenFeatureError,
     ProviderFatalError,
@@ -19,30 +27,69 @@ from openfeature.exception import (
 from openfeature.flag_evaluation import (
     FlagEvaluationDetails,
     FlagEvaluationOptions,
+    FlagEvaluationRequest,
     FlagResolutionDetails,
     FlagType,
     FlagValueType,
     Reason,
 )
-from openfeature.hook import Hook, HookContext, HookHints, get_hooks
+from openfeature.hook import (
+    Hook,
+    HookContext,
+    HookHints,
+    HookType,
+    _HookContextCore,
+    get_hooks,
+    get_hooks_version,
+)
 from openfeature.hook._hook_support import (
-    after_all_hooks,
-    after_hooks,
-    before_hooks,
-    error_hooks,
+    get_async_only_stages,
+    get_overridden_stages,
+    run_after_all_hooks,
+    run_after_all_hooks_async,
+    run_after_hooks,
+    run_after_hooks_async,
+    run_before_hooks,
+    run_before_hooks_async,
+    run_error_hooks,
+    run_error_hooks_async,
+    warn_async_only_stages,
+)
+from openfeature.instrumentation import (
+    EvaluationInstrumentation,
+    EvaluationStage,
+    EvaluationTimer,
+)
+from openfeature.provider import (
+    AbstractProvider,
+    FeatureProvider,
+    Metadata,
+    ProviderStatus,
 )
-from openfeature.provider import FeatureProvider, ProviderStatus
 from openfeature.provider._registry import provider_registry
 from openfeature.track import TrackingEventDetails
-from openfeature.transaction_context import get_transaction_context
+from openfeature.transaction_context import (
+    get_evaluation_scope,
+    get_transaction_context,
+    get_transaction_context_version,
+    is_transaction_context_outdated,
+)
 
 __all__ = [
     "ClientMetadata",
+    "FlagHandle",
     "OpenFeatureClient",
 ]
 
 logger = logging.getLogger("openfeature")
 
+# the number of seconds cancelled resolutions are given to complete
+_CANCELLATION_TIMEOUT = 1.0
+# the number of transaction contexts a client keeps a merged context prefix for
+_MAX_CONTEXT_PREFIXES = 32
+# the number of hook chains with invocation hooks a plan keeps
+_MAX_INVOCATION_HOOK_CHAINS = 32
+
 TypeMap = dict[
     FlagType,
     type[bool] | type[int] | type[float] | type[str] | tuple[type[dict], type[list]],
@@ -75,6 +122,231 @@ class ClientMetadata:
     domain: str | None = None
 
 
+class _StageHooks(typing.NamedTuple):
+    """The hooks of an evaluation to run at every stage, with their context."""
+
+    # API, Client, Invocation, Provider
+    before: list[tuple[Hook, HookContext]]
+    # Provider, Invocation, Client, API
+    after: list[tuple[Hook, HookContext]]
+    error: list[tuple[Hook, HookContext]]
+    finally_after: list[tuple[Hook, HookContext]]
+
+
+class _HookChain(typing.NamedTuple):
+    """
+    The hooks supporting a flag type that implement at least one stage, in the
+    order of the before stage, and for every stage the positions of the hooks
+    implementing it, in the order the stage runs them.
+    """
+
+    flag_type: FlagType
+    hooks: tuple[Hook, ...]
+    before: tuple[int, ...]
+    after: tuple[int, ...]
+    error: tuple[int, ...]
+    finally_after: tuple[int, ...]
+    # the hooks implementing stages only asynchronously
+    async_only: tuple[Hook, ...]
+
+    @classmethod
+    def build(cls, flag_type: FlagType, hooks: Sequence[Hook]) -> "_HookChain":
+        hooks_and_stages = [
+            (hook, stages)
+            for hook in hooks
+            if (stages := get_overridden_stages(hook))
+            and hook.supports_flag_value_type(flag_type)
+        ]
+        forward = range(len(hooks_and_stages))
+        backward = forward[::-1]
+
+        def positions(stage: HookType, order: range) -> tuple[int, ...]:
+            return tuple(i for i in order if stage in hooks_and_stages[i][1])
+
+        return cls(
+            flag_type=flag_type,
+            hooks=tuple(hook for hook, _ in hooks_and_stages),
+            before=positions(HookType.BEFORE, forward),
+            after=positions(HookType.AFTER, backward),
+            error=positions(HookType.ERROR, backward),
+            finally_after=positions(HookType.FINALLY_AFTER, backward),
+            async_only=tuple(
+                hook for hook, _ in hooks_and_stages if get_async_only_stages(hook)
+            ),
+        )
+
+    def bind(self, hook_contexts: list[HookContext]) -> _StageHooks:
+        """Pairs the hooks of every stage with their context, given in before order."""
+        hooks = self.hooks
+        return _StageHooks(
+            before=[(hooks[i], hook_contexts[i]) for i in self.before],
+            after=[(hooks[i], hook_contexts[i]) for i in self.after],
+            error=[(hooks[i], hook_contexts[i]) for i in self.error],
+            finally_after=[(hooks[i], hook_contexts[i]) for i in self.finally_after],
+        )
+
+
+@dataclass(frozen=True)
+class _EvaluationPlan:
+    """
+    The parts of a flag evaluation that only change when hooks are added or
+    cleared, or when the provider registry changes. A plan is built lazily and
+    cached per client, and rebuilt once its version no longer matches.
+
+    Hooks appended to or removed from the lists returned by ``api.get_hooks()``
+    and ``client.hooks`` in place are picked up too, since the version includes
+    the identity and length of both lists, but replacing a hook in place is
+    not: hooks are meant to be changed with ``add_hooks`` and ``clear_hooks``.
+    """
+
+    version: tuple[int, ...]
+    provider: FeatureProvider
+    client_metadata: ClientMetadata
+    provider_metadata: Metadata
+    api_and_client_hooks: tuple[Hook, ...]
+    provider_hooks: tuple[Hook, ...]
+    # before: API, Client, Provider
+    hooks: tuple[Hook, ...]
+    # after, error, finally: Provider, Client, API
+    reversed_hooks: tuple[Hook, ...]
+    resolvers: Mapping[FlagType, ResolveDetailsCallable]
+    async_resolvers: Mapping[FlagType, ResolveDetailsCallableAsync]
+    # filled lazily by get_hook_chain
+    hook_chains: dict[FlagType, _HookChain] = field(default_factory=dict, compare=False)
+    # keyed by the flag type and the identities of the invocation hooks, which
+    # the values hold on to, so that their identities cannot be reused
+    invocation_hook_chains: dict[
+        tuple[typing.Any, ...], tuple[tuple[Hook, ...], _HookChain]
+    ] = field(default_factory=dict, compare=False)
+
+    @classmethod
+    def build(
+        cls,
+        version: tuple[int, ...],
+        provider: FeatureProvider,
+        client_metadata: ClientMetadata,
+        client_hooks: Sequence[Hook],
+    ) -> "_EvaluationPlan":
+        api_and_client_hooks = (*get_hooks(), *client_hooks)
+        provider_hooks = tuple(provider.get_provider_hooks())
+        hooks = api_and_client_hooks + provider_hooks
+        return cls(
+            version=version,
+            provider=provider,
+            client_metadata=client_metadata,
+            provider_metadata=provider.get_metadata(),
+            api_and_client_hooks=api_and_client_hooks,
+            provider_hooks=provider_hooks,
+            hooks=hooks,
+            reversed_hooks=hooks[::-1],
+            resolvers={
+                FlagType.BOOLEAN: provider.resolve_boolean_details,
+                FlagType.INTEGER: provider.resolve_integer_details,
+                FlagType.FLOAT: provider.resolve_float_details,
+                FlagType.OBJECT: provider.resolve_object_details,
+                FlagType.STRING: provider.resolve_string_details,
+            },
+            async_resolvers={
+                FlagType.BOOLEAN: provider.resolve_boolean_details_async,
+                FlagType.INTEGER: provider.resolve_integer_details_async,
+                FlagType.FLOAT: provider.resolve_float_details_async,
+                FlagType.OBJECT: provider.resolve_object_details_async,
+                FlagType.STRING: provider.resolve_string_details_async,
+            },
+        )
+
+    def get_ordered_hooks(
+        self, invocation_hooks: Sequence[Hook]
+    ) -> tuple[tuple[Hook, ...], tuple[Hook, ...]]:
+        """
+        Returns the hooks in the order of the before stage and in the order of the
+        after, error and finally stages, with the invocation hooks spliced in
+        between the client and the provider hooks.
+        """
+        if not invocation_hooks:
+            return self.hooks, self.reversed_hooks
+        hooks = (*self.api_and_client_hooks, *invocation_hooks, *self.provider_hooks)
+        return hooks, hooks[::-1]
+
+    def get_hook_chain(
+        self, flag_type: FlagType, invocation_hooks: Sequence[Hook] | None = None
+    ) -> _HookChain:
+        """
+        Returns the hooks to run for a flag type. The chain is cached per flag
+        type, and per invocation hooks for the last few ones used.
+        """
+        if invocation_hooks:
+            key = (flag_type, *map(id, invocation_hooks))
+            cached = self.invocation_hook_chains.get(key)
+            if cached is not None:
+                return cached[1]
+            hooks, _ = self.get_ordered_hooks(invocation_hooks)
+            invocation_chain = _HookChain.build(flag_type, hooks)
+            if len(self.invocation_hook_chains) >= _MAX_INVOCATION_HOOK_CHAINS:
+                # hooks created for every evaluation would fill it up otherwise
+                self.invocation_hook_chains.clear()
+            self.invocation_hook_chains[key] = (
+                tuple(invocation_hooks),
+                invocation_chain,
+            )
+            return invocation_chain
+        chain = self.hook_chains.get(flag_type)
+        if chain is None:
+            chain = self.hook_chains[flag_type] = _HookChain.build(
+                flag_type, self.hooks
+            )
+        return chain
+
+
+@dataclass(frozen=True)
+class _ContextPrefix:
+    """
+    The API, transaction and client evaluation contexts merged together, along
+    with what they were merged from. The merged attributes are a copy, which is
+    never handed out: every evaluation gets its own copy of them. Prefixes are
+    kept per transaction context, which they hold on to, so that its identity
+    cannot be reused.
+    """
+
+    api_version: int
+    api_context: EvaluationContext
+    transaction_version: int
+    # None when the transaction context was empty
+    transaction_context: EvaluationContext | None
+    client_context: EvaluationContext
+    context: EvaluationContext
+
+
+class _CacheSlot(typing.NamedTuple):
+    """Where to store an evaluation that was not found in the scope or the cache."""
+
+    key: CacheKey
+    # the generation of the cache when it was looked up, None if it was not
+    generation: int | None
+
+
+class _BulkEvaluations(typing.NamedTuple):
+    """The flags of a batch, before their before hooks ran."""
+
+    hook_hints: HookHints
+    evaluations: list["_BulkEvaluation"]
+    # the error of a provider that is not ready, failing every flag
+    provider_err: OpenFeatureError | None
+    async_only_hooks: tuple[Hook, ...]
+
+
+@dataclass
+class _BulkEvaluation:
+    """The state of a single flag while a batch of flags is being evaluated."""
+
+    request: FlagEvaluationRequest
+    stage_hooks: _StageHooks
+    evaluation_context: EvaluationContext
+    details: FlagEvaluationDetails[FlagValueType] | None = None
+    # set when the evaluation scope or the cache is looked up
+    cache_slot: _CacheSlot | None = None
+
+
 class OpenFeatureClient:
     def __init__(
         self,
@@ -82,17 +354,57 @@ class OpenFeatureClient:
         version: str | None,
         context: EvaluationContext | None = None,
         hooks: list[Hook] | None = None,
+        cache: EvaluationCache | None = None,
+        instrumentation: EvaluationInstrumentation | None = None,
     ) -> None:
         self.domain = domain
         self.version = version
+        self.cache = cache
+        self.instrumentation = instrumentation
+        self._context_prefixes: dict[int, _ContextPrefix] = {}
         self.context = context or EvaluationContext()
-        self.hooks = hooks or []
         self._hooks_lock = threading.RLock()
+        self._hooks_version = 0
+        self._evaluation_plan: _EvaluationPlan | None = None
+        self.hooks = hooks or []
 
     @property
     def provider(self) -> FeatureProvider:
         return provider_registry.get_provider(self.domain)
 
+    @property
+    def context(self) -> EvaluationContext:
+        return self._context
+
+    @context.setter
+    def context(self, context: EvaluationContext) -> None:
+        self._context = context
+        self._context_prefixes = {}
+
+    @property
+    def cache(self) -> EvaluationCache | None:
+        return self._cache
+
+    @cache.setter
+    def cache(self, cache: EvaluationCache | None) -> None:
+        self._cache = cache
+        # the merged context prefix only memoizes its fingerprint for a cache
+        self._context_prefixes = {}
+        if cache is None:
+            _event_support.remove_cached_client(self)
+        else:
+            _event_support.add_cached_client(self)
+
+    @property
+    def hooks(self) -> list[Hook]:
+        return self._hooks
+
+    @hooks.setter
+    def hooks(self, hooks: list[Hook]) -> None:
+        with self._hooks_lock:
+            self._hooks = hooks
+            self._hooks_version += 1
+
     def get_provider_status(self) -> ProviderStatus:
         return provider_registry.get_provider_status(self.provider)
 
@@ -103,6 +415,28 @@ class OpenFeatureClient:
         with self._hooks_lock:
             self.hooks = self.hooks + hooks
 
+    def _get_evaluation_plan(self) -> _EvaluationPlan:
+        # the version is read before the plan is built, so a concurrent change
+        # can only make the plan look outdated, never make an outdated plan current
+        api_hooks = get_hooks()
+        client_hooks = self.hooks
+        version = (
+            get_hooks_version(),
+            id(api_hooks),
+            len(api_hooks),
+            provider_registry.version,
+            self._hooks_version,
+            id(client_hooks),
+            len(client_hooks),
+        )
+        plan = self._evaluation_plan
+        if plan is None or plan.version != version:
+            plan = _EvaluationPlan.build(
+                version, self.provider, self.get_metadata(), client_hooks
+            )
+            self._evaluation_plan = plan
+        return plan
+
     def get_boolean_value(
         self,
         flag_key: str,
@@ -398,77 +732,119 @@ class OpenFeatureClient:
             flag_evaluation_options,
         )
 
-    def _establish_hooks_and_provider(
+    def _establish_hooks_and_provider(  # noqa: PLR0913
         self,
-        flag_type: FlagType,
+        plan: _EvaluationPlan,
+        hook_chain: _HookChain,
         flag_key: str,
         default_value: FlagValueType,
         evaluation_context: EvaluationContext | None,
         flag_evaluation_options: FlagEvaluationOptions | None,
-    ) -> tuple[
-        FeatureProvider,
-        HookHints,
-        list[tuple[Hook, HookContext]],
-        list[tuple[Hook, HookContext]],
-        EvaluationContext,
-    ]:
-        if evaluation_context is None:
-            evaluation_context = EvaluationContext()
-
-        if flag_evaluation_options is None:
-            flag_evaluation_options = FlagEvaluationOptions()
-
-        provider = self.provider  # call this once to maintain a consistent reference
-        evaluation_hooks = flag_evaluation_options.hooks
-        hook_hints = flag_evaluation_options.hook_hints
+        timer: EvaluationTimer | None = None,
+    ) -> tuple[HookHints, _StageHooks, EvaluationContext]:
+        hook_hints: HookHints = (
+            flag_evaluation_options.hook_hints if flag_evaluation_options else {}
+        )
 
         # Merge transaction context into evaluation context before creating hook_context
         # This ensures hooks have access to the complete context including transaction context
-        merged_eval_context = (
-            get_evaluation_context()
-            .merge(get_transaction_context())
-            .merge(self.context)
-            .merge(evaluation_context)
-        )
-
-        client_metadata = self.get_metadata()
-        provider_metadata = provider.get_metadata()
-
-        # Hooks need to be handled in different orders at different stages
-        # in the flag evaluation
-        # before: API, Client, Invocation, Provider
-        merged_hooks_and_context = [
-            (
-                hook,
-                HookContext(
-                    flag_key=flag_key,
-                    flag_type=flag_type,
-                    default_value=default_value,
-                    evaluation_context=merged_eval_context,
-                    client_metadata=client_metadata,
-                    provider_metadata=provider_metadata,
-                    hook_data={},
-                ),
-            )
-            for hook in chain(
-                get_hooks(),
-                self.hooks,
-                evaluation_hooks,
-                provider.get_provider_hooks(),
-            )
-        ]
-        # after, error, finally: Provider, Invocation, Client, API
-        reversed_merged_hooks_and_context = merged_hooks_and_context.copy()
-        reversed_merged_hooks_and_context.reverse()
+        merged_eval_context = self._merge_evaluation_context(evaluation_context)
 
-        return (
-            provider,
-            hook_hints,
-            merged_hooks_and_context,
-            reversed_merged_hooks_and_context,
-            merged_eval_context,
+        core = _HookContextCore(
+            flag_key,
+            hook_chain.flag_type,
+            default_value,
+            plan.client_metadata,
+            plan.provider_metadata,
+        )
+        stage_hooks = hook_chain.bind(
+            [
+                HookContext._from_core(core, merged_eval_context)
+                for _ in hook_chain.hooks
+            ]
         )
 
+        if timer is not None:
+            timer.lap(EvaluationStage.CONTEXT_MERGE)
+
+        return hook_hints, stage_hooks, merged_eval_context
+
+    def _merge_evaluation_context(
+        self, evaluation_context: EvaluationContext | None
+    ) -> EvaluationContext:
+        # Requirement 3.2.3: API.context->transaction.context->client.context->invocation.context
+        prefix = self._get_context_prefix()
+        if evaluation_context is None:
+            # the prefix is shared between evaluations and threads, so hooks and
+            # providers get their own copy of its attributes
+            attributes = prefix.attributes
+            return EvaluationContext(
+                prefix.targeting_key,
+                attributes.copy() if isinstance(attributes, dict) else dict(attributes),
+            )
+
+        # merging copies the attributes of the prefix
+        return prefix.merge(evaluation_context)
+
+    def _get_context_prefix(self) -> EvaluationContext:
+        """
+        Returns the API, transaction and client contexts merged together. The
+        result is cached per transaction context, so that threads and tasks with
+        their own transaction context do not invalidate each other's, and only
+        merged again once the API or transaction context is set, or the client
+        context is assigned. Merging copies the attributes, so changing those of
+        a context in place is only seen once the context is set again.
+        """
+        # versions are read before the contexts, so a concurrent change can only
+        # make the cached prefix look outdated, never make an outdated one current
+        api_version = get_evaluation_context_version()
+        transaction_version = get_transaction_context_version()
+        transaction_context: EvaluationContext | None = get_transaction_context()
+        if transaction_context is not None and (
+            transaction_context.targeting_key is None
+            and not transaction_context.attributes
+        ):
+            # propagators may hand out a new empty context on every call
+            transaction_context = None
+
+        api_context = get_evaluation_context()
+        client_context = self.context
+        prefixes = self._context_prefixes
+        prefix = prefixes.get(id(transaction_context))
+        if (
+            prefix is None
+            or prefix.api_version != api_version
+            or prefix.api_context is not api_context
+            or is_transaction_context_outdated(
+                transaction_context, prefix.transaction_version
+            )
+            or prefix.client_context is not client_context
+        ):
+            context = api_context
+            if transaction_context is not None:
+                context = context.merge(transaction_context)
+            context = context.merge(client_context)
+            if self._cache is not None or get_evaluation_scope() is not None:
+                # memoizes the canonical form of the attributes, which the copies
+                # handed to evaluations share until they are modified
+                context = EvaluationContext(
+                    context.targeting_key, _MemoizedAttributes(context.attributes)
+                )
+                context.fingerprint()
+            prefix = _ContextPrefix(
+                api_version=api_version,
+                api_context=api_context,
+                transaction_version=transaction_version,
+                transaction_context=transaction_context,
+                client_context=client_context,
+                context=context,
+            )
+            if len(prefixes) >= _MAX_CONTEXT_PREFIXES:
+                # contexts set for every request would fill it up otherwise
+                prefixes.clear()
+            prefixes[id(transaction_context)] = prefix
+        return prefix.context
+
     def _assert_provider_status(
         self,
         provider: FeatureProvider,
@@ -482,23 +858,50 @@ class OpenFeatureClient:
 
     def _run_before_hooks_and_update_context(
         self,
-        flag_type: FlagType,
-        merged_hooks_and_context: list[tuple[Hook, HookContext]],
+        before_hooks_and_context: list[tuple[Hook, HookContext]],
         hook_hints: HookHints,
         evaluation_context: EvaluationContext,
+        timer: EvaluationTimer | None = None,
     ) -> EvaluationContext:
         # https://github.com/open-feature/spec/blob/main/specification/sections/03-evaluation-context.md
         # Any resulting evaluation context from a before hook will overwrite
         # duplicate fields defined globally, on the client, or in the invocation.
         # Requirement 3.2.2, 4.3.4: API.context->client.context->invocation.context
-        before_hooks_context = before_hooks(
-            flag_type, merged_hooks_and_context, hook_hints
-        )
+        before_hooks_context = run_before_hooks(before_hooks_and_context, hook_hints)
+        if timer is not None:
+            timer.lap(EvaluationStage.BEFORE_HOOKS)
+
+        if (
+            before_hooks_context.targeting_key is None
+            and not before_hooks_context.attributes
+        ):
+            return evaluation_context
 
         # The hook_context.evaluation_context already contains the merged context from
         # _establish_hooks_and_provider, so we just need to merge with the before hooks result
         return evaluation_context.merge(before_hooks_context)
 
+    async def _run_before_hooks_and_update_context_async(
+        self,
+        before_hooks_and_context: list[tuple[Hook, HookContext]],
+        hook_hints: HookHints,
+        evaluation_context: EvaluationContext,
+        timer: EvaluationTimer | None = None,
+    ) -> EvaluationContext:
+        before_hooks_context = await run_before_hooks_async(
+            before_hooks_and_context, hook_hints
+        )
+        if timer is not None:
+            timer.lap(EvaluationStage.BEFORE_HOOKS)
+
+        if (
+            before_hooks_context.targeting_key is None
+            and not before_hooks_context.attributes
+        ):
+            return evaluation_context
+
+        return evaluation_context.merge(before_hooks_context)
+
     @typing.overload
     async def evaluate_flag_details_async(
         self,
@@ -578,27 +981,38 @@ class OpenFeatureClient:
         :return: a typing.Awaitable[FlagEvaluationDetails] object with the fully evaluated flag from a
         provider
         """
-        (
-            provider,
-            hook_hints,
-            merged_hooks_and_context,
-            reversed_merged_hooks_and_context,
-            merged_eval_context,
-        ) = self._establish_hooks_and_provider(
+        timer = (
+            None
+            if self.instrumentation is None
+            else self.instrumentation.start(self.domain, flag_type, flag_key)
+        )
+        # call this once to maintain a consistent provider reference
+        plan = self._get_evaluation_plan()
+        hook_chain = plan.get_hook_chain(
             flag_type,
-            flag_key,
-            default_value,
-            evaluation_context,
-            flag_evaluation_options,
+            flag_evaluation_options.hooks if flag_evaluation_options else None,
+        )
+        if not hook_chain.hooks:
+            return await self._evaluate_flag_details_without_hooks_async(
+                plan, flag_type, flag_key, default_value, evaluation_context, timer
+            )
+
+        hook_hints, stage_hooks, merged_eval_context = (
+            self._establish_hooks_and_provider(
+                plan,
+                hook_chain,
+                flag_key,
+                default_value,
+                evaluation_context,
+                flag_evaluation_options,
+                timer,
+            )
         )
 
         try:
-            if provider_err := self._assert_provider_status(provider):
-                error_hooks(
-                    flag_type,
-                    provider_err,
-                    reversed_merged_hooks_and_context,
-                    hook_hints,
+            if provider_err := self._assert_provider_status(plan.provider):
+                await _run_error_hooks_async(
+                    provider_err, stage_hooks.error, hook_hints, timer
                 )
                 flag_evaluation = FlagEvaluationDetails(
                     flag_key=flag_key,
@@ -609,71 +1023,47 @@ class OpenFeatureClient:
                 )
                 return flag_evaluation
 
-            merged_context = self._run_before_hooks_and_update_context(
-                flag_type,
-                merged_hooks_and_context,
-                hook_hints,
-                merged_eval_context,
+            merged_context = await self._run_before_hooks_and_update_context_async(
+                stage_hooks.before, hook_hints, merged_eval_context, timer
             )
 
             flag_evaluation = await self._create_provider_evaluation_async(
-                provider,
+                plan,
                 flag_type,
                 flag_key,
                 default_value,
                 merged_context,
+                timer,
             )
             if err := flag_evaluation.get_exception():
-                error_hooks(
-                    flag_type, err, reversed_merged_hooks_and_context, hook_hints
-                )
+                await _run_error_hooks_async(err, stage_hooks.error, hook_hints, timer)
                 return flag_evaluation
 
-            after_hooks(
-                flag_type,
-                flag_evaluation,
-                reversed_merged_hooks_and_context,
-                hook_hints,
-            )
+            await run_after_hooks_async(flag_evaluation, stage_hooks.after, hook_hints)
+            if timer is not None:
+                timer.lap(EvaluationStage.AFTER_HOOKS)
 
             return flag_evaluation
 
-        except OpenFeatureError as err:
-            error_hooks(flag_type, err, reversed_merged_hooks_and_context, hook_hints)
-            flag_evaluation = FlagEvaluationDetails(
-                flag_key=flag_key,
-                value=default_value,
-                reason=Reason.ERROR,
-                error_code=err.error_code,
-                error_message=err.error_message,
-            )
-            return flag_evaluation
         # Catch any type of exception here since the user can provide any exception
         # in the error hooks
-        except Exception as err:  # pragma: no cover
-            logger.exception(
-                "Unable to correctly evaluate flag with key: '%s'", flag_key
-            )
+        except Exception as err:
+            if not isinstance(err, OpenFeatureError):
+                logger.exception(
+                    "Unable to correctly evaluate flag with key: '%s'", flag_key
+                )
 
-            error_hooks(flag_type, err, reversed_merged_hooks_and_context, hook_hints)
+            await _run_error_hooks_async(err, stage_hooks.error, hook_hints, timer)
 
-            error_message = getattr(err, "error_message", str(err))
-            flag_evaluation = FlagEvaluationDetails(
-                flag_key=flag_key,
-                value=default_value,
-                reason=Reason.ERROR,
-                error_code=ErrorCode.GENERAL,
-                error_message=error_message,
-            )
+            flag_evaluation = _create_error_details(flag_key, default_value, err)
             return flag_evaluation
 
         finally:
-            after_all_hooks(
-                flag_type,
-                flag_evaluation,
-                reversed_merged_hooks_and_context,
-                hook_hints,
+            await run_after_all_hooks_async(
+                flag_evaluation, stage_hooks.finally_after, hook_hints
             )
+            if timer is not None:
+                timer.stop(EvaluationStage.FINALLY_HOOKS)
 
     @typing.overload
     def evaluate_flag_details(
@@ -754,28 +1144,39 @@ class OpenFeatureClient:
         :return: a FlagEvaluationDetails object with the fully evaluated flag from a
         provider
         """
-        (
-            provider,
-            hook_hints,
-            merged_hooks_and_context,
-            reversed_merged_hooks_and_context,
-            merged_eval_context,
-        ) = self._establish_hooks_and_provider(
+        timer = (
+            None
+            if self.instrumentation is None
+            else self.instrumentation.start(self.domain, flag_type, flag_key)
+        )
+        # call this once to maintain a consistent provider reference
+        plan = self._get_evaluation_plan()
+        hook_chain = plan.get_hook_chain(
             flag_type,
-            flag_key,
-            default_value,
-            evaluation_context,
-            flag_evaluation_options,
+            flag_evaluation_options.hooks if flag_evaluation_options else None,
+        )
+        if not hook_chain.hooks:
+            return self._evaluate_flag_details_without_hooks(
+                plan, flag_type, flag_key, default_value, evaluation_context, timer
+            )
+        if hook_chain.async_only:
+            warn_async_only_stages(hook_chain.async_only)
+
+        hook_hints, stage_hooks, merged_eval_context = (
+            self._establish_hooks_and_provider(
+                plan,
+                hook_chain,
+                flag_key,
+                default_value,
+                evaluation_context,
+                flag_evaluation_options,
+                timer,
+            )
         )
 
         try:
-            if provider_err := self._assert_provider_status(provider):
-                error_hooks(
-                    flag_type,
-                    provider_err,
-                    reversed_merged_hooks_and_context,
-                    hook_hints,
-                )
+            if provider_err := self._assert_provider_status(plan.provider):
+                _run_error_hooks(provider_err, stage_hooks.error, hook_hints, timer)
                 flag_evaluation = FlagEvaluationDetails(
                     flag_key=flag_key,
                     value=default_value,
@@ -786,89 +1187,129 @@ class OpenFeatureClient:
                 return flag_evaluation
 
             merged_context = self._run_before_hooks_and_update_context(
-                flag_type,
-                merged_hooks_and_context,
-                hook_hints,
-                merged_eval_context,
+                stage_hooks.before, hook_hints, merged_eval_context, timer
             )
 
             flag_evaluation = self._create_provider_evaluation(
-                provider,
+                plan,
                 flag_type,
                 flag_key,
                 default_value,
                 merged_context,
+                timer,
             )
             if err := flag_evaluation.get_exception():
-                error_hooks(
-                    flag_type, err, reversed_merged_hooks_and_context, hook_hints
-                )
+                _run_error_hooks(err, stage_hooks.error, hook_hints, timer)
                 flag_evaluation.value = default_value
                 return flag_evaluation
 
-            after_hooks(
-                flag_type,
-                flag_evaluation,
-                reversed_merged_hooks_and_context,
-                hook_hints,
-            )
+            run_after_hooks(flag_evaluation, stage_hooks.after, hook_hints)
+            if timer is not None:
+                timer.lap(EvaluationStage.AFTER_HOOKS)
 
             return flag_evaluation
 
-        except OpenFeatureError as err:
-            error_hooks(flag_type, err, reversed_merged_hooks_and_context, hook_hints)
-
-            flag_evaluation = FlagEvaluationDetails(
-                flag_key=flag_key,
-                value=default_value,
-                reason=Reason.ERROR,
-                error_code=err.error_code,
-                error_message=err.error_message,
-            )
-            return flag_evaluation
         # Catch any type of exception here since the user can provide any exception
         # in the error hooks
-        except Exception as err:  # pragma: no cover
-            logger.exception(
-                "Unable to correctly evaluate flag with key: '%s'", flag_key
-            )
+        except Exception as err:
+            if not isinstance(err, OpenFeatureError):
+                logger.exception(
+                    "Unable to correctly evaluate flag with key: '%s'", flag_key
+                )
 
-            error_hooks(flag_type, err, reversed_merged_hooks_and_context, hook_hints)
+            _run_error_hooks(err, stage_hooks.error, hook_hints, timer)
 
-            error_message = getattr(err, "error_message", str(err))
-            flag_evaluation = FlagEvaluationDetails(
-                flag_key=flag_key,
-                value=default_value,
-                reason=Reason.ERROR,
-                error_code=ErrorCode.GENERAL,
-                error_message=error_message,
-            )
+            flag_evaluation = _create_error_details(flag_key, default_value, err)
             return flag_evaluation
 
         finally:
-            after_all_hooks(
-                flag_type,
-                flag_evaluation,
-                reversed_merged_hooks_and_context,
-                hook_hints,
+            run_after_all_hooks(flag_evaluation, stage_hooks.finally_after, hook_hints)
+            if timer is not None:
+                timer.stop(EvaluationStage.FINALLY_HOOKS)
+
+    async def _evaluate_flag_details_without_hooks_async(
+        self,
+        plan: _EvaluationPlan,
+        flag_type: FlagType,
+        flag_key: str,
+        default_value: FlagValueType,
+        evaluation_context: EvaluationContext | None,
+        timer: EvaluationTimer | None = None,
+    ) -> FlagEvaluationDetails[FlagValueType]:
+        """
+        Fast path of evaluate_flag_details_async when there are no API, client,
+        invocation or provider hooks: no hook contexts are created and no hook
+        stage is run, but errors are reported exactly like the regular path.
+        """
+        try:
+            if provider_err := self._assert_provider_status(plan.provider):
+                return _create_error_details(flag_key, default_value, provider_err)
+
+            merged_context = self._merge_evaluation_context(evaluation_context)
+            if timer is not None:
+                timer.lap(EvaluationStage.CONTEXT_MERGE)
+
+            return await self._create_provider_evaluation_async(
+                plan, flag_type, flag_key, default_value, merged_context, timer
+            )
+        except Exception as err:
+            if not isinstance(err, OpenFeatureError):
+                logger.exception(
+                    "Unable to correctly evaluate flag with key: '%s'", flag_key
+                )
+            return _create_error_details(flag_key, default_value, err)
+        finally:
+            if timer is not None:
+                timer.stop()
+
+    def _evaluate_flag_details_without_hooks(
+        self,
+        plan: _EvaluationPlan,
+        flag_type: FlagType,
+        flag_key: str,
+        default_value: FlagValueType,
+        evaluation_context: EvaluationContext | None,
+        timer: EvaluationTimer | None = None,
+    ) -> FlagEvaluationDetails[FlagValueType]:
+        """
+        Fast path of evaluate_flag_details when there are no API, client,
+        invocation or provider hooks: no hook contexts are created and no hook
+        stage is run, but errors are reported exactly like the regular path.
+        """
+        try:
+            if provider_err := self._assert_provider_status(plan.provider):
+                return _create_error_details(flag_key, default_value, provider_err)
+
+            merged_context = self._merge_evaluation_context(evaluation_context)
+            if timer is not None:
+                timer.lap(EvaluationStage.CONTEXT_MERGE)
+
+            flag_evaluation = self._create_provider_evaluation(
+                plan, flag_type, flag_key, default_value, merged_context, timer
             )
+            if flag_evaluation.error_code:
+                flag_evaluation.value = default_value
+            return flag_evaluation
+        except Exception as err:
+            if not isinstance(err, OpenFeatureError):
+                logger.exception(
+                    "Unable to correctly evaluate flag with key: '%s'", flag_key
+                )
+            return _create_error_details(flag_key, default_value, err)
+        finally:
+            if timer is not None:
+                timer.stop()
 
     async def _create_provider_evaluation_async(
         self,
-        provider: FeatureProvider,
+        plan: _EvaluationPlan,
         flag_type: FlagType,
         flag_key: str,
         default_value: FlagValueType,
         evaluation_context: EvaluationContext | None = None,
+        timer: EvaluationTimer | None = None,
     ) -> FlagEvaluationDetails[FlagValueType]:
-        get_details_callables_async: Mapping[FlagType, ResolveDetailsCallableAsync] = {
-            FlagType.BOOLEAN: provider.resolve_boolean_details_async,
-            FlagType.INTEGER: provider.resolve_integer_details_async,
-            FlagType.FLOAT: provider.resolve_float_details_async,
-            FlagType.OBJECT: provider.resolve_object_details_async,
-            FlagType.STRING: provider.resolve_string_details_async,
-        }
-        get_details_callable = get_details_callables_async.get(flag_type)
+        get_details_callable = plan.async_resolvers.get(flag_type)
         if not get_details_callable:
             return FlagEvaluationDetails(
                 flag_key=flag_key,
@@ -878,53 +1319,51 @@ class OpenFeatureClient:
                 error_message="Unknown flag type",
             )
 
+        cache_slot, cached = self._get_cached_evaluation(
+            plan, flag_type, flag_key, evaluation_context
+        )
+        if cached is not None:
+            if timer is not None:
+                timer.lap(EvaluationStage.RESOLVE)
+            return cached
+
         resolution = await get_details_callable(
             flag_key=flag_key,
             default_value=default_value,
             evaluation_context=evaluation_context,
         )
-        if resolution.error_code:
-            return resolution.to_flag_evaluation_details(flag_key)
-
-        # we need to check the get_args to be compatible with union types.
-        if err := _typecheck_flag_value(value=resolution.value, flag_type=flag_type):
-            return FlagEvaluationDetails(
-                flag_key=flag_key,
-                value=resolution.value,
-                reason=Reason.ERROR,
-                error_code=err.error_code,
-                error_message=err.error_message,
-            )
-
-        return resolution.to_flag_evaluation_details(flag_key)
+        if timer is not None:
+            timer.lap(EvaluationStage.RESOLVE)
+        flag_evaluation = _resolution_to_details(flag_key, flag_type, resolution)
+        if timer is not None:
+            timer.lap(EvaluationStage.TYPE_CHECK)
+        if cache_slot is not None:
+            self._store_evaluation(plan, cache_slot, flag_evaluation)
+        return flag_evaluation
 
     def _create_provider_evaluation(
         self,
-        provider: FeatureProvider,
+        plan: _EvaluationPlan,
         flag_type: FlagType,
         flag_key: str,
         default_value: FlagValueType,
         evaluation_context: EvaluationContext | None = None,
+        timer: EvaluationTimer | None = None,
     ) -> FlagEvaluationDetails[FlagValueType]:
         """
         Encapsulated method to create a FlagEvaluationDetail from a specific provider.
 
+        :param plan: the evaluation plan holding the provider's resolvers
         :param flag_type: the type of the flag being returned
         :param key: the string key of the selected flag
         :param default_value: backup value returned if no result found by the provider
         :param evaluation_context: Information for the purposes of flag evaluation
+        :param timer: measures the resolve and type check stages, if the client is
+        instrumented
         :return: a FlagEvaluationDetails object with the fully evaluated flag from a
         provider
         """
-        get_details_callables: Mapping[FlagType, ResolveDetailsCallable] = {
-            FlagType.BOOLEAN: provider.resolve_boolean_details,
-            FlagType.INTEGER: provider.resolve_integer_details,
-            FlagType.FLOAT: provider.resolve_float_details,
-            FlagType.OBJECT: provider.resolve_object_details,
-            FlagType.STRING: provider.resolve_string_details,
-        }
-
-        get_details_callable = get_details_callables.get(flag_type)
+        get_details_callable = plan.resolvers.get(flag_type)
         if not get_details_callable:
             return FlagEvaluationDetails(
                 flag_key=flag_key,
@@ -934,25 +1373,397 @@ class OpenFeatureClient:
                 error_message="Unknown flag type",
             )
 
+        cache_slot, cached = self._get_cached_evaluation(
+            plan, flag_type, flag_key, evaluation_context
+        )
+        if cached is not None:
+            if timer is not None:
+                timer.lap(EvaluationStage.RESOLVE)
+            return cached
+
         resolution = get_details_callable(
             flag_key=flag_key,
             default_value=default_value,
             evaluation_context=evaluation_context,
         )
-        if resolution.error_code:
-            return resolution.to_flag_evaluation_details(flag_key)
+        if timer is not None:
+            timer.lap(EvaluationStage.RESOLVE)
+        flag_evaluation = _resolution_to_details(flag_key, flag_type, resolution)
+        if timer is not None:
+            timer.lap(EvaluationStage.TYPE_CHECK)
+        if cache_slot is not None:
+            self._store_evaluation(plan, cache_slot, flag_evaluation)
+        return flag_evaluation
+
+    def _get_cached_evaluation(
+        self,
+        plan: _EvaluationPlan,
+        flag_type: FlagType,
+        flag_key: str,
+        evaluation_context: EvaluationContext | None,
+    ) -> tuple[_CacheSlot | None, FlagEvaluationDetails[FlagValueType] | None]:
+        """
+        Looks the evaluation up in the current evaluation scope, then in the
+        client's cache. The slot to store the evaluation in is None when there
+        is neither.
+        """
+        scope = get_evaluation_scope()
+        cache = self._cache
+        if scope is None and cache is None:
+            return None, None
 
-        # we need to check the get_args to be compatible with union types.
-        if err := _typecheck_flag_value(value=resolution.value, flag_type=flag_type):
-            return FlagEvaluationDetails(
-                flag_key=flag_key,
-                value=resolution.value,
-                reason=Reason.ERROR,
-                error_code=err.error_code,
-                error_message=err.error_message,
+        if evaluation_context is None:
+            evaluation_context = EvaluationContext()
+        cache_key = (self.domain, flag_key, flag_type, evaluation_context.fingerprint())
+        cached = None
+        generation = None
+        if scope is not None:
+            cached = scope.get(cache_key)
+        if cached is None and cache is not None:
+            # read before the lookup, so that an invalidation happening while the
+            # flag is resolved keeps the result out of the cache
+            generation = cache.get_generation()
+            cached = cache.get(cache_key, plan.provider)
+            if cached is not None and scope is not None:
+                scope.set(cache_key, cached)
+        return _CacheSlot(cache_key, generation), cached
+
+    def _store_evaluation(
+        self,
+        plan: _EvaluationPlan,
+        cache_slot: _CacheSlot,
+        flag_evaluation: FlagEvaluationDetails[FlagValueType],
+    ) -> None:
+        cache_key, generation = cache_slot
+        if (scope := get_evaluation_scope()) is not None:
+            scope.set(cache_key, flag_evaluation)
+        if (cache := self._cache) is not None:
+            cache.set(cache_key, plan.provider, flag_evaluation, generation)
+
+    def evaluate_many(
+        self,
+        flags: Sequence[FlagEvaluationRequest | tuple[str, FlagType, FlagValueType]],
+        evaluation_context: EvaluationContext | None = None,
+        flag_evaluation_options: FlagEvaluationOptions | None = None,
+    ) -> dict[str, FlagEvaluationDetails[FlagValueType]]:
+        """
+        Evaluate several flags against the same evaluation context.
+
+        The evaluation context is merged and the provider status is checked once
+        for the whole batch, while the hook stages still run for every flag.
+        Flags whose before hooks leave the context untouched are resolved with a
+        single call to the provider's resolve_bulk_details, apart from those
+        found in the evaluation scope or the client's cache.
+
+        :param flags: the key, type and default value of every flag to evaluate
+        :param evaluation_context: Information for the purposes of flag evaluation
+        :param flag_evaluation_options: Additional flag evaluation information
+        :return: the FlagEvaluationDetails of every flag, keyed by flag key
+        :raises GeneralError: if several flags share the same key
+        """
+        plan = self._get_evaluation_plan()
+        hook_hints, evaluations = self._start_bulk_evaluation(
+            plan, flags, evaluation_context, flag_evaluation_options
+        )
+        store = functools.partial(self._store_evaluation, plan)
+        for merged_context, group in _group_by_context(evaluations):
+            pending, cached = self._get_cached_evaluations(plan, group, merged_context)
+            for evaluation, details in cached:
+                _complete_bulk_evaluation(evaluation, details, hook_hints)
+            if not pending:
+                continue
+            requests = [evaluation.request for evaluation in pending]
+            try:
+                resolutions = _resolve_bulk_details(
+                    plan.provider, requests, merged_context
+                )
+            except Exception as err:
+                for evaluation in pending:
+                    _fail_bulk_evaluation(evaluation, err, hook_hints)
+                continue
+            _complete_bulk_evaluations(pending, resolutions, hook_hints, store)
+
+        return _finish_bulk_evaluation(evaluations, hook_hints)
+
+    async def evaluate_many_async(
+        self,
+        flags: Sequence[FlagEvaluationRequest | tuple[str, FlagType, FlagValueType]],
+        evaluation_context: EvaluationContext | None = None,
+        flag_evaluation_options: FlagEvaluationOptions | None = None,
+    ) -> dict[str, FlagEvaluationDetails[FlagValueType]]:
+        """
+        Evaluate several flags against the same evaluation context.
+
+        The async twin of evaluate_many, resolving through the provider's
+        resolve_bulk_details_async and awaiting the asynchronous stages of
+        AsyncHook instances.
+
+        :param flags: the key, type and default value of every flag to evaluate
+        :param evaluation_context: Information for the purposes of flag evaluation
+        :param flag_evaluation_options: Additional flag evaluation information
+        :return: the FlagEvaluationDetails of every flag, keyed by flag key
+        :raises GeneralError: if several flags share the same key
+        """
+        plan = self._get_evaluation_plan()
+        hook_hints, evaluations = await self._start_bulk_evaluation_async(
+            plan, flags, evaluation_context, flag_evaluation_options
+        )
+        store = functools.partial(self._store_evaluation, plan)
+        for merged_context, group in _group_by_context(evaluations):
+            pending, cached = self._get_cached_evaluations(plan, group, merged_context)
+            for evaluation, details in cached:
+                await _complete_bulk_evaluation_async(evaluation, details, hook_hints)
+            if not pending:
+                continue
+            requests = [evaluation.request for evaluation in pending]
+            try:
+                resolutions = await _resolve_bulk_details_async(
+                    plan.provider, requests, merged_context
+                )
+            except Exception as err:
+                for evaluation in pending:
+                    await _fail_bulk_evaluation_async(evaluation, err, hook_hints)
+                continue
+            await _complete_bulk_evaluations_async(
+                pending, resolutions, hook_hints, store
             )
 
-        return resolution.to_flag_evaluation_details(flag_key)
+        return await _finish_bulk_evaluation_async(evaluations, hook_hints)
+
+    async def evaluate_many_concurrently_async(
+        self,
+        flags: Sequence[FlagEvaluationRequest | tuple[str, FlagType, FlagValueType]],
+        evaluation_context: EvaluationContext | None = None,
+        flag_evaluation_options: FlagEvaluationOptions | None = None,
+        *,
+        max_concurrency: int = 10,
+        timeout: float | None = None,
+    ) -> dict[str, FlagEvaluationDetails[FlagValueType]]:
+        """
+        Evaluate several flags against the same evaluation context, resolving them
+        concurrently with the provider's resolve_*_details_async methods.
+
+        Like evaluate_many_async, the evaluation context is merged and the provider
+        status is checked once, and the hook stages run for every flag. A flag
+        whose resolution fails does not affect the others. Resolutions still
+        running once the timeout expires, or when the caller is cancelled, are
+        cancelled, and their flags report the default value with an error. The
+        error and finally stages of every flag run before the cancellation of
+        the caller propagates.
+
+        :param flags: the key, type and default value of every flag to evaluate
+        :param evaluation_context: Information for the purposes of flag evaluation
+        :param flag_evaluation_options: Additional flag evaluation information
+        :param max_concurrency: the maximum number of resolutions running at once
+        :param timeout: the number of seconds to wait for the resolutions, or None
+        to wait until all of them are done
+        :return: the FlagEvaluationDetails of every flag, keyed by flag key
+        :raises GeneralError: if several flags share the same key
+        """
+        if max_concurrency < 1:
+            raise GeneralError(error_message="max_concurrency must be at least 1")
+
+        plan = self._get_evaluation_plan()
+        hook_hints, evaluations = await self._start_bulk_evaluation_async(
+            plan, flags, evaluation_context, flag_evaluation_options
+        )
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def resolve(
+            evaluation: _BulkEvaluation,
+        ) -> FlagEvaluationDetails[FlagValueType]:
+            flag_key, flag_type, default_value = evaluation.request
+            async with semaphore:
+                return await self._create_provider_evaluation_async(
+                    plan,
+                    flag_type,
+                    flag_key,
+                    default_value,
+                    evaluation.evaluation_context,
+                )
+
+        tasks = {
+            asyncio.ensure_future(resolve(evaluation)): evaluation
+            for evaluation in evaluations
+            if evaluation.details is None
+        }
+        cancellation = await _wait_for_resolutions(tasks, timeout) if tasks else None
+
+        for task, evaluation in tasks.items():
+            if not task.done() or task.cancelled():
+                await _fail_bulk_evaluation_async(
+                    evaluation,
+                    GeneralError(
+                        error_message="Flag evaluation did not complete in time"
+                    ),
+                    hook_hints,
+                )
+            elif err := task.exception():
+                await _fail_bulk_evaluation_async(
+                    evaluation, typing.cast("Exception", err), hook_hints
+                )
+            else:
+                await _complete_bulk_evaluation_async(
+                    evaluation, task.result(), hook_hints
+                )
+
+        results = await _finish_bulk_evaluation_async(evaluations, hook_hints)
+        if cancellation is not None:
+            raise cancellation
+        return results
+
+    def _get_cached_evaluations(
+        self,
+        plan: _EvaluationPlan,
+        evaluations: list[_BulkEvaluation],
+        evaluation_context: EvaluationContext,
+    ) -> tuple[
+        list[_BulkEvaluation],
+        list[tuple[_BulkEvaluation, FlagEvaluationDetails[FlagValueType]]],
+    ]:
+        """
+        Looks the evaluations up in the evaluation scope and the cache, and
+        returns the ones left for the provider along with the ones found.
+        """
+        pending = []
+        cached_evaluations = []
+        for evaluation in evaluations:
+            flag_key, flag_type, _ = evaluation.request
+            evaluation.cache_slot, cached = self._get_cached_evaluation(
+                plan, flag_type, flag_key, evaluation_context
+            )
+            if cached is None:
+                pending.append(evaluation)
+            else:
+                cached_evaluations.append((evaluation, cached))
+        return pending, cached_evaluations
+
+    def _create_bulk_evaluations(
+        self,
+        plan: _EvaluationPlan,
+        flags: Sequence[FlagEvaluationRequest | tuple[str, FlagType, FlagValueType]],
+        evaluation_context: EvaluationContext | None,
+        flag_evaluation_options: FlagEvaluationOptions | None,
+    ) -> _BulkEvaluations:
+        """
+        Merge the evaluation context and check the provider status once, and bind
+        the hooks of every flag to their context.
+        """
+        if flag_evaluation_options is None:
+            flag_evaluation_options = FlagEvaluationOptions()
+
+        requests = [FlagEvaluationRequest(*flag) for flag in flags]
+        if len({request.flag_key for request in requests}) != len(requests):
+            raise GeneralError(error_message="Flag keys must be unique in a batch")
+
+        hook_chains: dict[FlagType, _HookChain] = {}
+        merged_eval_context = self._merge_evaluation_context(evaluation_context)
+
+        evaluations = []
+        for request in requests:
+            hook_chain = hook_chains.get(request.flag_type)
+            if hook_chain is None:
+                hook_chain = hook_chains[request.flag_type] = plan.get_hook_chain(
+                    request.flag_type, flag_evaluation_options.hooks
+                )
+            core = _HookContextCore(
+                *request, plan.client_metadata, plan.provider_metadata
+            )
+            evaluations.append(
+                _BulkEvaluation(
+                    request=request,
+                    stage_hooks=hook_chain.bind(
+                        [
+                            HookContext._from_core(core, merged_eval_context)
+                            for _ in hook_chain.hooks
+                        ]
+                    ),
+                    evaluation_context=merged_eval_context,
+                )
+            )
+
+        return _BulkEvaluations(
+            hook_hints=flag_evaluation_options.hook_hints,
+            evaluations=evaluations,
+            provider_err=self._assert_provider_status(plan.provider),
+            async_only_hooks=tuple(
+                hook for chain in hook_chains.values() for hook in chain.async_only
+            ),
+        )
+
+    def _start_bulk_evaluation(
+        self,
+        plan: _EvaluationPlan,
+        flags: Sequence[FlagEvaluationRequest | tuple[str, FlagType, FlagValueType]],
+        evaluation_context: EvaluationContext | None,
+        flag_evaluation_options: FlagEvaluationOptions | None,
+    ) -> tuple[HookHints, list[_BulkEvaluation]]:
+        """Create the evaluations of a batch, then run the before hooks of every flag."""
+        hook_hints, evaluations, provider_err, async_only_hooks = (
+            self._create_bulk_evaluations(
+                plan, flags, evaluation_context, flag_evaluation_options
+            )
+        )
+        if async_only_hooks:
+            warn_async_only_stages(async_only_hooks)
+        for evaluation in evaluations:
+            if provider_err:
+                _fail_bulk_evaluation(evaluation, provider_err, hook_hints)
+                continue
+            try:
+                evaluation.evaluation_context = (
+                    self._run_before_hooks_and_update_context(
+                        evaluation.stage_hooks.before,
+                        hook_hints,
+                        evaluation.evaluation_context,
+                    )
+                )
+            except Exception as err:
+                _fail_bulk_evaluation(evaluation, err, hook_hints)
+
+        return hook_hints, evaluations
+
+    async def _start_bulk_evaluation_async(
+        self,
+        plan: _EvaluationPlan,
+        flags: Sequence[FlagEvaluationRequest | tuple[str, FlagType, FlagValueType]],
+        evaluation_context: EvaluationContext | None,
+        flag_evaluation_options: FlagEvaluationOptions | None,
+    ) -> tuple[HookHints, list[_BulkEvaluation]]:
+        """The async twin of _start_bulk_evaluation."""
+        hook_hints, evaluations, provider_err, _ = self._create_bulk_evaluations(
+            plan, flags, evaluation_context, flag_evaluation_options
+        )
+        for evaluation in evaluations:
+            if provider_err:
+                await _fail_bulk_evaluation_async(evaluation, provider_err, hook_hints)
+                continue
+            try:
+                evaluation.evaluation_context = (
+                    await self._run_before_hooks_and_update_context_async(
+                        evaluation.stage_hooks.before,
+                        hook_hints,
+                        evaluation.evaluation_context,
+                    )
+                )
+            except Exception as err:
+                await _fail_bulk_evaluation_async(evaluation, err, hook_hints)
+
+        return hook_hints, evaluations
+
+    def flag_handle(
+        self, flag_key: str, flag_type: FlagType, default_value: T
+    ) -> "FlagHandle[T]":
+        """
+        Returns a handle bound to a single flag of this client, for code paths
+        evaluating the same flag over and over.
+
+        :param flag_key: the string key of the flag
+        :param flag_type: the type of the flag
+        :param default_value: backup value returned if no result found by the provider
+        :return: a FlagHandle evaluating the flag with this client
+        """
+        return FlagHandle(self, flag_key, flag_type, default_value)
 
     def add_handler(self, event: ProviderEvent, handler: EventHandler) -> None:
         _event_support.add_client_handler(self, event, handler)
@@ -974,31 +1785,426 @@ class OpenFeatureClient:
         :param tracking_event_details: Optional data relevant to the tracking event
         """
 
-        if evaluation_context is None:
-            evaluation_context = EvaluationContext()
-
-        merged_eval_context = (
-            get_evaluation_context()
-            .merge(get_transaction_context())
-            .merge(self.context)
-            .merge(evaluation_context)
-        )
+        merged_eval_context = self._merge_evaluation_context(evaluation_context)
         self.provider.track(
             tracking_event_name, merged_eval_context, tracking_event_details
         )
 
 
+class FlagHandle(typing.Generic[T]):
+    """
+    A single flag bound to a client. Evaluating through a handle skips the
+    dispatch of the typed client methods: the handle reuses the client's
+    evaluation plan while neither the hooks nor the provider of the domain
+    changed, which it checks with a comparison of version counters, and takes
+    the hook-free path straight to the provider whenever there are no hooks.
+    """
+
+    def __init__(
+        self,
+        client: OpenFeatureClient,
+        flag_key: str,
+        flag_type: FlagType,
+        default_value: T,
+    ) -> None:
+        self.client = client
+        self.flag_key = flag_key
+        self.flag_type = flag_type
+        self.default_value: T = default_value
+
+    def value(
+        self,
+        evaluation_context: EvaluationContext | None = None,
+        flag_evaluation_options: FlagEvaluationOptions | None = None,
+    ) -> T:
+        return self.details(evaluation_context, flag_evaluation_options).value
+
+    async def value_async(
+        self,
+        evaluation_context: EvaluationContext | None = None,
+        flag_evaluation_options: FlagEvaluationOptions | None = None,
+    ) -> T:
+        details = await self.details_async(evaluation_context, flag_evaluation_options)
+        return details.value
+
+    def details(
+        self,
+        evaluation_context: EvaluationContext | None = None,
+        flag_evaluation_options: FlagEvaluationOptions | None = None,
+    ) -> FlagEvaluationDetails[T]:
+        client = self.client
+        plan = client._get_evaluation_plan()
+        details: FlagEvaluationDetails[FlagValueType]
+        if (
+            plan.get_hook_chain(self.flag_type).hooks
+            or (flag_evaluation_options and flag_evaluation_options.hooks)
+            or client.instrumentation is not None
+        ):
+            details = client.evaluate_flag_details(
+                self.flag_type,
+                self.flag_key,
+                self.default_value,
+                evaluation_context,
+                flag_evaluation_options,
+            )
+        else:
+            details = client._evaluate_flag_details_without_hooks(
+                plan,
+                self.flag_type,
+                self.flag_key,
+                self.default_value,
+                evaluation_context,
+            )
+        return typing.cast("FlagEvaluationDetails[T]", details)
+
+    async def details_async(
+        self,
+        evaluation_context: EvaluationContext | None = None,
+        flag_evaluation_options: FlagEvaluationOptions | None = None,
+    ) -> FlagEvaluationDetails[T]:
+        client = self.client
+        plan = client._get_evaluation_plan()
+        details: FlagEvaluationDetails[FlagValueType]
+        if (
+            plan.get_hook_chain(self.flag_type).hooks
+            or (flag_evaluation_options and flag_evaluation_options.hooks)
+            or client.instrumentation is not None
+        ):
+            details = await client.evaluate_flag_details_async(
+                self.flag_type,
+                self.flag_key,
+                self.default_value,
+                evaluation_context,
+                flag_evaluation_options,
+            )
+        else:
+            details = await client._evaluate_flag_details_without_hooks_async(
+                plan,
+                self.flag_type,
+                self.flag_key,
+                self.default_value,
+                evaluation_context,
+            )
+        return typing.cast("FlagEvaluationDetails[T]", details)
+
+
+def _group_by_context(
+    evaluations: list[_BulkEvaluation],
+) -> list[tuple[EvaluationContext, list[_BulkEvaluation]]]:
+    """
+    Group the evaluations still waiting for the provider by evaluation context, so
+    flags whose before hooks left the context untouched share one provider call.
+    """
+    groups: dict[int, tuple[EvaluationContext, list[_BulkEvaluation]]] = {}
+    for evaluation in evaluations:
+        if evaluation.details is not None:
+            continue
+        context = evaluation.evaluation_context
+        groups.setdefault(id(context), (context, []))[1].append(evaluation)
+    return list(groups.values())
+
+
+def _resolve_bulk_details(
+    provider: FeatureProvider,
+    flags: Sequence[FlagEvaluationRequest],
+    evaluation_context: EvaluationContext,
+) -> Mapping[str, FlagResolutionDetails[FlagValueType]]:
+    resolve_bulk_details = getattr(provider, "resolve_bulk_details", None)
+    if resolve_bulk_details is None:
+        # resolve_bulk_details is not part of the FeatureProvider protocol, so
+        # providers not extending AbstractProvider get its one-by-one implementation
+        return AbstractProvider.resolve_bulk_details(
+            typing.cast("AbstractProvider", provider), flags, evaluation_context
+        )
+    return typing.cast(
+        "Mapping[str, FlagResolutionDetails[FlagValueType]]",
+        resolve_bulk_details(flags, evaluation_context),
+    )
+
+
+async def _resolve_bulk_details_async(
+    provider: FeatureProvider,
+    flags: Sequence[FlagEvaluationRequest],
+    evaluation_context: EvaluationContext,
+) -> Mapping[str, FlagResolutionDetails[FlagValueType]]:
+    resolve_bulk_details_async = getattr(provider, "resolve_bulk_details_async", None)
+    if resolve_bulk_details_async is None:
+        # resolve_bulk_details_async is not part of the FeatureProvider protocol, so
+        # providers not extending AbstractProvider get its one-by-one implementation
+        return await AbstractProvider.resolve_bulk_details_async(
+            typing.cast("AbstractProvider", provider), flags, evaluation_context
+        )
+    return typing.cast(
+        "Mapping[str, FlagResolutionDetails[FlagValueType]]",
+        await resolve_bulk_details_async(flags, evaluation_context),
+    )
+
+
+async def _wait_for_resolutions(
+    tasks: Collection[asyncio.Future[typing.Any]], timeout: float | None
+) -> asyncio.CancelledError | None:
+    """
+    Waits for the resolutions until the timeout expires, then cancels the ones
+    still running. When the caller itself is cancelled, the resolutions are
+    cancelled as well and the cancellation is returned, to be raised once every
+    flag went through its error and finally stages.
+    """
+    cancellation = None
+    try:
+        await asyncio.wait(tasks, timeout=timeout)
+    except asyncio.CancelledError as e:
+        cancellation = e
+    unfinished = [task for task in tasks if not task.done()]
+    for task in unfinished:
+        task.cancel()
+    if unfinished:
+        # resolutions ignoring their cancellation are left behind
+        try:
+            await asyncio.wait(unfinished, timeout=_CANCELLATION_TIMEOUT)
+        except asyncio.CancelledError as e:
+            cancellation = e
+    return cancellation
+
+
+def _fail_bulk_evaluation(
+    evaluation: _BulkEvaluation, err: Exception, hook_hints: HookHints
+) -> None:
+    _log_bulk_error(evaluation, err)
+    run_error_hooks(err, evaluation.stage_hooks.error, hook_hints)
+    evaluation.details = _create_error_details(
+        evaluation.request.flag_key, evaluation.request.default_value, err
+    )
+
+
+async def _fail_bulk_evaluation_async(
+    evaluation: _BulkEvaluation, err: Exception, hook_hints: HookHints
+) -> None:
+    _log_bulk_error(evaluation, err)
+    await run_error_hooks_async(err, evaluation.stage_hooks.error, hook_hints)
+    evaluation.details = _create_error_details(
+        evaluation.request.flag_key, evaluation.request.default_value, err
+    )
+
+
+def _log_bulk_error(evaluation: _BulkEvaluation, err: Exception) -> None:
+    if not isinstance(err, OpenFeatureError):
+        logger.error(
+            "Unable to correctly evaluate flag with key: '%s'",
+            evaluation.request.flag_key,
+            exc_info=err,
+        )
+
+
+def _complete_bulk_evaluations(
+    evaluations: list[_BulkEvaluation],
+    resolutions: Mapping[str, FlagResolutionDetails[FlagValueType]],
+    hook_hints: HookHints,
+    store: Callable[[_CacheSlot, FlagEvaluationDetails[FlagValueType]], None],
+) -> None:
+    for evaluation in evaluations:
+        try:
+            details = _bulk_resolution_to_details(evaluation, resolutions)
+        except Exception as err:
+            _fail_bulk_evaluation(evaluation, err, hook_hints)
+            continue
+
+        if evaluation.cache_slot is not None:
+            store(evaluation.cache_slot, details)
+        _complete_bulk_evaluation(evaluation, details, hook_hints)
+
+
+async def _complete_bulk_evaluations_async(
+    evaluations: list[_BulkEvaluation],
+    resolutions: Mapping[str, FlagResolutionDetails[FlagValueType]],
+    hook_hints: HookHints,
+    store: Callable[[_CacheSlot, FlagEvaluationDetails[FlagValueType]], None],
+) -> None:
+    for evaluation in evaluations:
+        try:
+            details = _bulk_resolution_to_details(evaluation, resolutions)
+        except Exception as err:
+            await _fail_bulk_evaluation_async(evaluation, err, hook_hints)
+            continue
+
+        if evaluation.cache_slot is not None:
+            store(evaluation.cache_slot, details)
+        await _complete_bulk_evaluation_async(evaluation, details, hook_hints)
+
+
+def _bulk_resolution_to_details(
+    evaluation: _BulkEvaluation,
+    resolutions: Mapping[str, FlagResolutionDetails[FlagValueType]],
+) -> FlagEvaluationDetails[FlagValueType]:
+    # the result comes from the provider, so it is checked flag by flag
+    flag_key, flag_type, _ = evaluation.request
+    if not isinstance(resolutions, Mapping):
+        raise GeneralError(
+            error_message="Bulk resolution returned "
+            f"{type(resolutions).__name__} instead of a mapping"
+        )
+    resolution = resolutions.get(flag_key)
+    if resolution is None:
+        raise FlagNotFoundError(f"Flag '{flag_key}' missing from bulk resolution")
+    return _resolution_to_details(flag_key, flag_type, resolution)
+
+
+def _complete_bulk_evaluation(
+    evaluation: _BulkEvaluation,
+    details: FlagEvaluationDetails[FlagValueType],
+    hook_hints: HookHints,
+) -> None:
+    if err := details.get_exception():
+        run_error_hooks(err, evaluation.stage_hooks.error, hook_hints)
+        details.value = evaluation.request.default_value
+        evaluation.details = details
+        return
+
+    try:
+        run_after_hooks(details, evaluation.stage_hooks.after, hook_hints)
+    except Exception as err:
+        _fail_bulk_evaluation(evaluation, err, hook_hints)
+        return
+    evaluation.details = details
+
+
+async def _complete_bulk_evaluation_async(
+    evaluation: _BulkEvaluation,
+    details: FlagEvaluationDetails[FlagValueType],
+    hook_hints: HookHints,
+) -> None:
+    if err := details.get_exception():
+        await run_error_hooks_async(err, evaluation.stage_hooks.error, hook_hints)
+        details.value = evaluation.request.default_value
+        evaluation.details = details
+        return
+
+    try:
+        await run_after_hooks_async(details, evaluation.stage_hooks.after, hook_hints)
+    except Exception as err:
+        await _fail_bulk_evaluation_async(evaluation, err, hook_hints)
+        return
+    evaluation.details = details
+
+
+def _finish_bulk_evaluation(
+    evaluations: list[_BulkEvaluation], hook_hints: HookHints
+) -> dict[str, FlagEvaluationDetails[FlagValueType]]:
+    results = {}
+    for evaluation in evaluations:
+        details = typing.cast(
+            "FlagEvaluationDetails[FlagValueType]", evaluation.details
+        )
+        run_after_all_hooks(details, evaluation.stage_hooks.finally_after, hook_hints)
+        results[evaluation.request.flag_key] = details
+    return results
+
+
+async def _finish_bulk_evaluation_async(
+    evaluations: list[_BulkEvaluation], hook_hints: HookHints
+) -> dict[str, FlagEvaluationDetails[FlagValueType]]:
+    results = {}
+    for evaluation in evaluations:
+        details = typing.cast(
+            "FlagEvaluationDetails[FlagValueType]", evaluation.details
+        )
+        await run_after_all_hooks_async(
+            details, evaluation.stage_hooks.finally_after, hook_hints
+        )
+        results[evaluation.request.flag_key] = details
+    return results
+
+
+def _resolution_to_details(
+    flag_key: str,
+    flag_type: FlagType,
+    resolution: FlagResolutionDetails[FlagValueType]
+    | FlagEvaluationDetails[FlagValueType],
+) -> FlagEvaluationDetails[FlagValueType]:
+    if isinstance(resolution, FlagEvaluationDetails):
+        # providers may return evaluation details to spare the copy below; they
+        # are only copied when the client is about to modify them
+        if resolution.error_code or resolution.flag_key != flag_key:
+            return replace(resolution, flag_key=flag_key)
+        if err := _typecheck_flag_value(value=resolution.value, flag_type=flag_type):
+            return _create_type_mismatch_details(flag_key, resolution.value, err)
+        return resolution
+
+    if resolution.error_code:
+        return resolution.to_flag_evaluation_details(flag_key)
+
+    # we need to check the get_args to be compatible with union types.
+    if err := _typecheck_flag_value(value=resolution.value, flag_type=flag_type):
+        return _create_type_mismatch_details(flag_key, resolution.value, err)
+
+    return resolution.to_flag_evaluation_details(flag_key)
+
+
+def _create_type_mismatch_details(
+    flag_key: str, value: FlagValueType, err: OpenFeatureError
+) -> FlagEvaluationDetails[FlagValueType]:
+    return FlagEvaluationDetails(
+        flag_key=flag_key,
+        value=value,
+        reason=Reason.ERROR,
+        error_code=err.error_code,
+        error_message=err.error_message,
+    )
+
+
+def _create_error_details(
+    flag_key: str, default_value: FlagValueType, err: Exception
+) -> FlagEvaluationDetails[FlagValueType]:
+    if isinstance(err, OpenFeatureError):
+        error_code = err.error_code
+        error_message = err.error_message
+    else:
+        error_code = ErrorCode.GENERAL
+        error_message = getattr(err, "error_message", str(err))
+
+    return FlagEvaluationDetails(
+        flag_key=flag_key,
+        value=default_value,
+        reason=Reason.ERROR,
+        error_code=error_code,
+        error_message=error_message,
+    )
+
+
+def _run_error_hooks(
+    err: Exception,
+    hooks_and_context: list[tuple[Hook, HookContext]],
+    hook_hints: HookHints,
+    timer: EvaluationTimer | None,
+) -> None:
+    run_error_hooks(err, hooks_and_context, hook_hints)
+    if timer is not None:
+        timer.lap(EvaluationStage.ERROR_HOOKS)
+
+
+async def _run_error_hooks_async(
+    err: Exception,
+    hooks_and_context: list[tuple[Hook, HookContext]],
+    hook_hints: HookHints,
+    timer: EvaluationTimer | None,
+) -> None:
+    await run_error_hooks_async(err, hooks_and_context, hook_hints)
+    if timer is not None:
+        timer.lap(EvaluationStage.ERROR_HOOKS)
+
+
+_FLAG_VALUE_TYPES: TypeMap = {
+    FlagType.BOOLEAN: bool,
+    FlagType.STRING: str,
+    FlagType.OBJECT: (dict, list),
+    FlagType.FLOAT: float,
+    FlagType.INTEGER: int,
+}
+
+
 def _typecheck_flag_value(
     value: typing.Any, flag_type: FlagType
 ) -> OpenFeatureError | None:
-    type_map: TypeMap = {
-        FlagType.BOOLEAN: bool,
-        FlagType.STRING: str,
-        FlagType.OBJECT: (dict, list),
-        FlagType.FLOAT: float,
-        FlagType.INTEGER: int,
-    }
-    py_type = type_map.get(flag_type)
+    py_type = _FLAG_VALUE_TYPES.get(flag_type)
     if not py_type:
         return GeneralError(error_message="Unknown flag type")
     if not isinstance(value, py_type):
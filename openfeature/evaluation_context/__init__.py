@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import threading
 import typing
-from collections.abc import Mapping, Sequence
+import weakref
+from collections.abc import Mapping, MutableSequence, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 
 from openfeature.exception import GeneralError
+from openfeature.immutable_dict.mapping_proxy_type import MappingProxyType
 
 __all__ = [
     "EvaluationContext",
+    "FrozenEvaluationContext",
     "clear_evaluation_context",
     "get_evaluation_context",
     "set_evaluation_context",
@@ -26,7 +32,67 @@ EvaluationContextAttribute: typing.TypeAlias = (
 )
 
 
-@dataclass
+class _MemoizedAttributes(dict[str, EvaluationContextAttribute]):
+    """
+    Attributes memoizing the canonical form their fingerprint is computed from,
+    until they are modified. Copies share the memoized form, so that clients
+    can hand out copies of their merged context without the evaluation cache
+    serializing the same attributes for every evaluation. Nested values
+    modified in place, such as a list appended to, are not detected.
+    """
+
+    __slots__ = ("_canonical",)
+
+    _canonical: str | None
+
+    def __init__(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._canonical = None
+
+    def copy(self) -> _MemoizedAttributes:
+        copied = _MemoizedAttributes(self)
+        copied._canonical = self._canonical
+        return copied
+
+    def _changed(self) -> None:
+        self._canonical = None
+
+    def __setitem__(self, key: str, value: EvaluationContextAttribute) -> None:
+        self._changed()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self._changed()
+        super().__delitem__(key)
+
+    def __ior__(self, other: typing.Any) -> _MemoizedAttributes:  # type: ignore[override,misc]
+        self._changed()
+        return super().__ior__(other)
+
+    def update(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        self._changed()
+        super().update(*args, **kwargs)
+
+    def setdefault(
+        self, key: str, default: EvaluationContextAttribute
+    ) -> EvaluationContextAttribute:
+        self._changed()
+        return super().setdefault(key, default)
+
+    def pop(self, key: str, *args: typing.Any) -> typing.Any:
+        self._changed()
+        return super().pop(key, *args)
+
+    def popitem(self) -> tuple[str, EvaluationContextAttribute]:
+        self._changed()
+        return super().popitem()
+
+    def clear(self) -> None:
+        self._changed()
+        super().clear()
+
+
+@dataclass(slots=True)
 class EvaluationContext:
     targeting_key: str | None = None
     attributes: Mapping[str, EvaluationContextAttribute] = field(default_factory=dict)
@@ -40,16 +106,178 @@ class EvaluationContext:
 
         return EvaluationContext(targeting_key=targeting_key, attributes=attributes)
 
+    def fingerprint(self) -> str:
+        """
+        Returns a digest of the targeting key and the attributes that is equal for
+        equal contexts, whatever the order in which their attributes were added.
+        Sequences of any kind are treated alike, as are mappings of any kind.
+
+        The digest is computed on every call, as this context may change; use
+        freeze() to get an immutable context that computes it only once.
+        """
+        return _fingerprint(self.targeting_key, self.attributes)
+
+    def freeze(self) -> FrozenEvaluationContext:
+        """
+        Returns an immutable, hashable copy of this context. Equal contexts are
+        interned, so freezing them returns the same object for as long as it is
+        referenced somewhere.
+        """
+        fingerprint = self.fingerprint()
+        with _interned_contexts_lock:
+            frozen = _interned_contexts.get(fingerprint)
+            if frozen is None:
+                frozen = FrozenEvaluationContext(
+                    self.targeting_key, self.attributes, _fingerprint=fingerprint
+                )
+                _interned_contexts[fingerprint] = frozen
+        return frozen
+
+
+class FrozenEvaluationContext(EvaluationContext):
+    """
+    An immutable evaluation context, whose attributes are deeply frozen: mappings
+    become read-only and sequences become tuples. It is hashable, and computes
+    its fingerprint at most once, so it can be used as a cache key.
+    """
+
+    # weak references are needed to intern frozen contexts
+    __slots__ = ("__weakref__", "_fingerprint")
+
+    _fingerprint: str | None
+
+    def __init__(
+        self,
+        targeting_key: str | None = None,
+        attributes: Mapping[str, EvaluationContextAttribute] | None = None,
+        *,
+        _fingerprint: str | None = None,
+    ) -> None:
+        object.__setattr__(self, "targeting_key", targeting_key)
+        object.__setattr__(self, "attributes", _freeze_attribute(attributes or {}))
+        object.__setattr__(self, "_fingerprint", _fingerprint)
+
+    def __setattr__(self, key: str, value: typing.Any) -> None:
+        raise AttributeError(f"Attribute {key!r} is immutable")
+
+    def __delattr__(self, key: str) -> None:
+        raise AttributeError(f"Attribute {key!r} is immutable")
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, EvaluationContext):
+            return self.fingerprint() == other.fingerprint()
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.fingerprint())
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        return (type(self), (self.targeting_key, self.attributes))
+
+    def fingerprint(self) -> str:
+        fingerprint: str | None = self._fingerprint
+        if fingerprint is None:
+            fingerprint = _fingerprint(self.targeting_key, self.attributes)
+            object.__setattr__(self, "_fingerprint", fingerprint)
+        return fingerprint
+
+    def freeze(self) -> FrozenEvaluationContext:
+        return self
+
+
+def _freeze_attribute(value: typing.Any) -> typing.Any:
+    if isinstance(value, Mapping):
+        return MappingProxyType(
+            {key: _freeze_attribute(item) for key, item in value.items()}
+        )
+    if isinstance(value, Sequence) and not isinstance(value, str):
+        return tuple(_freeze_attribute(item) for item in value)
+    return value
+
+
+def _copy_context(evaluation_context: EvaluationContext) -> EvaluationContext:
+    """
+    Returns a copy of a context, copying its attributes and the dicts and lists
+    nested in them, for work that runs after the evaluation returned. Unlike
+    freeze(), it neither fingerprints nor interns the context.
+    """
+    if isinstance(evaluation_context, FrozenEvaluationContext):
+        return evaluation_context
+    scalar_types = _SCALAR_TYPES
+    return EvaluationContext(
+        evaluation_context.targeting_key,
+        {
+            key: value if type(value) in scalar_types else _copy_attribute(value)
+            for key, value in evaluation_context.attributes.items()
+        },
+    )
+
+
+def _copy_attribute(value: typing.Any) -> typing.Any:
+    if type(value) in _SCALAR_TYPES:
+        return value
+    if isinstance(value, Mapping) and not isinstance(value, MappingProxyType):
+        return {key: _copy_attribute(item) for key, item in value.items()}
+    if isinstance(value, MutableSequence):
+        return [_copy_attribute(item) for item in value]
+    return value
+
+
+_SCALAR_TYPES = frozenset((str, int, float, bool, type(None), datetime))
+
+
+def _fingerprint(
+    targeting_key: str | None, attributes: Mapping[str, EvaluationContextAttribute]
+) -> str:
+    if isinstance(attributes, _MemoizedAttributes):
+        canonical_attributes = attributes._canonical
+        if canonical_attributes is None:
+            canonical_attributes = attributes._canonical = _canonical_json(attributes)
+    else:
+        canonical_attributes = _canonical_json(attributes)
+    canonical = f"[{_canonical_json(targeting_key)},{canonical_attributes}]"
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+
+def _canonical_default(value: typing.Any) -> typing.Any:
+    if isinstance(value, Mapping):
+        return dict(value.items())
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, Sequence):
+        return list(value)
+    return str(value)
+
+
+_canonical_json = json.JSONEncoder(
+    sort_keys=True,
+    separators=(",", ":"),
+    ensure_ascii=False,
+    default=_canonical_default,
+).encode
+
 
 def get_evaluation_context() -> EvaluationContext:
     return _evaluation_context
 
 
 def set_evaluation_context(evaluation_context: EvaluationContext) -> None:
-    global _evaluation_context
+    global _evaluation_context, _evaluation_context_version
     if evaluation_context is None:
         raise GeneralError(error_message="No api level evaluation context")
-    _evaluation_context = evaluation_context
+    with _evaluation_context_lock:
+        _evaluation_context = evaluation_context
+        _evaluation_context_version += 1
+
+
+def get_evaluation_context_version() -> int:
+    """
+    Returns a counter that changes every time the API-level evaluation context is
+    set. Clients use it to detect when their cached merged context is outdated.
+    """
+    return _evaluation_context_version
 
 
 def clear_evaluation_context() -> None:
@@ -58,3 +286,9 @@ def clear_evaluation_context() -> None:
 
 # need to be at the bottom, because of the definition order
 _evaluation_context = EvaluationContext()
+_evaluation_context_version = 0
+_evaluation_context_lock = threading.Lock()
+_interned_contexts: weakref.WeakValueDictionary[str, FrozenEvaluationContext] = (
+    weakref.WeakValueDictionary()
+)
+_interned_contexts_lock = threading.Lock()
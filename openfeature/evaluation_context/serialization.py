@@ -0,0 +1,255 @@
+"""
+Canonical serialization of evaluation contexts, to JSON or to a compact binary
+form.
+
+Both forms are canonical: equal contexts serialize to the same output, whatever
+the order in which their attributes were added, and sequences and mappings of
+any kind serialize alike. Datetimes are kept as such, rather than turned into
+strings.
+
+The output is memoized on frozen contexts.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import threading
+import typing
+import weakref
+from collections.abc import Callable, Mapping, Sequence
+from datetime import datetime
+
+from openfeature.evaluation_context import (
+    EvaluationContext,
+    FrozenEvaluationContext,
+    _canonical_default,
+)
+from openfeature.exception import ParseError
+
+__all__ = ["from_bytes", "from_json", "to_bytes", "to_json"]
+
+_T = typing.TypeVar("_T", str, bytes)
+
+_FORMAT_VERSION = 1
+
+_NONE = 0
+_FALSE = 1
+_TRUE = 2
+_INT = 3
+_FLOAT = 4
+_STR = 5
+_DATETIME = 6
+_LIST = 7
+_MAP = 8
+
+_FLOAT_FORMAT = struct.Struct(">d")
+
+_json_value = json.JSONEncoder(
+    sort_keys=True,
+    separators=(",", ":"),
+    ensure_ascii=False,
+    default=_canonical_default,
+).encode
+
+_memo_lock = threading.Lock()
+_json_memo: weakref.WeakKeyDictionary[FrozenEvaluationContext, str] = (
+    weakref.WeakKeyDictionary()
+)
+_bytes_memo: weakref.WeakKeyDictionary[FrozenEvaluationContext, bytes] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def to_json(evaluation_context: EvaluationContext) -> str:
+    """
+    Serializes a context to canonical JSON: an object with the targeting key and
+    the attributes, with sorted keys and no whitespace. Datetimes are serialized
+    as ``{"$datetime": "<ISO 8601>"}`` objects.
+    """
+    return _memoized(evaluation_context, _json_memo, _to_json)
+
+
+def to_bytes(evaluation_context: EvaluationContext) -> bytes:
+    """Serializes a context to a compact, canonical binary form."""
+    return _memoized(evaluation_context, _bytes_memo, _to_bytes)
+
+
+def from_json(data: str | bytes) -> EvaluationContext:
+    """
+    Deserializes a context serialized by to_json().
+
+    :raises ParseError: if the data is not a serialized context
+    """
+    try:
+        serialized = json.loads(data, object_hook=_decode_json_object)
+        return EvaluationContext(serialized["targeting_key"], serialized["attributes"])
+    except (ValueError, TypeError, KeyError) as e:
+        raise ParseError(f"Invalid serialized evaluation context: {e}") from e
+
+
+def from_bytes(data: bytes) -> EvaluationContext:
+    """
+    Deserializes a context serialized by to_bytes().
+
+    :raises ParseError: if the data is not a serialized context
+    """
+    if not data or data[0] != _FORMAT_VERSION:
+        raise ParseError("Invalid serialized evaluation context: unknown format")
+    try:
+        targeting_key, position = _decode(data, 1)
+        attributes, position = _decode(data, position)
+    except (ValueError, IndexError, struct.error) as e:
+        raise ParseError(f"Invalid serialized evaluation context: {e}") from e
+    if (
+        position != len(data)
+        or not isinstance(targeting_key, str | None)
+        or not isinstance(attributes, dict)
+    ):
+        raise ParseError("Invalid serialized evaluation context")
+    return EvaluationContext(targeting_key, attributes)
+
+
+def _memoized(
+    evaluation_context: EvaluationContext,
+    memo: weakref.WeakKeyDictionary[FrozenEvaluationContext, _T],
+    serialize: Callable[[EvaluationContext], _T],
+) -> _T:
+    if not isinstance(evaluation_context, FrozenEvaluationContext):
+        return serialize(evaluation_context)
+    serialized = memo.get(evaluation_context)
+    if serialized is None:
+        serialized = serialize(evaluation_context)
+        with _memo_lock:
+            memo[evaluation_context] = serialized
+    return serialized
+
+
+def _to_json(evaluation_context: EvaluationContext) -> str:
+    return _json_value(
+        {
+            "attributes": evaluation_context.attributes,
+            "targeting_key": evaluation_context.targeting_key,
+        }
+    )
+
+
+def _decode_json_object(value: dict[str, typing.Any]) -> typing.Any:
+    if len(value) == 1 and "$datetime" in value:
+        return datetime.fromisoformat(value["$datetime"])
+    return value
+
+
+def _to_bytes(evaluation_context: EvaluationContext) -> bytes:
+    data = bytearray([_FORMAT_VERSION])
+    _encode(evaluation_context.targeting_key, data)
+    _encode(evaluation_context.attributes, data)
+    return bytes(data)
+
+
+def _encode(value: typing.Any, data: bytearray) -> None:
+    if isinstance(value, Mapping):
+        data.append(_MAP)
+        _encode_size(len(value), data)
+        for key in sorted(value):
+            _encode_str(key, data)
+            _encode(value[key], data)
+    elif isinstance(value, Sequence) and not isinstance(value, str):
+        data.append(_LIST)
+        _encode_size(len(value), data)
+        for item in value:
+            _encode(item, data)
+    else:
+        _encode_scalar(value, data)
+
+
+def _encode_scalar(value: typing.Any, data: bytearray) -> None:
+    if value is None:
+        data.append(_NONE)
+    elif isinstance(value, bool):
+        data.append(_TRUE if value else _FALSE)
+    elif isinstance(value, int):
+        data.append(_INT)
+        # zigzag encoding, so that small negative integers stay short
+        _encode_size(value * 2 if value >= 0 else -value * 2 - 1, data)
+    elif isinstance(value, float):
+        data.append(_FLOAT)
+        data += _FLOAT_FORMAT.pack(value)
+    elif isinstance(value, datetime):
+        data.append(_DATETIME)
+        _encode_str(value.isoformat(), data)
+    else:
+        data.append(_STR)
+        _encode_str(str(value), data)
+
+
+def _encode_str(value: str, data: bytearray) -> None:
+    encoded = value.encode()
+    _encode_size(len(encoded), data)
+    data += encoded
+
+
+def _encode_size(size: int, data: bytearray) -> None:
+    # unsigned LEB128
+    while size >= 0x80:
+        data.append((size & 0x7F) | 0x80)
+        size >>= 7
+    data.append(size)
+
+
+def _decode(data: bytes, position: int) -> tuple[typing.Any, int]:
+    tag = data[position]
+    position += 1
+    if tag == _MAP:
+        size, position = _decode_size(data, position)
+        mapping: dict[str, typing.Any] = {}
+        for _ in range(size):
+            key, position = _decode_str(data, position)
+            mapping[key], position = _decode(data, position)
+        return mapping, position
+    if tag == _LIST:
+        size, position = _decode_size(data, position)
+        items = []
+        for _ in range(size):
+            item, position = _decode(data, position)
+            items.append(item)
+        return items, position
+    return _decode_scalar(tag, data, position)
+
+
+def _decode_scalar(tag: int, data: bytes, position: int) -> tuple[typing.Any, int]:
+    if tag == _NONE:
+        return None, position
+    if tag in (_FALSE, _TRUE):
+        return tag == _TRUE, position
+    if tag == _INT:
+        zigzag, position = _decode_size(data, position)
+        return (zigzag // 2 if zigzag % 2 == 0 else -(zigzag + 1) // 2), position
+    if tag == _FLOAT:
+        end = position + _FLOAT_FORMAT.size
+        return _FLOAT_FORMAT.unpack(data[position:end])[0], end
+    if tag == _DATETIME:
+        isoformat, position = _decode_str(data, position)
+        return datetime.fromisoformat(isoformat), position
+    if tag == _STR:
+        return _decode_str(data, position)
+    raise ValueError(f"unknown tag {tag}")
+
+
+def _decode_str(data: bytes, position: int) -> tuple[str, int]:
+    size, position = _decode_size(data, position)
+    end = position + size
+    if end > len(data):
+        raise ValueError("truncated string")
+    return data[position:end].decode(), end
+
+
+def _decode_size(data: bytes, position: int) -> tuple[int, int]:
+    size = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        size |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return size, position
+        shift += 7
@@ -16,7 +16,7 @@ class ProviderEvent(Enum):
     PROVIDER_STALE = "PROVIDER_STALE"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderEventDetails:
     flags_changed: list[str] | None = None
     message: str | None = None
@@ -24,7 +24,7 @@ class ProviderEventDetails:
     metadata: dict[str, bool | str | int | float] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class EventDetails(ProviderEventDetails):
     provider_name: str = ""
     flags_changed: list[str] | None = None
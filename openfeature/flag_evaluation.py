@@ -15,6 +15,7 @@ if typing.TYPE_CHECKING:  # pragma: no cover
 __all__ = [
     "FlagEvaluationDetails",
     "FlagEvaluationOptions",
+    "FlagEvaluationRequest",
     "FlagMetadata",
     "FlagResolutionDetails",
     "FlagType",
@@ -50,7 +51,7 @@ FlagValueType: typing.TypeAlias = (
 T_co = typing.TypeVar("T_co", covariant=True)
 
 
-@dataclass
+@dataclass(slots=True)
 class FlagEvaluationDetails(typing.Generic[T_co]):
     flag_key: str
     value: T_co
@@ -66,6 +67,17 @@ class FlagEvaluationDetails(typing.Generic[T_co]):
         return None
 
 
+class FlagEvaluationRequest(typing.NamedTuple):
+    """
+    A flag to evaluate as part of a bulk evaluation. Plain
+    ``(flag_key, flag_type, default_value)`` tuples are accepted as well.
+    """
+
+    flag_key: str
+    flag_type: FlagType
+    default_value: FlagValueType
+
+
 @dataclass
 class FlagEvaluationOptions:
     hooks: list[Hook] = field(default_factory=list)
@@ -75,7 +87,7 @@ class FlagEvaluationOptions:
 U_co = typing.TypeVar("U_co", covariant=True)
 
 
-@dataclass
+@dataclass(slots=True)
 class FlagResolutionDetails(typing.Generic[U_co]):
     value: U_co
     error_code: ErrorCode | None = None
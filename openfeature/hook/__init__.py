@@ -14,6 +14,7 @@ if typing.TYPE_CHECKING:
     from openfeature.provider.metadata import Metadata
 
 __all__ = [
+    "AsyncHook",
     "Hook",
     "HookContext",
     "HookData",
@@ -25,6 +26,7 @@ __all__ = [
 ]
 
 _hooks: list[Hook] = []
+_hooks_version = 0
 _hooks_lock = threading.RLock()
 
 
@@ -39,7 +41,60 @@ class HookType(Enum):
     ERROR = "error"
 
 
+class _HookContextCore(typing.NamedTuple):
+    """The read-only part of the hook context, shared by all hooks of an evaluation."""
+
+    flag_key: str
+    flag_type: FlagType
+    default_value: FlagValueType
+    client_metadata: ClientMetadata | None
+    provider_metadata: Metadata | None
+
+
+_V = typing.TypeVar("_V")
+
+
+class _CoreField(typing.Generic[_V]):
+    """Exposes a field of the shared core of a HookContext, refusing assignments."""
+
+    __slots__ = ("name",)
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @typing.overload
+    def __get__(self, instance: None, owner: type) -> _CoreField[_V]: ...
+
+    @typing.overload
+    def __get__(self, instance: HookContext, owner: type) -> _V: ...
+
+    def __get__(self, instance: HookContext | None, owner: type) -> _CoreField[_V] | _V:
+        if instance is None:
+            return self
+        return typing.cast("_V", getattr(instance._core, self.name))
+
+    def __set__(self, instance: HookContext, value: typing.NoReturn) -> None:
+        raise AttributeError(f"Attribute {self.name!r} is immutable")
+
+
 class HookContext:
+    """
+    The context handed to every stage of a hook.
+
+    The flag key, flag type, default value and metadata live in a read-only core
+    shared by the hook contexts of all the hooks of an evaluation, while the
+    evaluation context and the hook data belong to each hook. The hook data is
+    only created once a hook accesses it.
+    """
+
+    __slots__ = ("_core", "_hook_data", "evaluation_context")
+
+    flag_key = _CoreField[str]()
+    flag_type = _CoreField[FlagType]()
+    default_value = _CoreField[FlagValueType]()
+    client_metadata = _CoreField["ClientMetadata | None"]()
+    provider_metadata = _CoreField["Metadata | None"]()
+
     def __init__(  # noqa: PLR0913
         self,
         flag_key: str,
@@ -50,24 +105,32 @@ class HookContext:
         provider_metadata: Metadata | None = None,
         hook_data: HookData | None = None,
     ):
-        self.flag_key = flag_key
-        self.flag_type = flag_type
-        self.default_value = default_value
+        self._core = _HookContextCore(
+            flag_key, flag_type, default_value, client_metadata, provider_metadata
+        )
         self.evaluation_context = evaluation_context
-        self.client_metadata = client_metadata
-        self.provider_metadata = provider_metadata
-        self.hook_data = hook_data or {}
-
-    def __setattr__(self, key: str, value: typing.Any) -> None:
-        if hasattr(self, key) and key in (
-            "flag_key",
-            "flag_type",
-            "default_value",
-            "client_metadata",
-            "provider_metadata",
-        ):
-            raise AttributeError(f"Attribute {key!r} is immutable")
-        super().__setattr__(key, value)
+        self._hook_data = hook_data or None
+
+    @classmethod
+    def _from_core(
+        cls, core: _HookContextCore, evaluation_context: EvaluationContext
+    ) -> HookContext:
+        hook_context = cls.__new__(cls)
+        hook_context._core = core
+        hook_context.evaluation_context = evaluation_context
+        hook_context._hook_data = None
+        return hook_context
+
+    @property
+    def hook_data(self) -> HookData:
+        hook_data = self._hook_data
+        if hook_data is None:
+            hook_data = self._hook_data = {}
+        return hook_data
+
+    @hook_data.setter
+    def hook_data(self, hook_data: HookData) -> None:
+        self._hook_data = hook_data
 
 
 # https://openfeature.dev/specification/sections/hooks/#requirement-421
@@ -153,17 +216,101 @@ class Hook:
         return True
 
 
+class AsyncHook(Hook):
+    """
+    A hook whose stages can be awaited by asynchronous flag evaluations.
+
+    The asynchronous stages call the synchronous ones by default, so a hook can
+    implement either: evaluate_flag_details_async awaits the asynchronous
+    stages, while synchronous evaluations only run the synchronous ones.
+
+    Hooks setting ``concurrent_finally_after`` to True declare that their
+    finally_after stage does not depend on other hooks; during asynchronous
+    evaluations, consecutive hooks declaring it run that stage concurrently.
+    """
+
+    concurrent_finally_after: typing.ClassVar[bool] = False
+
+    async def before_async(
+        self, hook_context: HookContext, hints: HookHints
+    ) -> EvaluationContext | None:
+        """
+        Runs before flag is resolved, in asynchronous evaluations.
+
+        :param hook_context: Information about the particular flag evaluation
+        :param hints: An immutable mapping of data for users to
+        communicate to the hooks.
+        :return: An EvaluationContext. It will be merged with the
+        EvaluationContext instances from other hooks, the client and API.
+        """
+        return self.before(hook_context, hints)
+
+    async def after_async(
+        self,
+        hook_context: HookContext,
+        details: FlagEvaluationDetails[FlagValueType],
+        hints: HookHints,
+    ) -> None:
+        """
+        Runs after a flag is resolved, in asynchronous evaluations.
+
+        :param hook_context: Information about the particular flag evaluation
+        :param details: Information about how the flag was resolved,
+        including any resolved values.
+        :param hints: A mapping of data for users to communicate to the hooks.
+        """
+        self.after(hook_context, details, hints)
+
+    async def error_async(
+        self, hook_context: HookContext, exception: Exception, hints: HookHints
+    ) -> None:
+        """
+        Run when an asynchronous evaluation encounters an error. Errors thrown
+        will be swallowed.
+
+        :param hook_context: Information about the particular flag evaluation
+        :param exception: The exception that was thrown
+        :param hints: A mapping of data for users to communicate to the hooks.
+        """
+        self.error(hook_context, exception, hints)
+
+    async def finally_after_async(
+        self,
+        hook_context: HookContext,
+        details: FlagEvaluationDetails[FlagValueType],
+        hints: HookHints,
+    ) -> None:
+        """
+        Run after an asynchronous flag evaluation, including any error
+        processing. This will always run. Errors will be swallowed.
+
+        :param hook_context: Information about the particular flag evaluation
+        :param hints: A mapping of data for users to communicate to the hooks.
+        """
+        self.finally_after(hook_context, details, hints)
+
+
 def add_hooks(hooks: list[Hook]) -> None:
     with _hooks_lock:
-        global _hooks
+        global _hooks, _hooks_version
         _hooks = _hooks + hooks
+        _hooks_version += 1
 
 
 def clear_hooks() -> None:
     with _hooks_lock:
-        global _hooks
+        global _hooks, _hooks_version
         _hooks = []
+        _hooks_version += 1
 
 
 def get_hooks() -> list[Hook]:
     return _hooks
+
+
+def get_hooks_version() -> int:
+    """
+    Returns a counter that changes every time the API-level hooks are modified.
+    Clients use it to detect when their cached evaluation plan is outdated.
+    """
+    return _hooks_version
@@ -1,13 +1,30 @@
+import asyncio
 import logging
+import threading
 import typing
+import weakref
 from functools import reduce
 
 from openfeature.evaluation_context import EvaluationContext
 from openfeature.flag_evaluation import FlagEvaluationDetails, FlagType
-from openfeature.hook import Hook, HookContext, HookHints, HookType
+from openfeature.hook import AsyncHook, Hook, HookContext, HookHints, HookType
 
 logger = logging.getLogger("openfeature")
 
+_overridden_stages: weakref.WeakKeyDictionary[type, frozenset[HookType]] = (
+    weakref.WeakKeyDictionary()
+)
+_async_only_stages: weakref.WeakKeyDictionary[type, frozenset[HookType]] = (
+    weakref.WeakKeyDictionary()
+)
+# the hook classes whose asynchronous-only stages were reported already
+_warned_hook_classes: weakref.WeakSet[type] = weakref.WeakSet()
+_warned_hook_classes_lock = threading.Lock()
+# every stage with the names of its synchronous and asynchronous methods
+_STAGE_METHOD_NAMES = tuple(
+    (hook_type, hook_type.value, f"{hook_type.value}_async") for hook_type in HookType
+)
+
 
 def error_hooks(
     flag_type: FlagType,
@@ -15,12 +32,8 @@ def error_hooks(
     hooks_and_context: list[tuple[Hook, HookContext]],
     hints: HookHints | None = None,
 ) -> None:
-    kwargs = {"exception": exception, "hints": hints}
-    _execute_hooks(
-        flag_type=flag_type,
-        hooks_and_context=hooks_and_context,
-        hook_method=HookType.ERROR,
-        **kwargs,
+    run_error_hooks(
+        exception, filter_hooks(flag_type, HookType.ERROR, hooks_and_context), hints
     )
 
 
@@ -30,12 +43,10 @@ def after_all_hooks(
     hooks_and_context: list[tuple[Hook, HookContext]],
     hints: HookHints | None = None,
 ) -> None:
-    kwargs = {"details": details, "hints": hints}
-    _execute_hooks(
-        flag_type=flag_type,
-        hooks_and_context=hooks_and_context,
-        hook_method=HookType.FINALLY_AFTER,
-        **kwargs,
+    run_after_all_hooks(
+        details,
+        filter_hooks(flag_type, HookType.FINALLY_AFTER, hooks_and_context),
+        hints,
     )
 
 
@@ -45,12 +56,10 @@ def after_hooks(
     hooks_and_context: list[tuple[Hook, HookContext]],
     hints: HookHints | None = None,
 ) -> None:
-    kwargs = {"details": details, "hints": hints}
-    _execute_hooks_unchecked(
-        flag_type=flag_type,
-        hooks_and_context=hooks_and_context,
-        hook_method=HookType.AFTER,
-        **kwargs,
+    run_after_hooks(
+        details,
+        filter_hooks(flag_type, HookType.AFTER, hooks_and_context),
+        {} if hints is None else hints,
     )
 
 
@@ -59,14 +68,52 @@ def before_hooks(
     hooks_and_context: list[tuple[Hook, HookContext]],
     hints: HookHints | None = None,
 ) -> EvaluationContext:
-    kwargs = {"hints": hints}
-    executed_hooks = _execute_hooks_unchecked(
-        flag_type=flag_type,
-        hooks_and_context=hooks_and_context,
-        hook_method=HookType.BEFORE,
-        **kwargs,
+    return run_before_hooks(
+        filter_hooks(flag_type, HookType.BEFORE, hooks_and_context),
+        {} if hints is None else hints,
+    )
+
+
+def run_error_hooks(
+    exception: Exception,
+    hooks_and_context: list[tuple[Hook, HookContext]],
+    hints: HookHints | None = None,
+) -> None:
+    """Like error_hooks, for hooks already filtered with filter_hooks."""
+    _execute_hooks(hooks_and_context, HookType.ERROR, exception=exception, hints=hints)
+
+
+def run_after_all_hooks(
+    details: FlagEvaluationDetails[typing.Any],
+    hooks_and_context: list[tuple[Hook, HookContext]],
+    hints: HookHints | None = None,
+) -> None:
+    """Like after_all_hooks, for hooks already filtered with filter_hooks."""
+    _execute_hooks(
+        hooks_and_context, HookType.FINALLY_AFTER, details=details, hints=hints
     )
-    filtered_hooks = [result for result in executed_hooks if result is not None]
+
+
+def run_after_hooks(
+    details: FlagEvaluationDetails[typing.Any],
+    hooks_and_context: list[tuple[Hook, HookContext]],
+    hints: HookHints,
+) -> None:
+    """Like after_hooks, for hooks already filtered with filter_hooks."""
+    for hook, hook_context in hooks_and_context:
+        hook.after(hook_context=hook_context, details=details, hints=hints)
+
+
+def run_before_hooks(
+    hooks_and_context: list[tuple[Hook, HookContext]],
+    hints: HookHints,
+) -> EvaluationContext:
+    """Like before_hooks, for hooks already filtered with filter_hooks."""
+    filtered_hooks = [
+        result
+        for hook, hook_context in hooks_and_context
+        if (result := hook.before(hook_context=hook_context, hints=hints)) is not None
+    ]
 
     if filtered_hooks:
         return reduce(lambda a, b: a.merge(b), filtered_hooks)
@@ -74,51 +121,221 @@ def before_hooks(
     return EvaluationContext()
 
 
-def _execute_hooks(
-    flag_type: FlagType,
+async def run_error_hooks_async(
+    exception: Exception,
+    hooks_and_context: list[tuple[Hook, HookContext]],
+    hints: HookHints | None = None,
+) -> None:
+    """Like run_error_hooks, awaiting the asynchronous stage of an AsyncHook."""
+    for hook, hook_context in hooks_and_context:
+        await _execute_hook_checked_async(
+            hook,
+            HookType.ERROR,
+            hook_context=hook_context,
+            exception=exception,
+            hints=hints,
+        )
+
+
+async def run_after_all_hooks_async(
+    details: FlagEvaluationDetails[typing.Any],
     hooks_and_context: list[tuple[Hook, HookContext]],
+    hints: HookHints | None = None,
+) -> None:
+    """
+    Like run_after_all_hooks, awaiting the asynchronous stage of an AsyncHook.
+    Consecutive hooks declaring concurrent_finally_after run concurrently.
+    """
+    concurrent: list[typing.Coroutine[typing.Any, typing.Any, typing.Any]] = []
+    for hook, hook_context in hooks_and_context:
+        call = _execute_hook_checked_async(
+            hook,
+            HookType.FINALLY_AFTER,
+            hook_context=hook_context,
+            details=details,
+            hints=hints,
+        )
+        if isinstance(hook, AsyncHook) and hook.concurrent_finally_after:
+            concurrent.append(call)
+            continue
+        if concurrent:
+            await asyncio.gather(*concurrent)
+            concurrent = []
+        await call
+    if concurrent:
+        await asyncio.gather(*concurrent)
+
+
+async def run_after_hooks_async(
+    details: FlagEvaluationDetails[typing.Any],
+    hooks_and_context: list[tuple[Hook, HookContext]],
+    hints: HookHints,
+) -> None:
+    """Like run_after_hooks, awaiting the asynchronous stage of an AsyncHook."""
+    for hook, hook_context in hooks_and_context:
+        if isinstance(hook, AsyncHook):
+            await hook.after_async(
+                hook_context=hook_context, details=details, hints=hints
+            )
+        else:
+            hook.after(hook_context=hook_context, details=details, hints=hints)
+
+
+async def run_before_hooks_async(
+    hooks_and_context: list[tuple[Hook, HookContext]],
+    hints: HookHints,
+) -> EvaluationContext:
+    """Like run_before_hooks, awaiting the asynchronous stage of an AsyncHook."""
+    filtered_hooks = []
+    for hook, hook_context in hooks_and_context:
+        if isinstance(hook, AsyncHook):
+            result = await hook.before_async(hook_context=hook_context, hints=hints)
+        else:
+            result = hook.before(hook_context=hook_context, hints=hints)
+        if result is not None:
+            filtered_hooks.append(result)
+
+    if filtered_hooks:
+        return reduce(lambda a, b: a.merge(b), filtered_hooks)
+
+    return EvaluationContext()
+
+
+def filter_hooks(
+    flag_type: FlagType,
     hook_method: HookType,
-    **kwargs: typing.Any,
-) -> list[EvaluationContext | None]:
+    hooks_and_context: list[tuple[Hook, HookContext]],
+) -> list[tuple[Hook, HookContext]]:
     """
-    Run multiple hooks of any hook type. All of these hooks will be run through an
-    exception check.
+    Keep the hooks supporting the flag type that override the given stage.
 
     :param flag_type: particular type of flag
-    :param hooks_and_context: a list of hooks and their context
     :param hook_method: the type of hook that is being run
-    :param kwargs: arguments that need to be provided to the hook method
-    :return: a list of results from the applied hook methods
+    :param hooks_and_context: a list of hooks and their context
+    :return: the hooks to run, with their context
     """
     return [
-        _execute_hook_checked(hook, hook_method, hook_context=hook_context, **kwargs)
+        (hook, hook_context)
         for (hook, hook_context) in hooks_and_context
-        if hook.supports_flag_value_type(flag_type)
+        if hook_method in get_overridden_stages(hook)
+        and hook.supports_flag_value_type(flag_type)
     ]
 
 
-def _execute_hooks_unchecked(
-    flag_type: FlagType,
+def get_overridden_stages(hook: Hook) -> frozenset[HookType]:
+    """
+    Returns the stages a hook implements, i.e. the methods overriding the no-op
+    ones of the Hook base class, or the asynchronous ones of the AsyncHook base
+    class, either in its class or on the instance itself. The result for the
+    class is computed once and cached.
+
+    :param hook: the hook to inspect
+    :return: the stages worth invoking for the hook
+    """
+    hook_class = type(hook)
+    stages = _overridden_stages.get(hook_class)
+    if stages is None:
+        is_async_hook = issubclass(hook_class, AsyncHook)
+        stages = frozenset(
+            hook_type
+            for hook_type in HookType
+            if getattr(hook_class, hook_type.value, None)
+            is not getattr(Hook, hook_type.value)
+            or (
+                is_async_hook
+                and getattr(hook_class, f"{hook_type.value}_async")
+                is not getattr(AsyncHook, f"{hook_type.value}_async")
+            )
+        )
+        _overridden_stages[hook_class] = stages
+
+    instance_attributes = getattr(hook, "__dict__", None)
+    if instance_attributes and len(stages) < len(HookType):
+        stages = stages.union(
+            hook_type
+            for hook_type, name, async_name in _STAGE_METHOD_NAMES
+            if name in instance_attributes or async_name in instance_attributes
+        )
+    return stages
+
+
+def get_async_only_stages(hook: Hook) -> frozenset[HookType]:
+    """
+    Returns the stages an AsyncHook implements only asynchronously, which
+    synchronous evaluations cannot run. The result for the class is computed
+    once and cached.
+
+    :param hook: the hook to inspect
+    :return: the stages synchronous evaluations skip for the hook
+    """
+    hook_class = type(hook)
+    if not issubclass(hook_class, AsyncHook):
+        return frozenset()
+    instance_attributes = getattr(hook, "__dict__", None)
+    if instance_attributes:
+        return frozenset(
+            hook_type
+            for hook_type in HookType
+            if _is_async_only(hook_class, hook_type, instance_attributes)
+        )
+    stages = _async_only_stages.get(hook_class)
+    if stages is None:
+        stages = frozenset(
+            hook_type for hook_type in HookType if _is_async_only(hook_class, hook_type)
+        )
+        _async_only_stages[hook_class] = stages
+    return stages
+
+
+def _is_async_only(
+    hook_class: type[AsyncHook],
+    hook_type: HookType,
+    instance_attributes: typing.Container[str] = (),
+) -> bool:
+    name = hook_type.value
+    async_name = f"{name}_async"
+    overrides_async = async_name in instance_attributes or getattr(
+        hook_class, async_name
+    ) is not getattr(AsyncHook, async_name)
+    overrides_sync = name in instance_attributes or getattr(
+        hook_class, name
+    ) is not getattr(Hook, name)
+    return overrides_async and not overrides_sync
+
+
+def warn_async_only_stages(hooks: typing.Iterable[Hook]) -> None:
+    """
+    Logs a warning, once per hook class, for hooks implementing stages only
+    asynchronously, since a synchronous evaluation is about to skip them.
+    """
+    for hook in hooks:
+        hook_class = type(hook)
+        with _warned_hook_classes_lock:
+            if hook_class in _warned_hook_classes:
+                continue
+            _warned_hook_classes.add(hook_class)
+        logger.warning(
+            "Hook %s implements the %s stages only asynchronously, so synchronous "
+            "flag evaluations skip them",
+            hook_class.__qualname__,
+            ", ".join(sorted(stage.value for stage in get_async_only_stages(hook))),
+        )
+
+
+def _execute_hooks(
     hooks_and_context: list[tuple[Hook, HookContext]],
     hook_method: HookType,
     **kwargs: typing.Any,
-) -> list[EvaluationContext | None]:
+) -> None:
     """
-    Execute a single hook without checking whether an exception is thrown. This is
-    used in the before and after hooks since any exception will be caught in the
-    client.
+    Run hooks, logging rather than raising any exception thrown.
 
-    :param flag_type: particular type of flag
     :param hooks_and_context: a list of hooks and their context
     :param hook_method: the type of hook that is being run
     :param kwargs: arguments that need to be provided to the hook method
-    :return: a list of results from the applied hook methods
     """
-    return [
-        getattr(hook, hook_method.value)(hook_context=hook_context, **kwargs)
-        for (hook, hook_context) in hooks_and_context
-        if hook.supports_flag_value_type(flag_type)
-    ]
+    for hook, hook_context in hooks_and_context:
+        _execute_hook_checked(hook, hook_method, hook_context=hook_context, **kwargs)
 
 
 def _execute_hook_checked(
@@ -141,3 +358,25 @@ def _execute_hook_checked(
     except Exception:  # pragma: no cover
         logger.exception(f"Exception when running {hook_method.value} hooks")
         return None
+
+
+async def _execute_hook_checked_async(
+    hook: Hook, hook_method: HookType, **kwargs: typing.Any
+) -> EvaluationContext | None:
+    """
+    Like _execute_hook_checked, awaiting the asynchronous stage of an AsyncHook.
+
+    :param hook: a list of hooks
+    :param hook_method: the type of hook that is being run
+    :param kwargs: arguments that need to be provided to the hook method
+    :return: the result of the hook method
+    """
+    try:
+        if isinstance(hook, AsyncHook):
+            result = await getattr(hook, f"{hook_method.value}_async")(**kwargs)
+        else:
+            result = getattr(hook, hook_method.value)(**kwargs)
+        return typing.cast("EvaluationContext | None", result)
+    except Exception:
+        logger.exception(f"Exception when running {hook_method.value} hooks")
+        return None
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import math
+import threading
+import typing
+from collections.abc import Mapping
+from hashlib import blake2b
+
+from openfeature.exception import GeneralError
+from openfeature.flag_evaluation import FlagEvaluationDetails, FlagValueType
+from openfeature.hook import Hook, HookContext, HookHints
+
+__all__ = ["CardinalityHook", "CardinalityKey", "HyperLogLog"]
+
+_HASH_BITS = 64
+
+
+class CardinalityKey(typing.NamedTuple):
+    flag_key: str
+    variant: str | None
+
+
+class HyperLogLog:
+    """
+    Estimates the number of distinct values added to it, in a fixed 2^precision
+    bytes, with a standard error of about 1.04 / sqrt(2^precision): 1.6% for
+    the default precision of 12, which takes 4 KiB.
+
+    Sketches of the same precision can be merged, and serialized with
+    to_bytes() to be merged across processes.
+    """
+
+    MIN_PRECISION = 4
+    MAX_PRECISION = 16
+
+    def __init__(self, precision: int = 12) -> None:
+        if not self.MIN_PRECISION <= precision <= self.MAX_PRECISION:
+            raise GeneralError(
+                error_message=f"precision must be between {self.MIN_PRECISION} "
+                f"and {self.MAX_PRECISION}"
+            )
+        self.precision = precision
+        self._registers = bytearray(1 << precision)
+        self._rank_bits = _HASH_BITS - precision
+        self._rank_mask = (1 << self._rank_bits) - 1
+
+    def add(self, value: str) -> None:
+        self.add_hash(_hash(value))
+
+    def add_hash(self, value_hash: int) -> None:
+        """
+        Adds a value by its 64-bit hash: the first bits of the hash select a
+        register, which keeps the highest position of the first set bit in the
+        remaining bits.
+        """
+        index = value_hash >> self._rank_bits
+        rank = self._rank_bits - (value_hash & self._rank_mask).bit_length() + 1
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+
+    def count(self) -> int:
+        registers = self._registers
+        m = len(registers)
+        estimate = _alpha(m) * m * m / math.fsum(2.0**-r for r in registers)
+        zeros = registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            # linear counting is more accurate for small cardinalities
+            estimate = m * math.log(m / zeros)
+        return round(estimate)
+
+    def merge(self, other: HyperLogLog) -> None:
+        """Adds the values of another sketch of the same precision to this one."""
+        if other.precision != self.precision:
+            raise GeneralError(
+                error_message="Cannot merge sketches of different precisions"
+            )
+        self._registers = bytearray(map(max, self._registers, other._registers))
+
+    def copy(self) -> HyperLogLog:
+        sketch = HyperLogLog(self.precision)
+        sketch._registers = bytearray(self._registers)
+        return sketch
+
+    def to_bytes(self) -> bytes:
+        return bytes([self.precision]) + self._registers
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> HyperLogLog:
+        if not data:
+            raise GeneralError(error_message="Invalid HyperLogLog sketch")
+        sketch = cls(data[0])
+        if len(data) != len(sketch._registers) + 1:
+            raise GeneralError(error_message="Invalid HyperLogLog sketch")
+        sketch._registers = bytearray(data[1:])
+        return sketch
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, HyperLogLog):
+            return NotImplemented
+        return self._registers == other._registers
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+def _alpha(m: int) -> float:
+    if m == 16:
+        return 0.673
+    if m == 32:
+        return 0.697
+    if m == 64:
+        return 0.709
+    return 0.7213 / (1 + 1.079 / m)
+
+
+class CardinalityHook(Hook):
+    """
+    Estimates the number of distinct targeting keys evaluating each flag and
+    variant, with a HyperLogLog sketch of fixed size per flag key and variant.
+    Evaluations without a targeting key are not counted.
+    """
+
+    def __init__(self, precision: int = 12) -> None:
+        # fails early on an invalid precision
+        HyperLogLog(precision)
+        self.precision = precision
+        self._lock = threading.Lock()
+        self._sketches: dict[CardinalityKey, HyperLogLog] = {}
+
+    def finally_after(
+        self,
+        hook_context: HookContext,
+        details: FlagEvaluationDetails[FlagValueType],
+        hints: HookHints,
+    ) -> None:
+        targeting_key = hook_context.evaluation_context.targeting_key
+        if not targeting_key:
+            return
+        key = CardinalityKey(details.flag_key, details.variant)
+        targeting_key_hash = _hash(targeting_key)
+        with self._lock:
+            sketch = self._sketches.get(key)
+            if sketch is None:
+                sketch = self._sketches[key] = HyperLogLog(self.precision)
+            sketch.add_hash(targeting_key_hash)
+
+    def snapshot(self) -> dict[CardinalityKey, HyperLogLog]:
+        """Returns copies of the sketches, by flag key and variant."""
+        with self._lock:
+            return {key: sketch.copy() for key, sketch in self._sketches.items()}
+
+    def merge(self, sketches: Mapping[CardinalityKey, HyperLogLog]) -> None:
+        """Merges sketches, such as the snapshot of another process, into the hook's."""
+        with self._lock:
+            for key, other in sketches.items():
+                sketch = self._sketches.get(key)
+                if sketch is None:
+                    sketch = self._sketches[key] = HyperLogLog(self.precision)
+                sketch.merge(other)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._sketches = {}
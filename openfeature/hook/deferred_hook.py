@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import collections
+import functools
+import logging
+import threading
+import typing
+import weakref
+from dataclasses import dataclass
+
+from openfeature.evaluation_context import _copy_context
+from openfeature.exception import GeneralError
+from openfeature.flag_evaluation import FlagEvaluationDetails, FlagType, FlagValueType
+from openfeature.hook import Hook, HookContext, HookHints, HookType
+from openfeature.hook._hook_support import get_overridden_stages
+
+__all__ = ["DeferredHook", "DeferredHookStatistics", "flush_deferred_hooks"]
+
+logger = logging.getLogger("openfeature")
+
+_deferred_hooks: weakref.WeakSet[DeferredHook] = weakref.WeakSet()
+_deferred_hooks_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class DeferredHookStatistics:
+    processed: int = 0
+    dropped: int = 0
+    pending: int = 0
+
+
+class _DeferredCall(typing.NamedTuple):
+    stage: HookType
+    hook_context: HookContext
+    details: FlagEvaluationDetails[FlagValueType]
+    hints: HookHints
+
+
+class DeferredHook(Hook):
+    """
+    Wraps a hook to run its after and finally_after stages on a background
+    thread, so that evaluations return without waiting for them.
+
+    The before and error stages still run inline. Only the stages the wrapped
+    hook implements are exposed, so that evaluations skip the others. Deferred
+    invocations are queued with a copy of the evaluation details and hints, and
+    a hook context holding a copy of the evaluation context, since the caller
+    may keep modifying its context once the evaluation returned. Once
+    ``max_queue_size`` invocations are waiting, further ones are dropped and
+    counted. Exceptions raised by deferred stages are logged, as they can no
+    longer affect the evaluation.
+
+    Pending invocations are flushed by ``api.shutdown()``.
+    """
+
+    def __init__(self, hook: Hook, max_queue_size: int = 1000) -> None:
+        if max_queue_size < 1:
+            raise GeneralError(error_message="max_queue_size must be at least 1")
+        self.hook = hook
+        self.max_queue_size = max_queue_size
+        self._calls: collections.deque[_DeferredCall] = collections.deque()
+        self._condition = threading.Condition()
+        self._worker: threading.Thread | None = None
+        # whether the worker waits for calls, and must be woken up for new ones
+        self._idle = False
+        self._pending = 0
+        self._processed = 0
+        self._dropped = 0
+        # stages set on the instance are the only ones evaluations invoke
+        for stage in get_overridden_stages(hook):
+            if stage in (HookType.AFTER, HookType.FINALLY_AFTER):
+                setattr(self, stage.value, functools.partial(self._defer, stage))
+            else:
+                setattr(self, stage.value, getattr(hook, stage.value))
+        with _deferred_hooks_lock:
+            _deferred_hooks.add(self)
+
+    def supports_flag_value_type(self, flag_type: FlagType) -> bool:
+        return self.hook.supports_flag_value_type(flag_type)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Waits until the queued invocations have run.
+
+        :param timeout: the maximum number of seconds to wait, or None to wait
+        for as long as it takes
+        :return: True if no invocation is pending anymore
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending, timeout)
+
+    def get_statistics(self) -> DeferredHookStatistics:
+        with self._condition:
+            return DeferredHookStatistics(
+                processed=self._processed,
+                dropped=self._dropped,
+                pending=self._pending,
+            )
+
+    def _defer(
+        self,
+        stage: HookType,
+        hook_context: HookContext,
+        details: FlagEvaluationDetails[FlagValueType],
+        hints: HookHints,
+    ) -> None:
+        call = _DeferredCall(
+            stage, _snapshot(hook_context), _copy_details(details), dict(hints)
+        )
+        with self._condition:
+            if len(self._calls) >= self.max_queue_size:
+                self._dropped += 1
+                return
+            self._calls.append(call)
+            self._pending += 1
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="openfeature-deferred-hook", daemon=True
+                )
+                self._worker.start()
+            elif self._idle:
+                self._condition.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._idle = True
+                self._condition.wait_for(lambda: self._calls)
+                self._idle = False
+                # the calls queued meanwhile are run in a batch, so that the
+                # worker does not compete with evaluations for every call
+                calls = list(self._calls)
+                self._calls.clear()
+            for call in calls:
+                self._execute(call)
+            with self._condition:
+                self._pending -= len(calls)
+                self._processed += len(calls)
+                self._condition.notify_all()
+
+    def _execute(self, call: _DeferredCall) -> None:
+        try:
+            getattr(self.hook, call.stage.value)(
+                hook_context=call.hook_context, details=call.details, hints=call.hints
+            )
+        except Exception:
+            logger.exception(f"Exception when running deferred {call.stage.value} hook")
+
+
+def flush_deferred_hooks(timeout: float | None = None) -> bool:
+    """
+    Waits until the queued invocations of every deferred hook have run. The
+    invocations still pending once the timeout expires are logged.
+
+    :param timeout: the maximum number of seconds to wait for each hook, or None
+    to wait for as long as it takes
+    :return: True if no invocation is pending anymore
+    """
+    with _deferred_hooks_lock:
+        hooks = list(_deferred_hooks)
+    flushed = True
+    # flush every hook, even once one of them timed out
+    for hook in hooks:
+        if hook.flush(timeout):
+            continue
+        flushed = False
+        logger.warning(
+            "%d deferred invocations of hook %s were still pending after %s seconds",
+            hook.get_statistics().pending,
+            type(hook.hook).__qualname__,
+            timeout,
+        )
+    return flushed
+
+
+def _copy_details(
+    details: FlagEvaluationDetails[FlagValueType],
+) -> FlagEvaluationDetails[FlagValueType]:
+    # faster than dataclasses.replace
+    return FlagEvaluationDetails(
+        details.flag_key,
+        details.value,
+        details.variant,
+        details.flag_metadata,
+        details.reason,
+        details.error_code,
+        details.error_message,
+    )
+
+
+def _snapshot(hook_context: HookContext) -> HookContext:
+    snapshot = HookContext._from_core(
+        hook_context._core, _copy_context(hook_context.evaluation_context)
+    )
+    # the hook data belongs to the wrapped hook, which keeps using it
+    snapshot._hook_data = hook_context._hook_data
+    return snapshot
@@ -1,24 +1,93 @@
-import json
+from __future__ import annotations
+
 import logging
-from dataclasses import asdict
+import queue
+import threading
+import time
+import typing
 
-from openfeature.evaluation_context import EvaluationContext
-from openfeature.exception import ErrorCode, OpenFeatureError
+from openfeature.evaluation_context import EvaluationContext, _copy_context
+from openfeature.evaluation_context.serialization import to_json
+from openfeature.exception import ErrorCode, GeneralError, OpenFeatureError
 from openfeature.flag_evaluation import FlagEvaluationDetails, FlagValueType
 from openfeature.hook import Hook, HookContext, HookHints
 
+logger = logging.getLogger("openfeature")
+
+
+class _QueuedRecord(typing.NamedTuple):
+    level: int
+    msg: str
+    args: tuple[typing.Any, ...]
+    # serialized into the args by the background thread
+    evaluation_context: EvaluationContext | None
+
+
+class _FlagRateLimit:
+    __slots__ = ("records", "suppressed", "window_start")
+
+    def __init__(self, window_start: float) -> None:
+        self.window_start = window_start
+        self.records = 0
+        self.suppressed = 0
+
 
 class LoggingHook(Hook):
+    """
+    Logs flag evaluations: the before and after stages at the DEBUG level, and
+    the error stage at the ERROR level. Nothing is built for a stage when the
+    logger is not enabled for its level.
+
+    With ``background`` set, records are queued and logged from a background
+    thread, along with the serialization of the evaluation context, so that
+    evaluations never wait on log handlers. Once ``max_queue_size`` records are
+    waiting, further ones are dropped and counted, and the number of dropped
+    records is logged at the WARNING level by the background thread. A record
+    that cannot be logged is reported, without stopping the background thread.
+
+    With ``max_records_per_flag`` set, at most that many records are logged for
+    a flag every ``rate_limit_interval`` seconds. The number of records that
+    were suppressed is logged at the WARNING level with the first record of the
+    next interval.
+    """
+
     def __init__(
         self,
         include_evaluation_context: bool = False,
         logger: logging.Logger | None = None,
+        background: bool = False,
+        max_queue_size: int = 10_000,
+        max_records_per_flag: int | None = None,
+        rate_limit_interval: float = 60.0,
     ):
+        if max_queue_size < 1:
+            raise GeneralError(error_message="max_queue_size must be at least 1")
+        if max_records_per_flag is not None and max_records_per_flag < 1:
+            raise GeneralError(error_message="max_records_per_flag must be at least 1")
+        if rate_limit_interval <= 0:
+            raise GeneralError(error_message="rate_limit_interval must be positive")
         self.logger = logger or logging.getLogger("openfeature")
         self.include_evaluation_context = include_evaluation_context
+        self.max_records_per_flag = max_records_per_flag
+        self.rate_limit_interval = rate_limit_interval
+        self._queue: queue.Queue[_QueuedRecord] | None = (
+            queue.Queue(max_queue_size) if background else None
+        )
+        self._condition = threading.Condition()
+        self._worker: threading.Thread | None = None
+        self._pending = 0
+        self._dropped = 0
+        self._rate_limits: dict[str, _FlagRateLimit] = {}
+        self._rate_limits_lock = threading.Lock()
 
     def _build_args(self, hook_context: HookContext, stage: str) -> dict:
-        args = {
+        args = self._build_base_args(hook_context, stage)
+        if self.include_evaluation_context:
+            args["evaluation_context"] = to_json(hook_context.evaluation_context)
+        return args
+
+    def _build_base_args(self, hook_context: HookContext, stage: str) -> dict:
+        return {
             "domain": hook_context.client_metadata.domain
             if hook_context.client_metadata
             else None,
@@ -29,18 +98,12 @@ class LoggingHook(Hook):
             "default_value": hook_context.default_value,
             "stage": stage,
         }
-        if self.include_evaluation_context:
-            args["evaluation_context"] = json.dumps(
-                asdict(hook_context.evaluation_context),
-                default=str,
-            )
-        return args
 
     def before(
         self, hook_context: HookContext, hints: HookHints
     ) -> EvaluationContext | None:
-        args = self._build_args(hook_context, "before")
-        self.logger.debug("Flag evaluation %s", args)
+        if self._should_log(logging.DEBUG, hook_context.flag_key):
+            self._log_evaluation(logging.DEBUG, hook_context, "before", {})
         return None
 
     def after(
@@ -49,20 +112,161 @@ class LoggingHook(Hook):
         details: FlagEvaluationDetails[FlagValueType],
         hints: HookHints,
     ) -> None:
-        args = self._build_args(hook_context, "after")
-        args["reason"] = details.reason
-        args["variant"] = details.variant
-        args["value"] = details.value
-        self.logger.debug("Flag evaluation %s", args)
+        if not self._should_log(logging.DEBUG, hook_context.flag_key):
+            return
+        self._log_evaluation(
+            logging.DEBUG,
+            hook_context,
+            "after",
+            {
+                "reason": details.reason,
+                "variant": details.variant,
+                "value": details.value,
+            },
+        )
 
     def error(
         self, hook_context: HookContext, exception: Exception, hints: HookHints
     ) -> None:
-        args = self._build_args(hook_context, "error")
+        if not self._should_log(logging.ERROR, hook_context.flag_key):
+            return
         if isinstance(exception, OpenFeatureError):
-            args["error_code"] = exception.error_code
-            args["error_message"] = exception.error_message
+            fields = {
+                "error_code": exception.error_code,
+                "error_message": exception.error_message,
+            }
         else:
-            args["error_code"] = ErrorCode.GENERAL
-            args["error_message"] = str(exception)
-        self.logger.error("Flag evaluation %s", args)
+            fields = {
+                "error_code": ErrorCode.GENERAL,
+                "error_message": str(exception),
+            }
+        self._log_evaluation(logging.ERROR, hook_context, "error", fields)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Waits until the records queued for the background thread are logged.
+
+        :param timeout: the maximum number of seconds to wait, or None to wait
+        for as long as it takes
+        :return: True if no record is pending anymore
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending, timeout)
+
+    def get_dropped_records(self) -> int:
+        """Returns the number of records dropped because the queue was full."""
+        with self._condition:
+            return self._dropped
+
+    def _should_log(self, level: int, flag_key: str) -> bool:
+        if not self.logger.isEnabledFor(level):
+            return False
+        if self.max_records_per_flag is None:
+            return True
+
+        now = time.monotonic()
+        suppressed = 0
+        with self._rate_limits_lock:
+            rate_limit = self._rate_limits.get(flag_key)
+            if rate_limit is None:
+                rate_limit = self._rate_limits[flag_key] = _FlagRateLimit(now)
+            elif now - rate_limit.window_start >= self.rate_limit_interval:
+                suppressed = rate_limit.suppressed
+                rate_limit.window_start = now
+                rate_limit.records = rate_limit.suppressed = 0
+            if rate_limit.records >= self.max_records_per_flag:
+                rate_limit.suppressed += 1
+                return False
+            rate_limit.records += 1
+
+        if suppressed:
+            self._log(
+                logging.WARNING,
+                "Suppressed %d flag evaluation log records of flag %s",
+                (suppressed, flag_key),
+            )
+        return True
+
+    def _log_evaluation(
+        self,
+        level: int,
+        hook_context: HookContext,
+        stage: str,
+        fields: dict[str, typing.Any],
+    ) -> None:
+        if self._queue is None:
+            args = self._build_args(hook_context, stage)
+            args.update(fields)
+            self._log(level, "Flag evaluation %s", (args,))
+            return
+        # the evaluation context is serialized by the background thread, from a
+        # copy, since the caller may keep modifying it once the evaluation returned
+        args = self._build_base_args(hook_context, stage)
+        args.update(fields)
+        self._enqueue(
+            self._queue,
+            _QueuedRecord(
+                level,
+                "Flag evaluation %s",
+                (args,),
+                _copy_context(hook_context.evaluation_context)
+                if self.include_evaluation_context
+                else None,
+            ),
+        )
+
+    def _log(self, level: int, msg: str, args: tuple[typing.Any, ...]) -> None:
+        if self._queue is not None:
+            self._enqueue(self._queue, _QueuedRecord(level, msg, args, None))
+        elif level >= logging.ERROR:
+            self.logger.error(msg, *args)
+        elif level >= logging.WARNING:
+            self.logger.warning(msg, *args)
+        else:
+            self.logger.debug(msg, *args)
+
+    def _enqueue(
+        self, records: queue.Queue[_QueuedRecord], record: _QueuedRecord
+    ) -> None:
+        with self._condition:
+            try:
+                records.put_nowait(record)
+            except queue.Full:
+                self._dropped += 1
+                return
+            self._pending += 1
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run,
+                    args=(records,),
+                    name="openfeature-logging-hook",
+                    daemon=True,
+                )
+                self._worker.start()
+
+    def _run(self, records: queue.Queue[_QueuedRecord]) -> None:
+        reported_drops = 0
+        while True:
+            record = records.get()
+            try:
+                self._log_record(record)
+                with self._condition:
+                    dropped = self._dropped - reported_drops
+                    reported_drops += dropped
+                if dropped:
+                    self.logger.warning(
+                        "Dropped %d flag evaluation log records, as the queue was full",
+                        dropped,
+                    )
+            except Exception:
+                # a failing record must not stop the thread logging the others
+                logger.exception("Exception when logging a flag evaluation record")
+            finally:
+                with self._condition:
+                    self._pending -= 1
+                    self._condition.notify_all()
+
+    def _log_record(self, record: _QueuedRecord) -> None:
+        if record.evaluation_context is not None:
+            record.args[0]["evaluation_context"] = to_json(record.evaluation_context)
+        self.logger.log(record.level, record.msg, *record.args)
@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import collections
+import threading
+import time
+import typing
+import weakref
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from openfeature.evaluation_context import EvaluationContext
+from openfeature.exception import ErrorCode, GeneralError
+from openfeature.flag_evaluation import FlagEvaluationDetails, FlagValueType, Reason
+from openfeature.hook import Hook, HookContext, HookHints
+from openfeature.instrumentation import (
+    DEFAULT_LATENCY_BUCKETS,
+    HistogramSnapshot,
+    _LatencyHistogram,
+)
+from openfeature.telemetry.attributes import TelemetryAttribute
+
+__all__ = [
+    "EvaluationLabels",
+    "MetricsHook",
+    "MetricsSnapshot",
+    "OpenMetricsExporter",
+]
+
+_START_TIME = "openfeature.metrics_hook.start_time"
+
+
+class EvaluationLabels(typing.NamedTuple):
+    flag_key: str
+    variant: str | None
+    reason: str
+    error_type: str | None
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    # number of evaluations by flag key, variant, reason and error type
+    evaluations: Mapping[EvaluationLabels, int]
+    # duration of the evaluations from their before to their finally_after
+    # stage, by flag key
+    latencies: Mapping[str, HistogramSnapshot]
+
+
+class _MetricsShard:
+    """The metrics recorded by a single thread, which is the only one updating them."""
+
+    __slots__ = ("evaluations", "latencies")
+
+    def __init__(self) -> None:
+        self.evaluations: dict[EvaluationLabels, int] = {}
+        self.latencies: dict[str, _LatencyHistogram] = {}
+
+    def add(self, shard: _MetricsShard, size: int) -> None:
+        # copies, since the owning thread may be updating the shard
+        for labels, count in dict(shard.evaluations).items():
+            self.evaluations[labels] = self.evaluations.get(labels, 0) + count
+        for flag_key, histogram in dict(shard.latencies).items():
+            merged = self.latencies.get(flag_key)
+            if merged is None:
+                merged = self.latencies[flag_key] = _LatencyHistogram(size)
+            merged.add(histogram)
+
+
+class _ShardOwner:
+    """Holds the shard of a thread in its thread-local storage, dying with it."""
+
+    __slots__ = ("__weakref__", "shard")
+
+    def __init__(self, shard: _MetricsShard) -> None:
+        self.shard = shard
+
+
+class MetricsHook(Hook):
+    """
+    Counts flag evaluations by flag key, variant, reason and error type, and
+    records their latency into histograms by flag key.
+
+    Every thread records into its own shard, so evaluating threads never wait
+    on each other; the shards are merged when a snapshot is taken, and the
+    shard of a thread is folded into a shared aggregate once the thread ends. A
+    snapshot taken while evaluations are running may therefore miss the
+    evaluations in progress.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        if not buckets or list(buckets) != sorted(set(buckets)):
+            raise GeneralError(
+                error_message="buckets must be a non-empty increasing sequence"
+            )
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._shards: list[_MetricsShard] = []
+        # the metrics of the threads that ended
+        self._retired = _MetricsShard()
+        # the shards of the threads that ended, not folded into _retired yet
+        self._ended_shards: collections.deque[_MetricsShard] = collections.deque()
+
+    def before(
+        self, hook_context: HookContext, hints: HookHints
+    ) -> EvaluationContext | None:
+        hook_context.hook_data[_START_TIME] = time.perf_counter()
+        return None
+
+    def finally_after(
+        self,
+        hook_context: HookContext,
+        details: FlagEvaluationDetails[FlagValueType],
+        hints: HookHints,
+    ) -> None:
+        shard = self._get_shard()
+        labels = EvaluationLabels(
+            flag_key=details.flag_key,
+            variant=details.variant,
+            reason=(details.reason or Reason.UNKNOWN).lower(),
+            error_type=(
+                (details.error_code or ErrorCode.GENERAL).lower()
+                if details.reason == Reason.ERROR
+                else None
+            ),
+        )
+        shard.evaluations[labels] = shard.evaluations.get(labels, 0) + 1
+
+        # evaluations failing before the before stage ran have no start time
+        start_time = hook_context.hook_data.get(_START_TIME)
+        if start_time is None:
+            return
+        duration = time.perf_counter() - start_time
+        histogram = shard.latencies.get(details.flag_key)
+        if histogram is None:
+            histogram = shard.latencies[details.flag_key] = _LatencyHistogram(
+                len(self.buckets) + 1
+            )
+        histogram.record(self.buckets, duration)
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Returns the metrics recorded so far, merged across threads."""
+        merged = _MetricsShard()
+        size = len(self.buckets) + 1
+        with self._lock:
+            self._retire_ended_shards()
+            merged.add(self._retired, size)
+            shards = list(self._shards)
+        for shard in shards:
+            merged.add(shard, size)
+
+        return MetricsSnapshot(
+            evaluations=merged.evaluations,
+            latencies={
+                flag_key: histogram.snapshot(self.buckets)
+                for flag_key, histogram in merged.latencies.items()
+            },
+        )
+
+    def reset(self) -> None:
+        with self._lock:
+            # threads pick up new shards, rather than clearing shards that
+            # their owning threads may be updating
+            self._local = threading.local()
+            self._shards = []
+            self._retired = _MetricsShard()
+
+    def _get_shard(self) -> _MetricsShard:
+        local = self._local
+        owner: _ShardOwner | None = getattr(local, "owner", None)
+        if owner is None:
+            owner = local.owner = _ShardOwner(_MetricsShard())
+            weakref.finalize(owner, _retire_shard, weakref.ref(self), owner.shard)
+            with self._lock:
+                self._retire_ended_shards()
+                self._shards.append(owner.shard)
+        return owner.shard
+
+    def _retire_ended_shards(self) -> None:
+        """Folds the shards of the threads that ended into a single aggregate."""
+        while self._ended_shards:
+            shard = self._ended_shards.popleft()
+            # shards dropped by reset are not counted anymore
+            if shard in self._shards:
+                self._shards.remove(shard)
+                self._retired.add(shard, len(self.buckets) + 1)
+
+
+def _retire_shard(hook_ref: weakref.ref[MetricsHook], shard: _MetricsShard) -> None:
+    # runs whenever the thread-local storage of a thread is collected, possibly
+    # while the hook's lock is held, so the shard is only handed over here
+    hook = hook_ref()
+    if hook is not None:
+        hook._ended_shards.append(shard)
+
+
+class OpenMetricsExporter:
+    """
+    Renders the metrics of a MetricsHook in the OpenMetrics text format, using
+    the OpenTelemetry attribute names of the feature flag semantic conventions
+    as label names, with dots replaced by underscores.
+    """
+
+    CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+    def __init__(self, hook: MetricsHook, namespace: str = "feature_flag") -> None:
+        self.hook = hook
+        self.namespace = namespace
+
+    def render(self) -> str:
+        snapshot = self.hook.snapshot()
+        evaluations = f"{self.namespace}_evaluations"
+        duration = f"{self.namespace}_evaluation_duration_seconds"
+        lines = [
+            f"# TYPE {evaluations} counter",
+            f"# HELP {evaluations} Number of flag evaluations.",
+        ]
+        for labels, count in sorted(snapshot.evaluations.items(), key=_sort_key):
+            rendered_labels = _render_labels(
+                (TelemetryAttribute.KEY, labels.flag_key),
+                (TelemetryAttribute.VARIANT, labels.variant),
+                (TelemetryAttribute.EVALUATION_REASON, labels.reason),
+                (TelemetryAttribute.ERROR_TYPE, labels.error_type),
+            )
+            lines.append(f"{evaluations}_total{rendered_labels} {count}")
+
+        lines += [
+            f"# TYPE {duration} histogram",
+            f"# UNIT {duration} seconds",
+            f"# HELP {duration} Duration of flag evaluations.",
+        ]
+        for flag_key, histogram in sorted(snapshot.latencies.items()):
+            key_label = (TelemetryAttribute.KEY, flag_key)
+            cumulative = 0
+            for bound, count in zip(
+                (*map(repr, histogram.bounds), "+Inf"), histogram.counts, strict=True
+            ):
+                cumulative += count
+                bucket_labels = _render_labels(key_label, ("le", bound))
+                lines.append(f"{duration}_bucket{bucket_labels} {cumulative}")
+            rendered_labels = _render_labels(key_label)
+            lines.append(f"{duration}_count{rendered_labels} {histogram.count}")
+            lines.append(f"{duration}_sum{rendered_labels} {histogram.sum!r}")
+
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def start_http_server(
+        self, port: int = 0, host: str = "127.0.0.1"
+    ) -> ThreadingHTTPServer:
+        """
+        Serves the rendered metrics over HTTP from a background thread, on every
+        path. Call shutdown() on the returned server to stop it.
+
+        :param port: the port to listen on, or 0 to pick a free one, which can
+        be read from the server_address of the returned server
+        :param host: the address to listen on
+        :return: the running server
+        """
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                body = exporter.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", exporter.CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: typing.Any) -> None:  # noqa: A002
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(
+            target=server.serve_forever, name="openfeature-metrics", daemon=True
+        ).start()
+        return server
+
+
+def _sort_key(item: tuple[EvaluationLabels, int]) -> tuple[str, ...]:
+    return tuple(label or "" for label in item[0])
+
+
+def _render_labels(*labels: tuple[str, str | None]) -> str:
+    rendered = ",".join(
+        f'{name.replace(".", "_")}="{_escape(value)}"'
+        for name, value in labels
+        if value is not None
+    )
+    return f"{{{rendered}}}" if rendered else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import typing
+import weakref
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from openfeature.exception import ErrorCode, GeneralError
+from openfeature.flag_evaluation import FlagEvaluationDetails, FlagValueType, Reason
+from openfeature.hook import Hook, HookContext, HookHints
+from openfeature.telemetry.attributes import TelemetryAttribute
+
+__all__ = [
+    "EvaluationSummary",
+    "SummaryHook",
+    "SummaryKey",
+    "SummaryWindow",
+    "shutdown_summary_hooks",
+]
+
+logger = logging.getLogger("openfeature")
+
+_summary_hooks: weakref.WeakSet[SummaryHook] = weakref.WeakSet()
+_summary_hooks_lock = threading.Lock()
+
+
+class SummaryKey(typing.NamedTuple):
+    flag_key: str
+    variant: str | None
+    reason: str
+    error_type: str | None
+    provider_name: str | None
+
+
+@dataclass(frozen=True)
+class EvaluationSummary:
+    key: SummaryKey
+    count: int
+    # timestamps of the first and last evaluations of the window, in seconds
+    first_seen: float
+    last_seen: float
+
+    @property
+    def attributes(self) -> dict[TelemetryAttribute, str]:
+        """The attributes of the summarized evaluation events."""
+        attributes = {
+            TelemetryAttribute.KEY: self.key.flag_key,
+            TelemetryAttribute.EVALUATION_REASON: self.key.reason,
+        }
+        if self.key.variant:
+            attributes[TelemetryAttribute.VARIANT] = self.key.variant
+        if self.key.error_type:
+            attributes[TelemetryAttribute.ERROR_TYPE] = self.key.error_type
+        if self.key.provider_name:
+            attributes[TelemetryAttribute.PROVIDER_NAME] = self.key.provider_name
+        return attributes
+
+
+@dataclass(frozen=True)
+class SummaryWindow:
+    start: float
+    end: float
+    summaries: tuple[EvaluationSummary, ...]
+
+
+class _Counter:
+    __slots__ = ("count", "first_seen", "last_seen")
+
+    def __init__(self, timestamp: float) -> None:
+        self.count = 1
+        self.first_seen = timestamp
+        self.last_seen = timestamp
+
+
+class SummaryHook(Hook):
+    """
+    Summarizes flag evaluations over time windows, rather than creating an
+    event for each of them: every ``window`` seconds, the number of evaluations
+    by flag key, variant, reason, error type and provider name, with the time
+    of the first and last ones, is handed to the sink.
+
+    Evaluations only update a counter; closed windows are summarized and handed
+    to the sink from a background thread.
+
+    Summary hooks are shut down by ``api.shutdown()``.
+    """
+
+    def __init__(
+        self,
+        sink: Callable[[SummaryWindow], None],
+        window: float = 60.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if window <= 0:
+            raise GeneralError(error_message="window must be positive")
+        self.sink = sink
+        self.window = window
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._counters: dict[SummaryKey, _Counter] = {}
+        self._window_start = clock()
+        self._worker: threading.Thread | None = None
+        self._stopped = threading.Event()
+        with _summary_hooks_lock:
+            _summary_hooks.add(self)
+
+    def finally_after(
+        self,
+        hook_context: HookContext,
+        details: FlagEvaluationDetails[FlagValueType],
+        hints: HookHints,
+    ) -> None:
+        key = SummaryKey(
+            flag_key=details.flag_key,
+            variant=details.variant,
+            reason=(details.reason or Reason.UNKNOWN).lower(),
+            error_type=(
+                (details.error_code or ErrorCode.GENERAL).lower()
+                if details.reason == Reason.ERROR
+                else None
+            ),
+            provider_name=(
+                hook_context.provider_metadata.name
+                if hook_context.provider_metadata
+                else None
+            ),
+        )
+        now = self._clock()
+        with self._lock:
+            counter = self._counters.get(key)
+            if counter is None:
+                self._counters[key] = _Counter(now)
+            else:
+                counter.count += 1
+                counter.last_seen = now
+            if self._worker is None and not self._stopped.is_set():
+                self._worker = threading.Thread(
+                    target=self._run, name="openfeature-summary", daemon=True
+                )
+                self._worker.start()
+
+    def flush(self) -> None:
+        """Closes the current window and hands its summary to the sink."""
+        with self._lock:
+            counters, self._counters = self._counters, {}
+            start = self._window_start
+            end = self._window_start = self._clock()
+        if not counters:
+            return
+
+        window = SummaryWindow(
+            start=start,
+            end=end,
+            summaries=tuple(
+                EvaluationSummary(key, c.count, c.first_seen, c.last_seen)
+                for key, c in counters.items()
+            ),
+        )
+        try:
+            self.sink(window)
+        except Exception:
+            logger.exception("Exception when exporting an evaluation summary")
+
+    def shutdown(self, timeout: float | None = None) -> bool:
+        """
+        Stops rotating windows and hands the current one to the sink.
+
+        :param timeout: the maximum number of seconds to wait for the background
+        thread to hand the current window over, or None to wait for as long as
+        it takes
+        :return: True if the current window was handed to the sink
+        """
+        self._stopped.set()
+        with self._lock:
+            worker = self._worker
+        if worker is None or not worker.is_alive():
+            self.flush()
+            return True
+        worker.join(timeout)
+        return not worker.is_alive()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.window):
+            self.flush()
+        # the current window is handed over once the hook is shut down
+        self.flush()
+
+
+def shutdown_summary_hooks(timeout: float | None = None) -> bool:
+    """
+    Shuts down every summary hook. The evaluations not handed to a sink once
+    the timeout expires are logged.
+
+    :param timeout: the maximum number of seconds to wait for each hook, or None
+    to wait for as long as it takes
+    :return: True if the current window of every hook was handed to its sink
+    """
+    with _summary_hooks_lock:
+        hooks = list(_summary_hooks)
+    shut_down = True
+    # shut every hook down, even once one of them timed out
+    for hook in hooks:
+        if hook.shutdown(timeout):
+            continue
+        shut_down = False
+        with hook._lock:
+            pending = sum(counter.count for counter in hook._counters.values())
+        logger.warning(
+            "%d evaluations were still summarized by a summary hook after %s seconds",
+            pending,
+            timeout,
+        )
+    return shut_down
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from openfeature.flag_evaluation import FlagEvaluationDetails, FlagValueType
+from openfeature.hook import Hook, HookContext, HookHints
+from openfeature.telemetry import create_evaluation_event
+from openfeature.telemetry.exporter import BatchingEventExporter
+from openfeature.telemetry.sampling import EvaluationEventSampler
+
+__all__ = ["TelemetryHook"]
+
+
+class TelemetryHook(Hook):
+    """
+    Creates an evaluation event for every flag evaluation and hands it to a
+    batching exporter, which ships it from a background thread. With a
+    sampler, only the sampled evaluations get an event.
+    """
+
+    def __init__(
+        self,
+        exporter: BatchingEventExporter,
+        sampler: EvaluationEventSampler | None = None,
+    ) -> None:
+        self.exporter = exporter
+        self.sampler = sampler
+
+    def finally_after(
+        self,
+        hook_context: HookContext,
+        details: FlagEvaluationDetails[FlagValueType],
+        hints: HookHints,
+    ) -> None:
+        if self.sampler is None:
+            self.exporter.export(create_evaluation_event(hook_context, details))
+        elif event := self.sampler.create_evaluation_event(hook_context, details):
+            self.exporter.export(event)
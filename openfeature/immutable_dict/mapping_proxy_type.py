@@ -20,6 +20,10 @@ class MappingProxyType(dict):
     def __hash__(self) -> int:  # type:ignore[override]
         return id(self)
 
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        # the default dict subclass protocol would restore the items via __setitem__
+        return (type(self), (dict(self),))
+
     def _immutable(self, *args: typing.Any, **kws: typing.Any) -> typing.NoReturn:
         raise TypeError("immutable instance of dictionary")
 
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from enum import Enum
+
+from openfeature.exception import GeneralError
+from openfeature.flag_evaluation import FlagType
+
+__all__ = [
+    "DEFAULT_LATENCY_BUCKETS",
+    "EvaluationInstrumentation",
+    "EvaluationStage",
+    "EvaluationTimer",
+    "HistogramSnapshot",
+    "SlowEvaluation",
+]
+
+logger = logging.getLogger("openfeature")
+
+# upper bounds of the histogram buckets, in seconds, from 1us to 1s
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    *(
+        base * scale
+        for scale in (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1)
+        for base in (1.0, 2.5, 5.0)
+    ),
+    1.0,
+)
+
+
+class EvaluationStage(Enum):
+    CONTEXT_MERGE = "context_merge"
+    BEFORE_HOOKS = "before_hooks"
+    RESOLVE = "resolve"
+    TYPE_CHECK = "type_check"
+    AFTER_HOOKS = "after_hooks"
+    ERROR_HOOKS = "error_hooks"
+    FINALLY_HOOKS = "finally_hooks"
+    # the whole evaluation, from the call to the client to its return
+    TOTAL = "total"
+
+
+@dataclass(frozen=True)
+class HistogramSnapshot:
+    # upper bounds of the buckets, in seconds; counts has one more bucket, for
+    # the durations above the last bound
+    bounds: tuple[float, ...]
+    counts: tuple[int, ...]
+    count: int
+    sum: float
+    max: float
+
+
+@dataclass(frozen=True)
+class SlowEvaluation:
+    domain: str | None
+    flag_key: str
+    flag_type: FlagType
+    duration: float
+    stages: Mapping[EvaluationStage, float]
+
+
+class _LatencyHistogram:
+    __slots__ = ("count", "counts", "max", "sum")
+
+    def __init__(self, size: int) -> None:
+        self.counts = [0] * size
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def record(self, buckets: Sequence[float], duration: float) -> None:
+        self.counts[bisect_left(buckets, duration)] += 1
+        self.count += 1
+        self.sum += duration
+        self.max = max(self.max, duration)
+
+    def add(self, histogram: _LatencyHistogram) -> None:
+        self.counts = [
+            a + b for a, b in zip(self.counts, histogram.counts, strict=True)
+        ]
+        self.count += histogram.count
+        self.sum += histogram.sum
+        self.max = max(self.max, histogram.max)
+
+    def snapshot(self, bounds: tuple[float, ...]) -> HistogramSnapshot:
+        return HistogramSnapshot(
+            bounds=bounds,
+            counts=tuple(self.counts),
+            count=self.count,
+            sum=self.sum,
+            max=self.max,
+        )
+
+
+class EvaluationTimer:
+    """
+    Measures the stages of a single evaluation. Every call to lap() attributes
+    the time elapsed since the previous one to the given stage.
+    """
+
+    __slots__ = (
+        "_instrumentation",
+        "_last",
+        "_start",
+        "domain",
+        "flag_key",
+        "flag_type",
+        "stages",
+    )
+
+    def __init__(
+        self,
+        instrumentation: EvaluationInstrumentation,
+        domain: str | None,
+        flag_type: FlagType,
+        flag_key: str,
+    ) -> None:
+        self._instrumentation = instrumentation
+        self.domain = domain
+        self.flag_type = flag_type
+        self.flag_key = flag_key
+        self.stages: dict[EvaluationStage, float] = {}
+        self._start = self._last = time.perf_counter()
+
+    def lap(self, stage: EvaluationStage) -> None:
+        now = time.perf_counter()
+        self.stages[stage] = self.stages.get(stage, 0.0) + now - self._last
+        self._last = now
+
+    def stop(self, last_stage: EvaluationStage | None = None) -> None:
+        """
+        Records the measured stages and the total duration of the evaluation.
+
+        :param last_stage: the stage to attribute the time elapsed since the
+        previous lap to, if any
+        """
+        if last_stage is not None:
+            self.lap(last_stage)
+        self._instrumentation._record(self, time.perf_counter() - self._start)
+
+
+class EvaluationInstrumentation:
+    """
+    Records the duration of every stage of flag evaluations into histograms
+    keyed by domain and flag type.
+
+    Pass it to one or more clients to measure their evaluations; clients
+    without instrumentation only pay for checking that they have none.
+    Evaluations taking at least ``slow_threshold`` seconds are reported to
+    ``on_slow_evaluation``, on the thread that evaluated the flag.
+    """
+
+    def __init__(
+        self,
+        slow_threshold: float | None = None,
+        on_slow_evaluation: Callable[[SlowEvaluation], None] | None = None,
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        if slow_threshold is not None and slow_threshold < 0:
+            raise GeneralError(error_message="slow_threshold must not be negative")
+        if not buckets or list(buckets) != sorted(set(buckets)):
+            raise GeneralError(
+                error_message="buckets must be a non-empty increasing sequence"
+            )
+        self.slow_threshold = slow_threshold
+        self.on_slow_evaluation = on_slow_evaluation
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._histograms: dict[
+            tuple[str | None, FlagType], dict[EvaluationStage, _LatencyHistogram]
+        ] = {}
+
+    def start(
+        self, domain: str | None, flag_type: FlagType, flag_key: str
+    ) -> EvaluationTimer:
+        return EvaluationTimer(self, domain, flag_type, flag_key)
+
+    def snapshot(
+        self,
+    ) -> dict[tuple[str | None, FlagType], dict[EvaluationStage, HistogramSnapshot]]:
+        """Returns the histograms recorded so far, by domain and flag type."""
+        with self._lock:
+            return {
+                key: {
+                    stage: histogram.snapshot(self.buckets)
+                    for stage, histogram in histograms.items()
+                }
+                for key, histograms in self._histograms.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+    def _record(self, timer: EvaluationTimer, duration: float) -> None:
+        buckets = self.buckets
+        with self._lock:
+            histograms = self._histograms.setdefault(
+                (timer.domain, timer.flag_type), {}
+            )
+            for stage, stage_duration in (
+                *timer.stages.items(),
+                (EvaluationStage.TOTAL, duration),
+            ):
+                histogram = histograms.get(stage)
+                if histogram is None:
+                    histogram = histograms[stage] = _LatencyHistogram(len(buckets) + 1)
+                histogram.record(buckets, stage_duration)
+
+        if (
+            self.on_slow_evaluation is not None
+            and self.slow_threshold is not None
+            and duration >= self.slow_threshold
+        ):
+            self._report_slow_evaluation(
+                SlowEvaluation(
+                    domain=timer.domain,
+                    flag_key=timer.flag_key,
+                    flag_type=timer.flag_type,
+                    duration=duration,
+                    stages=dict(timer.stages),
+                )
+            )
+
+    def _report_slow_evaluation(self, evaluation: SlowEvaluation) -> None:
+        try:
+            if self.on_slow_evaluation is not None:
+                self.on_slow_evaluation(evaluation)
+        except Exception:
+            logger.exception("Exception when reporting a slow flag evaluation")
@@ -2,12 +2,18 @@ from __future__ import annotations
 
 import typing
 from abc import abstractmethod
-from collections.abc import Callable, Mapping, Sequence
+from collections.abc import Awaitable, Callable, Mapping, Sequence
 from enum import Enum
 
 from openfeature.evaluation_context import EvaluationContext
 from openfeature.event import ProviderEvent, ProviderEventDetails
-from openfeature.flag_evaluation import FlagResolutionDetails
+from openfeature.exception import ErrorCode, GeneralError, OpenFeatureError
+from openfeature.flag_evaluation import (
+    FlagEvaluationRequest,
+    FlagResolutionDetails,
+    FlagType,
+    Reason,
+)
 from openfeature.hook import Hook
 from openfeature.track import TrackingEventDetails
 
@@ -246,6 +252,59 @@ class AbstractProvider(FeatureProvider):
     ) -> FlagResolutionDetails[Sequence[FlagValueType] | Mapping[str, FlagValueType]]:
         return self.resolve_object_details(flag_key, default_value, evaluation_context)
 
+    def resolve_bulk_details(
+        self,
+        flags: Sequence[FlagEvaluationRequest],
+        evaluation_context: EvaluationContext | None = None,
+    ) -> Mapping[str, FlagResolutionDetails[FlagValueType]]:
+        """
+        Resolve several flags against the same evaluation context.
+
+        Providers able to answer a whole batch in one pass, e.g. with a single
+        remote call, should override this. The default implementation resolves
+        the flags one by one, so a failing flag does not affect the others.
+
+        :param flags: the key, type and default value of every flag to resolve
+        :param evaluation_context: the evaluation context shared by all flags
+        :return: the resolution details of every flag, keyed by flag key
+        """
+        resolvers: Mapping[
+            FlagType, Callable[..., FlagResolutionDetails[typing.Any]]
+        ] = {
+            FlagType.BOOLEAN: self.resolve_boolean_details,
+            FlagType.INTEGER: self.resolve_integer_details,
+            FlagType.FLOAT: self.resolve_float_details,
+            FlagType.OBJECT: self.resolve_object_details,
+            FlagType.STRING: self.resolve_string_details,
+        }
+        return {
+            flag_key: _resolve_isolated(
+                resolvers.get(flag_type), flag_key, default_value, evaluation_context
+            )
+            for flag_key, flag_type, default_value in flags
+        }
+
+    async def resolve_bulk_details_async(
+        self,
+        flags: Sequence[FlagEvaluationRequest],
+        evaluation_context: EvaluationContext | None = None,
+    ) -> Mapping[str, FlagResolutionDetails[FlagValueType]]:
+        resolvers: Mapping[
+            FlagType, Callable[..., Awaitable[FlagResolutionDetails[typing.Any]]]
+        ] = {
+            FlagType.BOOLEAN: self.resolve_boolean_details_async,
+            FlagType.INTEGER: self.resolve_integer_details_async,
+            FlagType.FLOAT: self.resolve_float_details_async,
+            FlagType.OBJECT: self.resolve_object_details_async,
+            FlagType.STRING: self.resolve_string_details_async,
+        }
+        return {
+            flag_key: await _resolve_isolated_async(
+                resolvers.get(flag_type), flag_key, default_value, evaluation_context
+            )
+            for flag_key, flag_type, default_value in flags
+        }
+
     def emit_provider_ready(self, details: ProviderEventDetails) -> None:
         self.emit(ProviderEvent.PROVIDER_READY, details)
 
@@ -264,3 +323,49 @@ class AbstractProvider(FeatureProvider):
         on_emit = getattr(self, "_on_emit", None)
         if on_emit is not None:
             on_emit(self, event, details)
+
+
+def _resolve_isolated(
+    resolver: Callable[..., FlagResolutionDetails[typing.Any]] | None,
+    flag_key: str,
+    default_value: FlagValueType,
+    evaluation_context: EvaluationContext | None,
+) -> FlagResolutionDetails[FlagValueType]:
+    try:
+        if resolver is None:
+            raise GeneralError(error_message="Unknown flag type")
+        return resolver(flag_key, default_value, evaluation_context)
+    except Exception as err:
+        return _create_error_resolution(default_value, err)
+
+
+async def _resolve_isolated_async(
+    resolver: Callable[..., Awaitable[FlagResolutionDetails[typing.Any]]] | None,
+    flag_key: str,
+    default_value: FlagValueType,
+    evaluation_context: EvaluationContext | None,
+) -> FlagResolutionDetails[FlagValueType]:
+    try:
+        if resolver is None:
+            raise GeneralError(error_message="Unknown flag type")
+        return await resolver(flag_key, default_value, evaluation_context)
+    except Exception as err:
+        return _create_error_resolution(default_value, err)
+
+
+def _create_error_resolution(
+    default_value: FlagValueType, err: Exception
+) -> FlagResolutionDetails[FlagValueType]:
+    if isinstance(err, OpenFeatureError):
+        error_code = err.error_code
+        error_message = err.error_message
+    else:
+        error_code = ErrorCode.GENERAL
+        error_message = str(err)
+
+    return FlagResolutionDetails(
+        value=default_value,
+        reason=Reason.ERROR,
+        error_code=error_code,
+        error_message=error_message,
+    )
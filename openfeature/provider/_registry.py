@@ -16,9 +16,11 @@ class ProviderRegistry:
     _providers: dict[str, FeatureProvider]
     _provider_status: dict[FeatureProvider, ProviderStatus]
     _lock: threading.RLock
+    _version: int
 
     def __init__(self) -> None:
         self._lock = threading.RLock()
+        self._version = 0
         self._default_provider = NoOpProvider()
         self._providers = {}
         self._provider_status = {
@@ -38,6 +40,7 @@ class ProviderRegistry:
         with self._lock:
             old_provider = self._providers.get(domain)
             self._providers[domain] = provider
+            self._version += 1
             already_bound = provider is self._default_provider or any(
                 p is provider for d, p in self._providers.items() if d != domain
             )
@@ -53,6 +56,13 @@ class ProviderRegistry:
         if old_provider is not None and old_provider is not provider:
             self._shutdown_if_unused(old_provider)
 
+    @property
+    def version(self) -> int:
+        """
+        A counter that changes every time a provider is bound, replaced or cleared.
+        """
+        return self._version
+
     def get_provider(self, domain: str | None) -> FeatureProvider:
         if domain is None:
             return self._default_provider
@@ -69,6 +79,7 @@ class ProviderRegistry:
         with self._lock:
             old_provider = self._default_provider
             self._default_provider = provider
+            self._version += 1
             if (
                 provider is not old_provider
                 and provider not in self._providers.values()
@@ -90,6 +101,7 @@ class ProviderRegistry:
         with self._lock:
             self._providers.clear()
             self._default_provider = NoOpProvider()
+            self._version += 1
             self._provider_status = {
                 self._default_provider: ProviderStatus.READY,
             }
@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import typing
+from collections.abc import Iterator
+
+from openfeature.evaluation_context import EvaluationContext
+from openfeature.event import ProviderEventDetails
+from openfeature.exception import ErrorCode, ParseError
+from openfeature.provider import Metadata
+from openfeature.provider.in_memory_provider import InMemoryFlag, InMemoryProvider
+
+__all__ = ["FileProvider"]
+
+logger = logging.getLogger("openfeature")
+
+_CHUNK_SIZE = 64 * 1024
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class FileProvider(InMemoryProvider):
+    """
+    Serves flags defined in a local JSON file, which is polled for changes.
+
+    The file holds a ``flags`` object mapping flag keys to definitions, with
+    ``variants``, a ``defaultVariant``, and optionally a ``state`` and
+    ``metadata``::
+
+        {
+          "flags": {
+            "v2_enabled": {
+              "variants": {"on": true, "off": false},
+              "defaultVariant": "on",
+              "state": "ENABLED"
+            }
+          }
+        }
+
+    The file is loaded when the provider is initialized, then reloaded when its
+    modification time, inode or size changes, checked every ``poll_interval``
+    seconds. It is parsed one flag definition at a time, so that large files
+    are never held in memory as a whole, and only the flags whose definition
+    changed are rebuilt. Every reload swaps in a new snapshot of the flags and
+    emits a PROVIDER_CONFIGURATION_CHANGED event listing the flags that
+    changed. A file that cannot be loaded leaves the flags unchanged, and emits
+    a PROVIDER_ERROR event, once until a valid file is loaded again, which
+    emits a PROVIDER_READY event. Polling starts even if the file cannot be
+    loaded when the provider is initialized, so that the provider becomes ready
+    once a valid file appears.
+    """
+
+    def __init__(
+        self, path: str | os.PathLike[str], poll_interval: float = 5.0
+    ) -> None:
+        super().__init__({})
+        self.path = path
+        self.poll_interval = poll_interval
+        # the flags built from the file, with the digests of their definitions
+        self._built_flags: dict[str, tuple[bytes, InMemoryFlag[typing.Any]]] = {}
+        self._file_id: tuple[int, int, int] | None = None
+        # the file that failed to load last, with the message of its error
+        self._failed_load: tuple[tuple[int, int, int], str | None] | None = None
+        self._reload_failed = False
+        self._stopped = threading.Event()
+        self._poller: threading.Thread | None = None
+
+    def get_metadata(self) -> Metadata:
+        return Metadata(name="File Provider")
+
+    def initialize(self, evaluation_context: EvaluationContext) -> None:
+        try:
+            self.reload()
+        except ParseError:
+            self._reload_failed = True
+            raise
+        finally:
+            self._stopped.clear()
+            self._poller = threading.Thread(
+                target=self._poll, name="openfeature-file-provider", daemon=True
+            )
+            self._poller.start()
+
+    def shutdown(self) -> None:
+        self._stopped.set()
+        if self._poller is not None:
+            self._poller.join()
+            self._poller = None
+
+    def reload(self) -> list[str]:
+        """
+        Loads the file if it changed since it was last loaded.
+
+        :return: the keys of the flags that changed, sorted
+        :raises ParseError: if the file cannot be read or parsed
+        """
+        with self._update_lock:
+            try:
+                stat = os.stat(self.path)
+            except OSError as e:
+                raise ParseError(f"Cannot read flags file: {e}") from e
+            file_id = (stat.st_mtime_ns, stat.st_ino, stat.st_size)
+            if file_id == self._file_id:
+                return []
+            if self._failed_load is not None and self._failed_load[0] == file_id:
+                # an invalid file is only parsed again once it changes
+                raise ParseError(self._failed_load[1])
+
+            try:
+                built_flags = self._load()
+            except ParseError as e:
+                self._failed_load = (file_id, e.error_message)
+                raise
+            self._failed_load = None
+            flags_changed = self._swap_flags(
+                {flag_key: flag for flag_key, (_, flag) in built_flags.items()}
+            )
+            self._built_flags = built_flags
+            self._file_id = file_id
+        self._emit_flags_changed(flags_changed)
+        return flags_changed
+
+    def _load(self) -> dict[str, tuple[bytes, InMemoryFlag[typing.Any]]]:
+        built_flags: dict[str, tuple[bytes, InMemoryFlag[typing.Any]]] = {}
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                for flag_key, definition, source in _iter_flag_definitions(file):
+                    digest = hashlib.blake2b(source.encode(), digest_size=16).digest()
+                    built_flag = self._built_flags.get(flag_key)
+                    if built_flag is None or built_flag[0] != digest:
+                        built_flag = (digest, _create_flag(flag_key, definition))
+                    built_flags[flag_key] = built_flag
+        except (OSError, ValueError) as e:
+            raise ParseError(f"Cannot load flags file: {e}") from e
+        return built_flags
+
+    def _poll(self) -> None:
+        while not self._stopped.wait(self.poll_interval):
+            try:
+                self.reload()
+            except ParseError as e:
+                # the error is only reported when the file stops being valid
+                if self._reload_failed:
+                    continue
+                logger.exception("Exception when reloading the flags file")
+                self._reload_failed = True
+                self.emit_provider_error(
+                    ProviderEventDetails(
+                        message=e.error_message, error_code=ErrorCode.PARSE_ERROR
+                    )
+                )
+                continue
+            if self._reload_failed:
+                self._reload_failed = False
+                self.emit_provider_ready(ProviderEventDetails())
+
+
+def _create_flag(flag_key: str, definition: typing.Any) -> InMemoryFlag[typing.Any]:
+    try:
+        variants = definition["variants"]
+        default_variant = definition["defaultVariant"]
+        if default_variant not in variants:
+            raise ValueError(f"unknown default variant {default_variant!r}")
+        return InMemoryFlag(
+            default_variant=default_variant,
+            variants=dict(variants),
+            flag_metadata=definition.get("metadata", {}),
+            state=InMemoryFlag.State(definition.get("state", "ENABLED")),
+        )
+    except (KeyError, TypeError, ValueError, AttributeError) as e:
+        raise ValueError(f"invalid definition of flag {flag_key!r}: {e}") from e
+
+
+class _JsonStream:
+    """Decodes JSON values one at a time from a file read in chunks."""
+
+    def __init__(self, file: typing.TextIO) -> None:
+        self._file = file
+        self._buffer = ""
+        self._position = 0
+        self._eof = False
+
+    def _read(self, size: int = 0) -> bool:
+        if self._eof:
+            return False
+        chunk = self._file.read(max(size, _CHUNK_SIZE))
+        if not chunk:
+            self._eof = True
+            return False
+        # drop what was consumed already, so the buffer stays small
+        self._buffer = self._buffer[self._position :] + chunk
+        self._position = 0
+        return True
+
+    def peek(self) -> str:
+        """Returns the next non-whitespace character, or "" at the end of the file."""
+        while True:
+            whitespace = _WHITESPACE.match(self._buffer, self._position)
+            self._position = whitespace.end() if whitespace else self._position
+            if self._position < len(self._buffer) or not self._read():
+                return self._buffer[self._position : self._position + 1]
+
+    def expect(self, character: str) -> None:
+        if self.peek() != character:
+            raise ValueError(f"expected {character!r} at offset {self._position}")
+        self._position += 1
+
+    def value(self) -> tuple[typing.Any, str]:
+        """
+        Decodes the next value, and returns it with its source. A value that is
+        not buffered entirely is decoded again once more of it is read, so as
+        much as is buffered already is read every time, doubling the part of the
+        value buffered: the decoding time stays linear in the size of the value.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                if self._read(len(self._buffer) - self._position):
+                    continue
+                raise
+            # a number at the end of the buffer may continue in the next chunk
+            if end == len(self._buffer) and self._read():
+                continue
+            source = self._buffer[self._position : end]
+            self._position = end
+            return value, source
+
+
+_decoder = json.JSONDecoder()
+
+
+def _iter_object(stream: _JsonStream) -> Iterator[str]:
+    """Iterates over the keys of an object, leaving their values to be decoded."""
+    stream.expect("{")
+    if stream.peek() == "}":
+        stream.expect("}")
+        return
+    while True:
+        key, _ = stream.value()
+        if not isinstance(key, str):
+            raise ValueError("expected an object key")
+        stream.expect(":")
+        yield key
+        if stream.peek() == ",":
+            stream.expect(",")
+            continue
+        stream.expect("}")
+        return
+
+
+def _iter_flag_definitions(
+    file: typing.TextIO,
+) -> Iterator[tuple[str, typing.Any, str]]:
+    stream = _JsonStream(file)
+    for key in _iter_object(stream):
+        if key != "flags":
+            stream.value()
+            continue
+        for flag_key in _iter_object(stream):
+            definition, source = stream.value()
+            yield flag_key, definition, source
+    if stream.peek():
+        raise ValueError("unexpected data after the flags object")
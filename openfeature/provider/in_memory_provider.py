@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import threading
 import typing
 from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass, field
 
 from openfeature._backports.strenum import StrEnum
 from openfeature.evaluation_context import EvaluationContext, EvaluationContextAttribute
+from openfeature.event import ProviderEventDetails
 from openfeature.exception import ErrorCode
 from openfeature.flag_evaluation import FlagResolutionDetails, Reason
+from openfeature.immutable_dict.mapping_proxy_type import MappingProxyType
 from openfeature.provider import AbstractProvider, Metadata
 from openfeature.track import TrackingEventDetails
 
@@ -74,14 +77,17 @@ V = typing.TypeVar("V")
 
 
 class InMemoryProvider(AbstractProvider):
-    _flags: FlagStorage
+    # an immutable snapshot, swapped as a whole on updates, so that resolving
+    # flags never takes a lock
+    _flags: Mapping[str, InMemoryFlag[typing.Any]]
     _tracking_events: TrackingStorage
 
     # tracking_events defaults to an empty dict
     def __init__(
         self, flags: FlagStorage, tracking_events: TrackingStorage | None = None
     ) -> None:
-        self._flags = flags.copy()
+        self._flags = MappingProxyType(flags)
+        self._update_lock = threading.Lock()
         if tracking_events is not None:
             self._tracking_events = tracking_events.copy()
         else:
@@ -93,6 +99,51 @@ class InMemoryProvider(AbstractProvider):
     def get_provider_hooks(self) -> list[Hook]:
         return []
 
+    def update_flags(self, flags: Mapping[str, InMemoryFlag[typing.Any]]) -> list[str]:
+        """
+        Adds or replaces flags, keeping the other ones, and emits a
+        PROVIDER_CONFIGURATION_CHANGED event listing the flags that changed.
+
+        :param flags: the flags to add or replace, by flag key
+        :return: the keys of the flags that changed, sorted
+        """
+        with self._update_lock:
+            flags_changed = self._swap_flags({**self._flags, **flags})
+        self._emit_flags_changed(flags_changed)
+        return flags_changed
+
+    def replace_flags(self, flags: Mapping[str, InMemoryFlag[typing.Any]]) -> list[str]:
+        """
+        Replaces all the flags, and emits a PROVIDER_CONFIGURATION_CHANGED event
+        listing the flags that were added, changed or removed.
+
+        :param flags: the new flags, by flag key
+        :return: the keys of the flags that changed, sorted
+        """
+        with self._update_lock:
+            flags_changed = self._swap_flags(dict(flags))
+        self._emit_flags_changed(flags_changed)
+        return flags_changed
+
+    def _swap_flags(self, flags: FlagStorage) -> list[str]:
+        previous = self._flags
+        flags_changed = sorted(
+            flag_key
+            for flag_key in previous.keys() | flags.keys()
+            if previous.get(flag_key) != flags.get(flag_key)
+        )
+        if flags_changed:
+            self._flags = MappingProxyType(flags)
+        return flags_changed
+
+    def _emit_flags_changed(self, flags_changed: list[str]) -> None:
+        # emitted once the update lock is released, so that handlers can update
+        # flags in turn
+        if flags_changed:
+            self.emit_provider_configuration_changed(
+                ProviderEventDetails(flags_changed=flags_changed)
+            )
+
     def resolve_boolean_details(
         self,
         flag_key: str,
@@ -15,6 +15,7 @@ __all__ = [
     "TelemetryBodyField",
     "TelemetryFlagMetadata",
     "create_evaluation_event",
+    "get_context_id",
 ]
 
 FLAG_EVALUATION_EVENT_NAME = "feature_flag.evaluation"
@@ -29,6 +30,19 @@ class EvaluationEvent(typing.Generic[T_co]):
     body: Mapping[TelemetryBodyField, T_co]
 
 
+def get_context_id(
+    hook_context: HookContext, details: FlagEvaluationDetails[typing.Any]
+) -> str | None:
+    """
+    Returns the id of the context a flag was evaluated for: the context id in the
+    flag metadata if the provider set one, the targeting key otherwise.
+    """
+    context_id = details.flag_metadata.get(
+        TelemetryFlagMetadata.CONTEXT_ID, hook_context.evaluation_context.targeting_key
+    )
+    return typing.cast("str | None", context_id)
+
+
 def create_evaluation_event(
     hook_context: HookContext, details: FlagEvaluationDetails[T_co]
 ) -> EvaluationEvent[T_co]:
@@ -45,11 +59,8 @@ def create_evaluation_event(
     else:
         body[TelemetryBodyField.VALUE] = details.value
 
-    context_id = details.flag_metadata.get(
-        TelemetryFlagMetadata.CONTEXT_ID, hook_context.evaluation_context.targeting_key
-    )
-    if context_id:
-        attributes[TelemetryAttribute.CONTEXT_ID] = typing.cast("str", context_id)
+    if context_id := get_context_id(hook_context, details):
+        attributes[TelemetryAttribute.CONTEXT_ID] = context_id
 
     if set_id := details.flag_metadata.get(TelemetryFlagMetadata.FLAG_SET_ID):
         attributes[TelemetryAttribute.SET_ID] = typing.cast("str", set_id)
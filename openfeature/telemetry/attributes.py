@@ -17,3 +17,6 @@ class TelemetryAttribute(StrEnum):
     SET_ID = "feature_flag.set.id"
     VARIANT = "feature_flag.variant"
     VERSION = "feature_flag.version"
+    # not part of the semantic conventions: the number of evaluations a sampled
+    # event stands for
+    SAMPLING_WEIGHT = "feature_flag.sampling.weight"
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import typing
+import weakref
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from openfeature.exception import GeneralError
+from openfeature.telemetry import EvaluationEvent
+
+__all__ = [
+    "BatchingEventExporter",
+    "EventSink",
+    "ExporterStatistics",
+    "InMemoryEventSink",
+    "JsonLinesEventSink",
+    "shutdown_event_exporters",
+]
+
+logger = logging.getLogger("openfeature")
+
+_exporters: weakref.WeakSet[BatchingEventExporter] = weakref.WeakSet()
+_exporters_lock = threading.Lock()
+
+
+class EventSink(typing.Protocol):
+    def export(self, events: Sequence[EvaluationEvent[typing.Any]]) -> None:
+        """Ships a batch of events. Exceptions are logged and the batch dropped."""
+        ...
+
+    def shutdown(self) -> None: ...
+
+
+class InMemoryEventSink:
+    """Keeps the exported events in a list, for tests."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.events: list[EvaluationEvent[typing.Any]] = []
+        self.batches = 0
+
+    def export(self, events: Sequence[EvaluationEvent[typing.Any]]) -> None:
+        with self._lock:
+            self.events.extend(events)
+            self.batches += 1
+
+    def shutdown(self) -> None:
+        pass
+
+
+class JsonLinesEventSink:
+    """Appends the exported events to a file, one JSON object per line."""
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = path
+
+    def export(self, events: Sequence[EvaluationEvent[typing.Any]]) -> None:
+        lines = [
+            json.dumps(
+                {
+                    "name": event.name,
+                    "attributes": event.attributes,
+                    "body": event.body,
+                },
+                default=str,
+            )
+            + "\n"
+            for event in events
+        ]
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.writelines(lines)
+
+    def shutdown(self) -> None:
+        pass
+
+
+@dataclass(frozen=True)
+class ExporterStatistics:
+    exported: int = 0
+    # events overwritten in the buffer before they could be exported
+    dropped: int = 0
+    # events of batches the sink failed to export
+    failed: int = 0
+    buffered: int = 0
+
+
+class BatchingEventExporter:
+    """
+    Buffers evaluation events and ships them to a sink in batches, from a
+    background thread.
+
+    Events are kept in a ring buffer of ``buffer_size`` events: exporting never
+    blocks, and once the buffer is full the oldest event is overwritten and
+    counted as dropped. A batch is shipped as soon as ``batch_size`` events are
+    buffered, and at least every ``flush_interval`` seconds otherwise.
+    """
+
+    def __init__(
+        self,
+        sink: EventSink,
+        buffer_size: int = 10_000,
+        batch_size: int = 512,
+        flush_interval: float = 5.0,
+    ) -> None:
+        if batch_size < 1 or buffer_size < batch_size:
+            raise GeneralError(
+                error_message="batch_size must be at least 1 and at most buffer_size"
+            )
+        if flush_interval <= 0:
+            raise GeneralError(error_message="flush_interval must be positive")
+        self.sink = sink
+        self.buffer_size = buffer_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._buffer: deque[EvaluationEvent[typing.Any]] = deque(maxlen=buffer_size)
+        self._condition = threading.Condition()
+        self._worker: threading.Thread | None = None
+        self._in_flight = 0
+        self._flush_requested = False
+        self._closed = False
+        self._exported = 0
+        self._dropped = 0
+        self._failed = 0
+        with _exporters_lock:
+            _exporters.add(self)
+
+    def export(self, event: EvaluationEvent[typing.Any]) -> None:
+        with self._condition:
+            if self._closed:
+                self._dropped += 1
+                return
+            if len(self._buffer) == self.buffer_size:
+                self._dropped += 1
+            self._buffer.append(event)
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="openfeature-event-exporter", daemon=True
+                )
+                self._worker.start()
+            if len(self._buffer) >= self.batch_size:
+                self._condition.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Ships the buffered events without waiting for the flush interval.
+
+        :param timeout: the maximum number of seconds to wait, or None to wait
+        for as long as it takes
+        :return: True if every buffered event was handed to the sink
+        """
+        with self._condition:
+            if self._worker is None:
+                return not self._buffer
+            self._flush_requested = True
+            self._condition.notify_all()
+            return self._condition.wait_for(
+                lambda: not self._buffer and not self._in_flight, timeout
+            )
+
+    def shutdown(self, timeout: float | None = None) -> bool:
+        """
+        Flushes the buffered events, then stops the exporter and its sink.
+
+        :param timeout: the maximum number of seconds to wait for the flush, or
+        None to wait for as long as it takes
+        :return: True if every buffered event was handed to the sink
+        """
+        flushed = self.flush(timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self.sink.shutdown()
+        return flushed
+
+    def get_statistics(self) -> ExporterStatistics:
+        with self._condition:
+            return ExporterStatistics(
+                exported=self._exported,
+                dropped=self._dropped,
+                failed=self._failed,
+                buffered=len(self._buffer),
+            )
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: (
+                        len(self._buffer) >= self.batch_size
+                        or self._flush_requested
+                        or self._closed
+                    ),
+                    self.flush_interval,
+                )
+                if self._closed and not self._buffer:
+                    return
+                batch = [
+                    self._buffer.popleft()
+                    for _ in range(min(self.batch_size, len(self._buffer)))
+                ]
+                if not self._buffer:
+                    self._flush_requested = False
+                self._in_flight = len(batch)
+
+            exported = self._export(batch) if batch else True
+
+            with self._condition:
+                if exported:
+                    self._exported += len(batch)
+                else:
+                    self._failed += len(batch)
+                self._in_flight = 0
+                self._condition.notify_all()
+
+    def _export(self, batch: list[EvaluationEvent[typing.Any]]) -> bool:
+        try:
+            self.sink.export(batch)
+        except Exception:
+            logger.exception("Exception when exporting evaluation events")
+            return False
+        return True
+
+
+def shutdown_event_exporters(timeout: float | None = None) -> bool:
+    """
+    Shuts down every batching event exporter. The events still buffered once
+    the timeout expires are logged.
+
+    :param timeout: the maximum number of seconds to wait for each exporter to
+    flush, or None to wait for as long as it takes
+    :return: True if every buffered event was handed to the sinks
+    """
+    with _exporters_lock:
+        exporters = list(_exporters)
+    flushed = True
+    # shut every exporter down, even once one of them timed out
+    for exporter in exporters:
+        if exporter.shutdown(timeout):
+            continue
+        flushed = False
+        logger.warning(
+            "%d evaluation events were still buffered by an exporter after %s seconds",
+            exporter.get_statistics().buffered,
+            timeout,
+        )
+    return flushed
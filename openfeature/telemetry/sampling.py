@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import hashlib
+import random
+import typing
+from collections.abc import Mapping
+
+from openfeature.exception import GeneralError
+from openfeature.flag_evaluation import FlagEvaluationDetails, Reason
+from openfeature.hook import HookContext
+from openfeature.telemetry import (
+    EvaluationEvent,
+    TelemetryAttribute,
+    create_evaluation_event,
+    get_context_id,
+)
+
+__all__ = ["EvaluationEventSampler"]
+
+T_co = typing.TypeVar("T_co", covariant=True)
+
+_HASH_RANGE = float(2**64)
+
+
+class EvaluationEventSampler:
+    """
+    Decides which evaluations get an evaluation event.
+
+    The decision is a hash of the context id, or of the targeting key, so the
+    evaluations of a given context are either all sampled or none of them; an
+    evaluation without either is sampled at random. Flags can have their own
+    rate, and evaluations that ended in an error are always kept. Sampled events
+    record the number of evaluations they stand for, the inverse of the rate,
+    in the SAMPLING_WEIGHT attribute.
+    """
+
+    def __init__(
+        self,
+        rate: float = 1.0,
+        flag_rates: Mapping[str, float] | None = None,
+        keep_errors: bool = True,
+    ) -> None:
+        flag_rates = dict(flag_rates or {})
+        if not all(0 <= r <= 1 for r in (rate, *flag_rates.values())):
+            raise GeneralError(error_message="sampling rates must be between 0 and 1")
+        self.rate = rate
+        self.flag_rates = flag_rates
+        self.keep_errors = keep_errors
+
+    def get_weight(
+        self, hook_context: HookContext, details: FlagEvaluationDetails[typing.Any]
+    ) -> float | None:
+        """
+        Returns the sampling weight of an evaluation, or None if no event should
+        be created for it.
+        """
+        if self.keep_errors and details.reason == Reason.ERROR:
+            return 1.0
+        rate = self.flag_rates.get(details.flag_key, self.rate)
+        if rate >= 1:
+            return 1.0
+        if rate <= 0:
+            return None
+
+        if context_id := get_context_id(hook_context, details):
+            digest = hashlib.blake2b(context_id.encode(), digest_size=8).digest()
+            position = int.from_bytes(digest, "big") / _HASH_RANGE
+        else:
+            position = random.random()  # noqa: S311
+        return 1 / rate if position < rate else None
+
+    def create_evaluation_event(
+        self, hook_context: HookContext, details: FlagEvaluationDetails[T_co]
+    ) -> EvaluationEvent[T_co] | None:
+        """
+        Returns the evaluation event of a sampled evaluation, with its sampling
+        weight, or None if the evaluation is not sampled.
+        """
+        weight = self.get_weight(hook_context, details)
+        if weight is None:
+            return None
+        event = create_evaluation_event(hook_context, details)
+        return EvaluationEvent(
+            name=event.name,
+            attributes={
+                **event.attributes,
+                TelemetryAttribute.SAMPLING_WEIGHT: str(weight),
+            },
+            body=event.body,
+        )
@@ -9,6 +9,8 @@ TrackingValue: typing.TypeAlias = (
 
 
 class TrackingEventDetails:
+    __slots__ = ("attributes", "value")
+
     value: float | None
     attributes: dict[str, TrackingValue]
 
@@ -4,6 +4,10 @@ from openfeature.evaluation_context import EvaluationContext
 from openfeature.transaction_context.context_var_transaction_context_propagator import (
     ContextVarsTransactionContextPropagator,
 )
+from openfeature.transaction_context.evaluation_scope import (
+    EvaluationScope,
+    get_evaluation_scope,
+)
 from openfeature.transaction_context.no_op_transaction_context_propagator import (
     NoOpTransactionContextPropagator,
 )
@@ -13,8 +17,10 @@ from openfeature.transaction_context.transaction_context_propagator import (
 
 __all__ = [
     "ContextVarsTransactionContextPropagator",
+    "EvaluationScope",
     "TransactionContextPropagator",
     "clear_transaction_context_propagator",
+    "get_evaluation_scope",
     "get_transaction_context",
     "set_transaction_context",
     "set_transaction_context_propagator",
@@ -23,15 +29,23 @@ __all__ = [
 _evaluation_transaction_context_propagator: TransactionContextPropagator = (
     NoOpTransactionContextPropagator()
 )
+_transaction_context_version = 0
+# the version the propagator was last set at
+_propagator_version = 0
+# the transaction context set last, with the version it was set at
+_last_set_transaction_context: tuple[int, EvaluationContext | None] = (0, None)
 _propagator_lock = threading.RLock()
 
 
 def set_transaction_context_propagator(
     transaction_context_propagator: TransactionContextPropagator,
 ) -> None:
-    global _evaluation_transaction_context_propagator
+    global _evaluation_transaction_context_propagator, _transaction_context_version
+    global _propagator_version
     with _propagator_lock:
         _evaluation_transaction_context_propagator = transaction_context_propagator
+        _transaction_context_version += 1
+        _propagator_version = _transaction_context_version
 
 
 def clear_transaction_context_propagator() -> None:
@@ -44,6 +58,40 @@ def get_transaction_context() -> EvaluationContext:
 
 
 def set_transaction_context(evaluation_context: EvaluationContext) -> None:
+    global _transaction_context_version, _last_set_transaction_context
     with _propagator_lock:
         propagator = _evaluation_transaction_context_propagator
+        _transaction_context_version += 1
+        _last_set_transaction_context = (
+            _transaction_context_version,
+            evaluation_context,
+        )
     propagator.set_transaction_context(evaluation_context)
+
+
+def get_transaction_context_version() -> int:
+    """
+    Returns a counter that changes every time a transaction context or propagator
+    is set. Clients use it to detect when their cached merged context is outdated.
+    """
+    return _transaction_context_version
+
+
+def is_transaction_context_outdated(
+    transaction_context: EvaluationContext | None, version: int
+) -> bool:
+    """
+    Tells whether what was derived from a transaction context at a version is
+    outdated: the propagator was set since, or the context itself was set again
+    since, as long as it is still the last one set. Clients use it to keep what
+    they derived from several transaction contexts at once.
+
+    :param transaction_context: the transaction context something was derived from
+    :param version: the version returned by get_transaction_context_version()
+    before the transaction context was read
+    :return: True if the transaction context must be read again
+    """
+    if _propagator_version > version:
+        return True
+    last_version, last_context = _last_set_transaction_context
+    return last_context is transaction_context and last_version > version
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import threading
+import typing
+from contextvars import ContextVar, Token
+from dataclasses import replace
+from types import TracebackType
+
+from openfeature.evaluation_context import EvaluationContext
+from openfeature.flag_evaluation import FlagEvaluationDetails, Reason
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from openfeature.cache import CacheKey
+
+_current_scope: ContextVar[EvaluationScope | None] = ContextVar(
+    "evaluation_scope", default=None
+)
+
+
+class EvaluationScope:
+    """
+    Memoizes flag evaluation results for the duration of a unit of work, such as
+    an HTTP request.
+
+    While the scope is entered, the first successful result of a flag for a
+    given domain, flag type and evaluation context is reused by every later
+    evaluation, so code paths reading the same flag see the same value even if
+    the provider configuration changes in between. Hooks still run for every
+    evaluation, and reused results report Reason.CACHED.
+
+    The scope is stored in a context variable, so it follows the thread or
+    asyncio task that entered it, and tasks created inside of it. If a
+    transaction context is given, it is set while the scope is entered and the
+    previous one is restored on exit.
+    """
+
+    def __init__(self, transaction_context: EvaluationContext | None = None) -> None:
+        self.transaction_context = transaction_context
+        self._lock = threading.Lock()
+        self._results: dict[CacheKey, FlagEvaluationDetails[typing.Any]] = {}
+        self._tokens: list[
+            tuple[Token[EvaluationScope | None], EvaluationContext | None]
+        ] = []
+
+    def __enter__(self) -> EvaluationScope:
+        # the package imports this module, so its functions are imported lazily
+        from openfeature.transaction_context import (  # noqa: PLC0415
+            get_transaction_context,
+            set_transaction_context,
+        )
+
+        previous_context = None
+        if self.transaction_context is not None:
+            previous_context = get_transaction_context()
+            set_transaction_context(self.transaction_context)
+        self._tokens.append((_current_scope.set(self), previous_context))
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        from openfeature.transaction_context import (  # noqa: PLC0415
+            set_transaction_context,
+        )
+
+        token, previous_context = self._tokens.pop()
+        _current_scope.reset(token)
+        if previous_context is not None:
+            set_transaction_context(previous_context)
+
+    async def __aenter__(self) -> EvaluationScope:
+        return self.__enter__()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.__exit__(exc_type, exc_value, traceback)
+
+    def get(self, key: CacheKey) -> FlagEvaluationDetails[typing.Any] | None:
+        with self._lock:
+            details = self._results.get(key)
+        if details is None:
+            return None
+        return replace(details, reason=Reason.CACHED)
+
+    def set(self, key: CacheKey, details: FlagEvaluationDetails[typing.Any]) -> None:
+        """
+        Stores the details of a successful evaluation, unless the scope already
+        holds a result for the key. Errors and evaluations that fell back to the
+        default value are not stored, since the default value may differ
+        between calls.
+        """
+        if details.error_code or details.reason in (Reason.ERROR, Reason.DEFAULT):
+            return
+        with self._lock:
+            self._results.setdefault(key, replace(details))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+
+
+def get_evaluation_scope() -> EvaluationScope | None:
+    """Returns the innermost evaluation scope entered in the current context."""
+    return _current_scope.get()
@@ -0,0 +1,149 @@
+import pytest
+
+from openfeature.cache import CacheStatistics, EvaluationCache
+from openfeature.exception import ErrorCode, GeneralError
+from openfeature.flag_evaluation import FlagEvaluationDetails, FlagType, Reason
+from openfeature.provider.no_op_provider import NoOpProvider
+
+PROVIDER = NoOpProvider()
+
+
+def key(flag_key, domain=None, fingerprint="fingerprint"):
+    return (domain, flag_key, FlagType.BOOLEAN, fingerprint)
+
+
+def details(flag_key, reason=Reason.STATIC, error_code=None):
+    return FlagEvaluationDetails(
+        flag_key=flag_key, value=True, reason=reason, error_code=error_code
+    )
+
+
+def test_should_return_cached_details_with_cached_reason():
+    # Given
+    cache = EvaluationCache()
+    cache.set(key("flag"), PROVIDER, details("flag"))
+
+    # When
+    cached = cache.get(key("flag"), PROVIDER)
+
+    # Then
+    assert cached == FlagEvaluationDetails(
+        flag_key="flag", value=True, reason=Reason.CACHED
+    )
+    assert cache.get(key("flag", fingerprint="other"), PROVIDER) is None
+    assert cache.get_statistics() == CacheStatistics(hits=1, misses=1, size=1)
+
+
+def test_should_not_cache_errors_nor_default_values():
+    # Given
+    cache = EvaluationCache()
+
+    # When
+    cache.set(key("error"), PROVIDER, details("error", Reason.ERROR, ErrorCode.GENERAL))
+    cache.set(key("default"), PROVIDER, details("default", Reason.DEFAULT))
+
+    # Then
+    assert cache.get(key("error"), PROVIDER) is None
+    assert cache.get(key("default"), PROVIDER) is None
+
+
+@pytest.mark.parametrize(
+    "invalidate",
+    (
+        pytest.param(lambda cache: cache.invalidate(None, ["other"]), id="invalidate"),
+        pytest.param(lambda cache: cache.clear(), id="clear"),
+    ),
+)
+def test_should_not_store_details_resolved_before_an_invalidation(invalidate):
+    # Given
+    cache = EvaluationCache()
+    generation = cache.get_generation()
+
+    # When
+    invalidate(cache)
+    cache.set(key("flag"), PROVIDER, details("flag"), generation)
+
+    # Then
+    assert cache.get(key("flag"), PROVIDER) is None
+    cache.set(key("flag"), PROVIDER, details("flag"), cache.get_generation())
+    assert cache.get(key("flag"), PROVIDER) is not None
+
+
+def test_should_evict_least_recently_used_entry():
+    # Given
+    cache = EvaluationCache(max_size=2)
+    cache.set(key("a"), PROVIDER, details("a"))
+    cache.set(key("b"), PROVIDER, details("b"))
+
+    # When
+    cache.get(key("a"), PROVIDER)
+    cache.set(key("c"), PROVIDER, details("c"))
+
+    # Then
+    assert cache.get(key("a"), PROVIDER) is not None
+    assert cache.get(key("b"), PROVIDER) is None
+    assert cache.get(key("c"), PROVIDER) is not None
+
+
+def test_should_expire_entries_after_ttl():
+    # Given
+    now = [0.0]
+    cache = EvaluationCache(ttl=10, clock=lambda: now[0])
+    cache.set(key("flag"), PROVIDER, details("flag"))
+
+    # When
+    now[0] = 9.9
+    before_expiry = cache.get(key("flag"), PROVIDER)
+    now[0] = 10.0
+    after_expiry = cache.get(key("flag"), PROVIDER)
+
+    # Then
+    assert before_expiry is not None
+    assert after_expiry is None
+    assert cache.get_statistics().size == 0
+
+
+def test_should_treat_entries_of_another_provider_as_missing():
+    cache = EvaluationCache()
+    cache.set(key("flag"), PROVIDER, details("flag"))
+
+    assert cache.get(key("flag"), NoOpProvider()) is None
+
+
+def test_should_invalidate_entries_by_domain_and_flag_key():
+    # Given
+    cache = EvaluationCache()
+    for domain in (None, "other"):
+        for flag_key in ("a", "b"):
+            cache.set(key(flag_key, domain), PROVIDER, details(flag_key))
+
+    # When
+    cache.invalidate(None, ["a"])
+
+    # Then
+    assert cache.get(key("a"), PROVIDER) is None
+    assert cache.get(key("b"), PROVIDER) is not None
+    assert cache.get(key("a", "other"), PROVIDER) is not None
+
+    # When
+    cache.invalidate("other")
+
+    # Then
+    assert cache.get_statistics().size == 1
+
+
+def test_should_reset_statistics():
+    cache = EvaluationCache()
+    cache.get(key("flag"), PROVIDER)
+
+    cache.reset_statistics()
+
+    assert cache.get_statistics() == CacheStatistics()
+
+
+@pytest.mark.parametrize(
+    "kwargs", ({"max_size": 0}, {"ttl": 0}), ids=("max_size", "ttl")
+)
+def test_should_reject_invalid_bounds(kwargs):
+    with pytest.raises(GeneralError):
+        EvaluationCache(**kwargs)
@@ -1,4 +1,15 @@
-from openfeature.evaluation_context import EvaluationContext
+import json
+import pickle
+from dataclasses import asdict
+from datetime import datetime, timezone
+
+import pytest
+
+from openfeature.evaluation_context import (
+    EvaluationContext,
+    FrozenEvaluationContext,
+    _MemoizedAttributes,
+)
 
 
 def test_empty_evaluation_context_can_be_merged_with_non_empty_context():
@@ -45,3 +56,157 @@ def test_second_targeting_key_overwrites_first():
 
     # Then
     assert merged_context.targeting_key == second_context.targeting_key
+
+
+def test_merged_attributes_follow_the_override_order_of_eager_merging():
+    # Given
+    contexts = [
+        EvaluationContext("api", {"a": 1, "b": 1, "shared": "api"}),
+        EvaluationContext(None, {"c": 2, "shared": "transaction"}),
+        EvaluationContext("client", {"b": 3}),
+        EvaluationContext("", {"d": 4, "shared": "invocation"}),
+    ]
+    expected: dict = {}
+    for context in contexts:
+        expected = {**expected, **context.attributes}
+
+    # When
+    merged = contexts[0]
+    for context in contexts[1:]:
+        merged = merged.merge(context)
+
+    # Then
+    assert merged.targeting_key == "client"
+    assert merged.attributes == expected
+    assert list(merged.attributes) == list(expected)
+    assert merged.attributes["shared"] == "invocation"
+    assert merged.attributes.get("missing") is None
+    assert "c" in merged.attributes
+    assert "missing" not in merged.attributes
+    assert merged == EvaluationContext("client", expected)
+
+
+def test_merged_attributes_behave_like_a_dict():
+    # Given
+    first = EvaluationContext("user", {"a": 1})
+    second = EvaluationContext(attributes={"b": 2})
+
+    # When
+    merged = first.merge(second).merge(EvaluationContext(attributes={"c": 3}))
+
+    # Then
+    attributes = merged.attributes
+    assert isinstance(attributes, dict)
+    assert json.dumps(attributes) == '{"a": 1, "b": 2, "c": 3}'
+    assert json.dumps(asdict(merged)) == (
+        '{"targeting_key": "user", "attributes": {"a": 1, "b": 2, "c": 3}}'
+    )
+    assert attributes | {"d": 4} == {"a": 1, "b": 2, "c": 3, "d": 4}
+    attributes["a"] = 2  # type: ignore[index]
+    assert merged.attributes["a"] == 2
+    assert repr(attributes) == "{'a': 2, 'b': 2, 'c': 3}"
+
+
+def test_merged_attributes_are_a_snapshot_of_the_merged_contexts():
+    # Given
+    attributes = {"a": 1}
+    merged = EvaluationContext(attributes=attributes).merge(EvaluationContext())
+
+    # When
+    attributes["a"] = 2
+    merged.attributes["b"] = 3  # type: ignore[index]
+
+    # Then
+    assert merged.attributes == {"a": 1, "b": 3}
+    assert attributes == {"a": 2}
+
+
+def test_fingerprint_of_memoized_attributes_is_memoized_until_modified():
+    # Given
+    context = EvaluationContext("user", _MemoizedAttributes({"a": 1, "b": 2}))
+    fingerprint = context.fingerprint()
+
+    # When
+    copied = EvaluationContext("user", context.attributes.copy())
+    context.attributes["b"] = 3  # type: ignore[index]
+
+    # Then
+    assert copied.attributes._canonical is not None  # type: ignore[attr-defined]
+    assert copied.fingerprint() == fingerprint
+    assert context.fingerprint() != fingerprint
+    assert (
+        context.fingerprint()
+        == EvaluationContext("user", {"a": 1, "b": 3}).fingerprint()
+    )
+
+
+def test_fingerprint_is_stable_across_attribute_order_and_container_types():
+    # Given
+    created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    first = EvaluationContext(
+        "user", {"a": 1, "tags": ["x", "y"], "nested": {"b": True, "c": created_at}}
+    )
+    second = EvaluationContext(
+        "user", {"nested": {"c": created_at, "b": True}, "tags": ("x", "y"), "a": 1}
+    )
+
+    # Then
+    assert first.fingerprint() == second.fingerprint()
+    assert first.fingerprint() == first.merge(EvaluationContext()).fingerprint()
+
+
+@pytest.mark.parametrize(
+    "other",
+    (
+        EvaluationContext("other-user", {"a": 1}),
+        EvaluationContext(None, {"a": 1}),
+        EvaluationContext("user", {"a": True}),
+        EvaluationContext("user", {"a": 1.0}),
+        EvaluationContext("user", {"a": "1"}),
+        EvaluationContext("user", {"a": [1]}),
+        EvaluationContext("user", {"a": 1, "b": None}),
+    ),
+)
+def test_fingerprint_differs_for_different_contexts(other):
+    assert EvaluationContext("user", {"a": 1}).fingerprint() != other.fingerprint()
+
+
+def test_frozen_context_is_immutable_and_hashable():
+    # Given
+    context = EvaluationContext("user", {"tags": ["x"], "nested": {"a": 1}})
+
+    # When
+    frozen = context.freeze()
+
+    # Then
+    assert isinstance(frozen, FrozenEvaluationContext)
+    assert frozen == context
+    assert hash(frozen) == hash(context.freeze())
+    assert frozen.attributes["tags"] == ("x",)
+    with pytest.raises(AttributeError):
+        frozen.targeting_key = "other"
+    with pytest.raises(TypeError):
+        frozen.attributes["tags"] = []  # type: ignore[index]
+    with pytest.raises(TypeError):
+        frozen.attributes["nested"]["a"] = 2  # type: ignore[index]
+    context.attributes["tags"].append("y")  # type: ignore[attr-defined]
+    assert frozen.attributes["tags"] == ("x",)
+
+
+def test_equal_contexts_are_interned_while_referenced():
+    # Given
+    frozen = EvaluationContext("user", {"a": 1}).freeze()
+
+    # Then
+    assert EvaluationContext("user", {"a": 1}).freeze() is frozen
+    assert frozen.freeze() is frozen
+    assert EvaluationContext("user", {"a": 2}).freeze() is not frozen
+
+
+def test_frozen_context_can_be_pickled():
+    frozen = EvaluationContext("user", {"tags": ["x"], "nested": {"a": 1}}).freeze()
+
+    restored = pickle.loads(pickle.dumps(frozen))  # noqa: S301
+
+    assert restored == frozen
+    assert restored.fingerprint() == frozen.fingerprint()
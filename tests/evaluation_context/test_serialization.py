@@ -0,0 +1,146 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from openfeature.evaluation_context import EvaluationContext
+from openfeature.evaluation_context.serialization import (
+    from_bytes,
+    from_json,
+    to_bytes,
+    to_json,
+)
+from openfeature.exception import ParseError
+
+CONTEXT = EvaluationContext(
+    "user-1",
+    {
+        "string": "värde",
+        "int": -1234567890123,
+        "small_int": 3,
+        "float": 0.5,
+        "bool": True,
+        "none": None,
+        "datetime": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "list": [1, "two", [False]],
+        "mapping": {"b": 1, "a": {"nested": datetime(2024, 1, 1)}},
+    },
+)
+
+
+@pytest.mark.parametrize(
+    ("serialize", "deserialize"), [(to_json, from_json), (to_bytes, from_bytes)]
+)
+@pytest.mark.parametrize(
+    "context", [CONTEXT, EvaluationContext(), EvaluationContext(None, {"a": 1})]
+)
+def test_round_trip(serialize, deserialize, context):
+    # When
+    deserialized = deserialize(serialize(context))
+
+    # Then
+    assert deserialized == context
+    assert deserialized.targeting_key == context.targeting_key
+    assert deserialized.attributes == context.attributes
+
+
+@pytest.mark.parametrize("serialize", [to_json, to_bytes])
+def test_serialization_is_canonical(serialize):
+    # Given
+    first = EvaluationContext("user", {"a": [1, 2], "b": {"x": 1, "y": 2}})
+    second = EvaluationContext("user", {"b": {"y": 2, "x": 1}, "a": (1, 2)})
+
+    # When / Then
+    assert serialize(first) == serialize(second)
+    assert serialize(first) == serialize(first.freeze())
+
+
+def test_to_json_output():
+    # Given
+    context = EvaluationContext(
+        "user", {"b": datetime(2024, 1, 1, tzinfo=timezone.utc), "a": "é"}
+    )
+
+    # When
+    serialized = to_json(context)
+
+    # Then
+    assert serialized == (
+        '{"attributes":{"a":"é","b":{"$datetime":"2024-01-01T00:00:00+00:00"}},'
+        '"targeting_key":"user"}'
+    )
+
+
+def test_to_bytes_is_more_compact_than_json():
+    assert len(to_bytes(CONTEXT)) < len(to_json(CONTEXT).encode())
+
+
+@pytest.mark.parametrize(
+    ("serialize", "deserialize"), [(to_json, from_json), (to_bytes, from_bytes)]
+)
+def test_serialization_is_memoized_on_frozen_contexts(serialize, deserialize):
+    # Given
+    context = CONTEXT.freeze()
+
+    # When
+    serialized = serialize(context)
+
+    # Then
+    assert serialize(context) is serialized
+    assert deserialize(serialized) == context
+
+
+@pytest.mark.parametrize("serialize", [to_json, to_bytes])
+def test_merged_contexts_serialize_like_flat_contexts(serialize):
+    # Given
+    api_context = EvaluationContext("api", {"shared": 1, "env": "prod"}).freeze()
+    client_context = EvaluationContext(None, {"shared": 2, "client": True})
+    invocation_context = EvaluationContext("user", {"shared": 3}).freeze()
+
+    # When
+    merged = api_context.merge(client_context).merge(invocation_context)
+    serialize(api_context.merge(invocation_context))
+
+    # Then
+    assert serialize(merged) == serialize(
+        EvaluationContext("user", {"shared": 3, "env": "prod", "client": True})
+    )
+
+
+def test_serialization_reflects_changes_of_merged_contexts():
+    # Given
+    context = (
+        EvaluationContext(None, {"other": 1})
+        .freeze()
+        .merge(EvaluationContext(None, {"a": 1}).freeze())
+    )
+    to_json(context)
+    to_bytes(context)
+
+    # When
+    context.attributes["a"] = 2  # type: ignore[index]
+
+    # Then
+    assert from_json(to_json(context)).attributes == {"other": 1, "a": 2}
+    assert from_bytes(to_bytes(context)).attributes == {"other": 1, "a": 2}
+
+
+@pytest.mark.parametrize("data", ["", "[]", '{"attributes": {}}', "not json"])
+def test_from_json_rejects_invalid_data(data):
+    with pytest.raises(ParseError):
+        from_json(data)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"\x02",
+        b"\x01\x05\x10a",
+        b"\x01\x00\x08\x00\x00",
+        b"\x01\x00\x05\x00",
+        b"\x01\x00\x08\x01\x01a\x63",
+    ],
+)
+def test_from_bytes_rejects_invalid_data(data):
+    with pytest.raises(ParseError):
+        from_bytes(data)
@@ -32,7 +32,7 @@ def step_impl_should_have_eval_details(context, hook_names):
             flag_type, key, value = row
 
             value = convert_value_from_key_and_flag_type(value, key, flag_type)
-            actual = hook.call_args[1]["details"].__dict__[key]
+            actual = getattr(hook.call_args[1]["details"], key)
 
             assert actual == value
 
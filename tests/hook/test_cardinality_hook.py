@@ -0,0 +1,136 @@
+import pytest
+
+from openfeature import api
+from openfeature.evaluation_context import EvaluationContext
+from openfeature.exception import GeneralError
+from openfeature.flag_evaluation import FlagResolutionDetails
+from openfeature.hook.cardinality_hook import (
+    CardinalityHook,
+    CardinalityKey,
+    HyperLogLog,
+)
+from openfeature.provider.in_memory_provider import InMemoryFlag, InMemoryProvider
+
+
+def test_hyperloglog_estimates_small_cardinalities_exactly():
+    # Given
+    sketch = HyperLogLog()
+
+    # When
+    for i in range(100):
+        sketch.add(f"user-{i % 10}")
+
+    # Then
+    assert sketch.count() == 10
+
+
+@pytest.mark.parametrize("precision", [10, 12, 14])
+def test_hyperloglog_estimates_large_cardinalities_within_its_error(precision):
+    # Given
+    sketch = HyperLogLog(precision)
+    standard_error = 1.04 / (1 << precision) ** 0.5
+
+    # When
+    for i in range(50_000):
+        sketch.add(f"user-{i}")
+
+    # Then
+    assert abs(sketch.count() - 50_000) / 50_000 < 4 * standard_error
+
+
+def test_hyperloglog_merge_counts_the_union():
+    # Given
+    first = HyperLogLog()
+    second = HyperLogLog()
+    for i in range(2_000):
+        first.add(f"user-{i}")
+    for i in range(1_000, 3_000):
+        second.add(f"user-{i}")
+
+    # When
+    first.merge(HyperLogLog.from_bytes(second.to_bytes()))
+
+    # Then
+    assert abs(first.count() - 3_000) / 3_000 < 0.05
+
+
+def test_hyperloglog_round_trips_through_bytes():
+    # Given
+    sketch = HyperLogLog(8)
+    sketch.add("user")
+
+    # When
+    data = sketch.to_bytes()
+
+    # Then
+    assert len(data) == 257
+    assert HyperLogLog.from_bytes(data) == sketch
+
+
+@pytest.mark.parametrize("data", [b"", b"\x08\x00"])
+def test_hyperloglog_rejects_invalid_bytes(data):
+    with pytest.raises(GeneralError):
+        HyperLogLog.from_bytes(data)
+
+
+def test_hyperloglog_rejects_merging_different_precisions():
+    with pytest.raises(GeneralError):
+        HyperLogLog(10).merge(HyperLogLog(12))
+
+
+@pytest.mark.parametrize("precision", [3, 17])
+def test_hyperloglog_rejects_invalid_precisions(precision):
+    with pytest.raises(GeneralError):
+        HyperLogLog(precision)
+
+
+def test_cardinality_hook_counts_distinct_targeting_keys_by_variant():
+    # Given
+    def context_evaluator(flag, evaluation_context):
+        variant = "on" if evaluation_context.targeting_key.endswith("1") else "off"
+        return FlagResolutionDetails(value=flag.variants[variant], variant=variant)
+
+    api.set_provider(
+        InMemoryProvider(
+            {
+                "flag": InMemoryFlag(
+                    "off",
+                    {"on": True, "off": False},
+                    context_evaluator=context_evaluator,
+                )
+            }
+        )
+    )
+    hook = CardinalityHook()
+    client = api.get_client()
+    client.add_hooks([hook])
+
+    # When
+    for _ in range(3):
+        for user in ("user-1", "user-2", "user-3", "user-11"):
+            client.get_boolean_value("flag", False, EvaluationContext(user))
+    client.get_boolean_value("flag", False)
+
+    # Then
+    snapshot = hook.snapshot()
+    assert {key: sketch.count() for key, sketch in snapshot.items()} == {
+        CardinalityKey("flag", "on"): 2,
+        CardinalityKey("flag", "off"): 2,
+    }
+
+
+def test_cardinality_hook_merges_and_resets_sketches():
+    # Given
+    hook = CardinalityHook(precision=10)
+    other = HyperLogLog(10)
+    other.add("user")
+    key = CardinalityKey("flag", "on")
+
+    # When
+    hook.merge({key: other})
+    merged = hook.snapshot()
+    hook.reset()
+
+    # Then
+    assert merged[key].count() == 1
+    assert hook.snapshot() == {}
@@ -0,0 +1,168 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from openfeature import api
+from openfeature.evaluation_context import EvaluationContext
+from openfeature.exception import GeneralError
+from openfeature.flag_evaluation import FlagEvaluationDetails, FlagType
+from openfeature.hook import Hook, HookContext, HookType
+from openfeature.hook._hook_support import get_overridden_stages
+from openfeature.hook.deferred_hook import DeferredHook, DeferredHookStatistics
+from openfeature.provider.in_memory_provider import InMemoryFlag, InMemoryProvider
+
+
+class BlockingHook(Hook):
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.after_calls = []
+        self.after_contexts = []
+
+    def after(self, hook_context, details, hints):
+        self.started.set()
+        self.release.wait(1)
+        self.after_calls.append(details)
+        self.after_contexts.append(hook_context)
+
+
+@pytest.fixture()
+def hook_context():
+    return HookContext("flag", FlagType.BOOLEAN, False, EvaluationContext())
+
+
+def test_deferred_hook_runs_after_stages_in_the_background():
+    # Given
+    wrapped = MagicMock(spec=Hook)
+    hook = DeferredHook(wrapped)
+    api.set_provider(InMemoryProvider({"flag": InMemoryFlag("on", {"on": True})}))
+    client = api.get_client()
+    client.add_hooks([hook])
+
+    # When
+    details = client.get_boolean_details("flag", False)
+    details.value = False
+    assert hook.flush(1)
+
+    # Then
+    wrapped.before.assert_called_once()
+    wrapped.after.assert_called_once()
+    wrapped.finally_after.assert_called_once()
+    deferred_details = wrapped.after.call_args.kwargs["details"]
+    assert deferred_details is not details
+    assert deferred_details.value is True
+    assert wrapped.after.call_args.kwargs["hook_context"].flag_key == "flag"
+    assert hook.get_statistics() == DeferredHookStatistics(processed=2)
+
+
+def test_deferred_hook_drops_invocations_once_its_queue_is_full(hook_context):
+    # Given
+    wrapped = BlockingHook()
+    hook = DeferredHook(wrapped, max_queue_size=1)
+    details = FlagEvaluationDetails("flag", True)
+
+    # When
+    hook.after(hook_context, details, {})
+    assert wrapped.started.wait(1)
+    hook.after(hook_context, details, {})
+    hook.after(hook_context, details, {})
+    # the wrapped hook does not implement finally_after, nothing is queued
+    hook.finally_after(hook_context, details, {})
+    statistics = hook.get_statistics()
+    wrapped.release.set()
+
+    # Then
+    assert statistics == DeferredHookStatistics(dropped=1, pending=2)
+    assert hook.flush(1)
+    assert len(wrapped.after_calls) == 2
+    assert hook.get_statistics() == DeferredHookStatistics(processed=2, dropped=1)
+
+
+def test_deferred_hook_logs_exceptions_of_deferred_stages(hook_context, caplog):
+    # Given
+    wrapped = MagicMock(spec=Hook)
+    wrapped.after.side_effect = RuntimeError("boom")
+    hook = DeferredHook(wrapped)
+
+    # When
+    hook.after(hook_context, FlagEvaluationDetails("flag", True), {})
+    assert hook.flush(1)
+
+    # Then
+    assert "Exception when running deferred after hook" in caplog.text
+    assert hook.get_statistics() == DeferredHookStatistics(processed=1)
+
+
+def test_shutdown_flushes_deferred_hooks(hook_context):
+    # Given
+    wrapped = BlockingHook()
+    hook = DeferredHook(wrapped)
+    hook.after(hook_context, FlagEvaluationDetails("flag", True), {})
+    assert wrapped.started.wait(1)
+
+    # When
+    threading.Timer(0.05, wrapped.release.set).start()
+    api.shutdown()
+
+    # Then
+    assert len(wrapped.after_calls) == 1
+
+
+def test_deferred_hook_sees_a_snapshot_of_the_evaluation_context():
+    # Given
+    wrapped = BlockingHook()
+    hook = DeferredHook(wrapped)
+    evaluation_context = EvaluationContext("user", {"plan": "free", "tags": ["a"]})
+    hook_context = HookContext("flag", FlagType.BOOLEAN, False, evaluation_context)
+    hook_context.hook_data["started"] = True
+
+    # When
+    hook.after(hook_context, FlagEvaluationDetails("flag", True), {})
+    evaluation_context.attributes["plan"] = "pro"
+    evaluation_context.attributes["tags"].append("b")
+    wrapped.release.set()
+    assert hook.flush(1)
+
+    # Then
+    deferred_context = wrapped.after_contexts[0]
+    assert deferred_context.evaluation_context.attributes["plan"] == "free"
+    assert deferred_context.evaluation_context.attributes["tags"] == ["a"]
+    assert deferred_context.hook_data == {"started": True}
+
+
+def test_deferred_hook_only_exposes_the_stages_of_the_wrapped_hook():
+    # Given
+    hook = DeferredHook(BlockingHook())
+
+    # When
+    stages = get_overridden_stages(hook)
+
+    # Then
+    assert stages == {HookType.AFTER}
+
+
+def test_shutdown_logs_deferred_invocations_still_pending(
+    hook_context, caplog, monkeypatch
+):
+    # Given
+    monkeypatch.setattr(api, "_SHUTDOWN_TIMEOUT", 0.01)
+    wrapped = BlockingHook()
+    hook = DeferredHook(wrapped)
+    hook.after(hook_context, FlagEvaluationDetails("flag", True), {})
+    assert wrapped.started.wait(1)
+
+    # When
+    api.shutdown()
+    wrapped.release.set()
+
+    # Then
+    assert (
+        "1 deferred invocations of hook BlockingHook were still pending" in caplog.text
+    )
+    assert hook.flush(1)
+
+
+def test_deferred_hook_requires_a_positive_queue_size():
+    with pytest.raises(GeneralError):
+        DeferredHook(Hook(), max_queue_size=0)
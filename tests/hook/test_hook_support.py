@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import ANY, MagicMock
 
 import pytest
@@ -5,12 +6,16 @@ import pytest
 from openfeature.client import ClientMetadata
 from openfeature.evaluation_context import EvaluationContext
 from openfeature.flag_evaluation import FlagEvaluationDetails, FlagType
-from openfeature.hook import Hook, HookContext
+from openfeature.hook import AsyncHook, Hook, HookContext, HookType, _HookContextCore
 from openfeature.hook._hook_support import (
     after_all_hooks,
     after_hooks,
     before_hooks,
     error_hooks,
+    filter_hooks,
+    get_overridden_stages,
+    run_after_all_hooks_async,
+    run_before_hooks_async,
 )
 from openfeature.immutable_dict.mapping_proxy_type import MappingProxyType
 from openfeature.provider.metadata import Metadata
@@ -76,6 +81,34 @@ def test_hook_context_has_immutable_and_mutable_fields():
     assert hook_context.hook_data == {"key": "value"}
 
 
+def test_hook_contexts_of_an_evaluation_share_their_read_only_fields():
+    # Given
+    provider_metadata = Metadata("provider")
+    core = _HookContextCore(
+        "flag_key", FlagType.BOOLEAN, True, ClientMetadata("name"), provider_metadata
+    )
+    evaluation_context = EvaluationContext("targeting_key")
+
+    # When
+    first = HookContext._from_core(core, evaluation_context)
+    second = HookContext._from_core(core, evaluation_context)
+    first.hook_data["key"] = "value"
+
+    # Then
+    assert not hasattr(first, "__dict__")
+    assert (first.flag_key, first.flag_type, first.default_value) == (
+        "flag_key",
+        FlagType.BOOLEAN,
+        True,
+    )
+    assert first.provider_metadata is second.provider_metadata is provider_metadata
+    assert first.evaluation_context is evaluation_context
+    assert first.hook_data == {"key": "value"}
+    assert second.hook_data == {}
+    with pytest.raises(AttributeError, match="'flag_key' is immutable"):
+        second.flag_key = "new_key"  # type: ignore[misc]
+
+
 def test_error_hooks_run_error_method(mock_hook):
     # Given
     hook_context = HookContext("flag_key", FlagType.BOOLEAN, True, "")
@@ -164,3 +197,111 @@ def test_finally_after_hooks_run_finally_after_method(mock_hook):
     mock_hook.finally_after.assert_called_with(
         hook_context=hook_context, details=flag_evaluation_details, hints=hook_hints
     )
+
+
+class AfterHook(Hook):
+    def after(self, hook_context, details, hints):
+        pass
+
+
+class BeforeAndAfterHook(AfterHook):
+    def before(self, hook_context, hints):
+        return None
+
+
+def test_overridden_stages_are_detected_per_class_and_instance():
+    # Given
+    hook_with_instance_override = AfterHook()
+    hook_with_instance_override.error = MagicMock()
+
+    # Then
+    assert get_overridden_stages(Hook()) == frozenset()
+    assert get_overridden_stages(AfterHook()) == {HookType.AFTER}
+    assert get_overridden_stages(BeforeAndAfterHook()) == {
+        HookType.BEFORE,
+        HookType.AFTER,
+    }
+    assert get_overridden_stages(hook_with_instance_override) == {
+        HookType.AFTER,
+        HookType.ERROR,
+    }
+    assert get_overridden_stages(MagicMock(spec=Hook)) == set(HookType)
+
+
+def test_stages_a_hook_does_not_override_are_skipped():
+    # Given
+    hook = AfterHook()
+    hook.before = MagicMock(wraps=hook.before)
+    hook_context = HookContext("flag_key", FlagType.BOOLEAN, True, "")
+
+    # When
+    before_hooks(FlagType.BOOLEAN, [(hook, hook_context)])
+    remaining = filter_hooks(FlagType.BOOLEAN, HookType.ERROR, [(hook, hook_context)])
+
+    # Then
+    hook.before.assert_called_once()
+    assert remaining == []
+
+
+class AsyncBeforeHook(AsyncHook):
+    async def before_async(self, hook_context, hints):
+        await asyncio.sleep(0)
+        return EvaluationContext(attributes={"async": True})
+
+
+class SlowFinallyHook(AsyncHook):
+    concurrent_finally_after = True
+
+    def __init__(self, events):
+        self.events = events
+
+    async def finally_after_async(self, hook_context, details, hints):
+        self.events.append("start")
+        await asyncio.sleep(0.01)
+        self.events.append("end")
+
+
+def test_async_stages_count_as_overridden_stages():
+    # Then
+    assert get_overridden_stages(AsyncHook()) == frozenset()
+    assert get_overridden_stages(AsyncBeforeHook()) == {HookType.BEFORE}
+
+
+@pytest.mark.asyncio
+async def test_async_before_hooks_await_async_hooks_and_run_sync_hooks():
+    # Given
+    hook_context = HookContext("flag_key", FlagType.BOOLEAN, True, "")
+    sync_hook = MagicMock(spec=Hook)
+    sync_hook.before.return_value = EvaluationContext("key", {"sync": True})
+
+    # When
+    context = await run_before_hooks_async(
+        [(sync_hook, hook_context), (AsyncBeforeHook(), hook_context)], {}
+    )
+
+    # Then
+    sync_hook.before.assert_called_once_with(hook_context=hook_context, hints={})
+    assert context == EvaluationContext("key", {"sync": True, "async": True})
+
+
+@pytest.mark.asyncio
+async def test_concurrent_finally_after_hooks_run_together():
+    # Given
+    events = []
+    hook_context = HookContext("flag_key", FlagType.BOOLEAN, True, "")
+    details = FlagEvaluationDetails("flag_key", True)
+    sync_hook = MagicMock(spec=Hook)
+    sync_hook.finally_after.side_effect = lambda **kwargs: events.append("sync")
+
+    # When
+    await run_after_all_hooks_async(
+        details,
+        [
+            (SlowFinallyHook(events), hook_context),
+            (SlowFinallyHook(events), hook_context),
+            (sync_hook, hook_context),
+        ],
+    )
+
+    # Then
+    assert events == ["start", "start", "end", "end", "sync"]
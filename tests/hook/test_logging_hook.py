@@ -1,10 +1,13 @@
+import logging
+import threading
+import time
 from unittest.mock import MagicMock
 
 import pytest
 
 from openfeature.client import ClientMetadata
 from openfeature.evaluation_context import EvaluationContext
-from openfeature.exception import ErrorCode, FlagNotFoundError
+from openfeature.exception import ErrorCode, FlagNotFoundError, GeneralError
 from openfeature.flag_evaluation import FlagEvaluationDetails, FlagType
 from openfeature.hook.logging_hook import HookContext, LoggingHook
 from openfeature.provider.metadata import Metadata
@@ -86,7 +89,7 @@ def test_after_calls_debug_with_evaluation_context(hook_context):
             "reason": "STATIC",
             "variant": "on",
             "value": True,
-            "evaluation_context": '{"targeting_key": "user-1", "attributes": {"env": "prod"}}',
+            "evaluation_context": '{"attributes":{"env":"prod"},"targeting_key":"user-1"}',
         },
     )
 
@@ -171,7 +174,7 @@ def test_build_args_includes_evaluation_context_when_enabled(hook_context):
         "default_value": False,
         "domain": "my-domain",
         "provider_name": "my-provider",
-        "evaluation_context": '{"targeting_key": "user-1", "attributes": {"env": "prod"}}',
+        "evaluation_context": '{"attributes":{"env":"prod"},"targeting_key":"user-1"}',
         "stage": "after",
     }
 
@@ -190,8 +193,157 @@ def test_error_calls_error_log_with_evaluation_context(hook_context):
             "default_value": False,
             "domain": "my-domain",
             "provider_name": "my-provider",
-            "evaluation_context": '{"targeting_key": "user-1", "attributes": {"env": "prod"}}',
+            "evaluation_context": '{"attributes":{"env":"prod"},"targeting_key":"user-1"}',
             "error_code": ErrorCode.GENERAL,
             "error_message": "something went wrong",
         },
     )
+
+
+def test_does_not_build_args_when_the_logger_is_disabled(hook_context):
+    mock_logger = MagicMock()
+    mock_logger.isEnabledFor.return_value = False
+    hook = LoggingHook(logger=mock_logger, include_evaluation_context=True)
+    hook._build_args = MagicMock()
+
+    hook.before(hook_context, hints={})
+    hook.error(hook_context, Exception("something went wrong"), hints={})
+
+    hook._build_args.assert_not_called()
+    mock_logger.debug.assert_not_called()
+    mock_logger.error.assert_not_called()
+
+
+def test_background_logs_records_from_another_thread(hook_context):
+    mock_logger = MagicMock()
+    threads = []
+    mock_logger.log.side_effect = lambda *args: threads.append(
+        threading.current_thread()
+    )
+    hook = LoggingHook(
+        logger=mock_logger, include_evaluation_context=True, background=True
+    )
+
+    hook.before(hook_context, hints={})
+    assert hook.flush(1)
+
+    assert threads
+    assert threads[0] is not threading.current_thread()
+    mock_logger.log.assert_called_with(
+        logging.DEBUG,
+        "Flag evaluation %s",
+        {
+            "stage": "before",
+            "flag_key": "my-flag",
+            "default_value": False,
+            "domain": "my-domain",
+            "provider_name": "my-provider",
+            "evaluation_context": '{"attributes":{"env":"prod"},"targeting_key":"user-1"}',
+        },
+    )
+
+
+def test_background_logs_the_evaluation_context_as_it_was_when_evaluated(
+    hook_context,
+):
+    mock_logger = MagicMock()
+    release = threading.Event()
+    mock_logger.log.side_effect = lambda *args: release.wait(1)
+    hook = LoggingHook(
+        logger=mock_logger, include_evaluation_context=True, background=True
+    )
+
+    hook.before(hook_context, hints={})
+    hook.before(hook_context, hints={})
+    hook_context.evaluation_context.attributes["env"] = "dev"
+    release.set()
+    assert hook.flush(1)
+
+    logged_contexts = [
+        call.args[2]["evaluation_context"] for call in mock_logger.log.call_args_list
+    ]
+    assert (
+        logged_contexts
+        == ['{"attributes":{"env":"prod"},"targeting_key":"user-1"}'] * 2
+    )
+
+
+def test_background_drops_records_once_the_queue_is_full(hook_context):
+    mock_logger = MagicMock()
+    release = threading.Event()
+    mock_logger.log.side_effect = lambda *args: release.wait(1)
+    hook = LoggingHook(logger=mock_logger, background=True, max_queue_size=1)
+
+    for _ in range(5):
+        hook.before(hook_context, hints={})
+    release.set()
+    assert hook.flush(1)
+
+    assert mock_logger.log.call_count < 5
+    assert hook.get_dropped_records() == 5 - mock_logger.log.call_count
+    mock_logger.warning.assert_called_once_with(
+        "Dropped %d flag evaluation log records, as the queue was full",
+        hook.get_dropped_records(),
+    )
+
+
+def test_background_keeps_logging_after_a_record_fails(hook_context, caplog):
+    mock_logger = MagicMock()
+    mock_logger.log.side_effect = [RuntimeError("handler down"), None]
+    hook = LoggingHook(logger=mock_logger, background=True)
+
+    hook.before(hook_context, hints={})
+    assert hook.flush(1)
+    hook.before(hook_context, hints={})
+    assert hook.flush(1)
+
+    assert mock_logger.log.call_count == 2
+    assert "Exception when logging a flag evaluation record" in caplog.text
+
+
+def test_rate_limits_records_per_flag(hook_context):
+    mock_logger = MagicMock()
+    hook = LoggingHook(logger=mock_logger, max_records_per_flag=2)
+    other_flag_context = HookContext(
+        flag_key="other-flag",
+        flag_type=FlagType.BOOLEAN,
+        default_value=False,
+        evaluation_context=EvaluationContext(),
+    )
+
+    for _ in range(5):
+        hook.before(hook_context, hints={})
+    hook.before(other_flag_context, hints={})
+
+    assert mock_logger.debug.call_count == 3
+    mock_logger.warning.assert_not_called()
+
+
+def test_rate_limit_logs_the_number_of_suppressed_records(hook_context):
+    mock_logger = MagicMock()
+    hook = LoggingHook(
+        logger=mock_logger, max_records_per_flag=1, rate_limit_interval=0.01
+    )
+    for _ in range(4):
+        hook.error(hook_context, Exception("provider down"), hints={})
+
+    time.sleep(0.02)
+    hook.error(hook_context, Exception("provider down"), hints={})
+
+    assert mock_logger.error.call_count == 2
+    mock_logger.warning.assert_called_once_with(
+        "Suppressed %d flag evaluation log records of flag %s", 3, "my-flag"
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"max_queue_size": 0},
+        {"max_records_per_flag": 0},
+        {"rate_limit_interval": 0},
+    ],
+)
+def test_rejects_invalid_arguments(kwargs):
+    with pytest.raises(GeneralError):
+        LoggingHook(**kwargs)
@@ -0,0 +1,181 @@
+import gc
+import threading
+import urllib.request
+
+import pytest
+
+from openfeature import api
+from openfeature.exception import GeneralError
+from openfeature.hook import HookType
+from openfeature.hook._hook_support import get_overridden_stages
+from openfeature.hook.metrics_hook import (
+    EvaluationLabels,
+    MetricsHook,
+    OpenMetricsExporter,
+)
+from openfeature.provider.in_memory_provider import InMemoryFlag, InMemoryProvider
+
+
+@pytest.fixture()
+def client():
+    api.set_provider(
+        InMemoryProvider(
+            {
+                "flag": InMemoryFlag("on", {"on": True, "off": False}),
+                'quoted"flag': InMemoryFlag("off", {"on": True, "off": False}),
+            }
+        )
+    )
+    return api.get_client()
+
+
+def test_metrics_hook_counts_evaluations_by_labels(client):
+    # Given
+    hook = MetricsHook()
+    client.add_hooks([hook])
+
+    # When
+    client.get_boolean_value("flag", False)
+    client.get_boolean_value("flag", False)
+    client.get_boolean_value("missing", False)
+    client.get_string_value("flag", "default")
+    snapshot = hook.snapshot()
+
+    # Then
+    assert snapshot.evaluations == {
+        EvaluationLabels("flag", "on", "static", None): 2,
+        EvaluationLabels("missing", None, "error", "flag_not_found"): 1,
+        EvaluationLabels("flag", None, "error", "type_mismatch"): 1,
+    }
+    assert snapshot.latencies["flag"].count == 3
+    assert snapshot.latencies["missing"].count == 1
+    assert sum(snapshot.latencies["flag"].counts) == 3
+
+
+def test_metrics_hook_merges_the_shards_of_every_thread(client):
+    # Given
+    hook = MetricsHook()
+    client.add_hooks([hook])
+
+    def evaluate():
+        for _ in range(100):
+            client.get_boolean_value("flag", False)
+
+    # When
+    threads = [threading.Thread(target=evaluate) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    evaluate()
+    snapshot = hook.snapshot()
+    hook.reset()
+
+    # Then
+    assert len(hook._shards) == 0
+    assert snapshot.evaluations == {EvaluationLabels("flag", "on", "static", None): 500}
+    assert snapshot.latencies["flag"].count == 500
+    assert hook.snapshot().evaluations == {}
+
+
+def test_metrics_hook_folds_the_shards_of_ended_threads(client):
+    # Given
+    hook = MetricsHook()
+    client.add_hooks([hook])
+
+    def evaluate():
+        client.get_boolean_value("flag", False)
+
+    # When
+    for _ in range(10):
+        thread = threading.Thread(target=evaluate)
+        thread.start()
+        thread.join()
+    gc.collect()
+    snapshot = hook.snapshot()
+
+    # Then
+    assert len(hook._shards) == 0
+    assert snapshot.evaluations == {EvaluationLabels("flag", "on", "static", None): 10}
+    assert snapshot.latencies["flag"].count == 10
+
+
+def test_openmetrics_exporter_renders_counters_and_histograms(client):
+    # Given
+    hook = MetricsHook(buckets=(0.5, 1.0))
+    client.add_hooks([hook])
+    client.get_boolean_value("flag", False)
+    client.get_boolean_value('quoted"flag', False)
+    client.get_boolean_value("missing", False)
+
+    # When
+    text = OpenMetricsExporter(hook).render()
+
+    # Then
+    lines = text.splitlines()
+    assert lines[:2] == [
+        "# TYPE feature_flag_evaluations counter",
+        "# HELP feature_flag_evaluations Number of flag evaluations.",
+    ]
+    assert (
+        'feature_flag_evaluations_total{feature_flag_key="flag",feature_flag_variant="on",'
+        'feature_flag_evaluation_reason="static"} 1'
+    ) in lines
+    assert (
+        'feature_flag_evaluations_total{feature_flag_key="missing",'
+        'feature_flag_evaluation_reason="error",error_type="flag_not_found"} 1'
+    ) in lines
+    assert (
+        'feature_flag_evaluations_total{feature_flag_key="quoted\\"flag",'
+        'feature_flag_variant="off",feature_flag_evaluation_reason="static"} 1'
+    ) in lines
+    assert "# UNIT feature_flag_evaluation_duration_seconds seconds" in lines
+    assert (
+        'feature_flag_evaluation_duration_seconds_bucket{feature_flag_key="flag",le="0.5"} 1'
+        in lines
+    )
+    assert (
+        'feature_flag_evaluation_duration_seconds_bucket{feature_flag_key="flag",le="+Inf"} 1'
+        in lines
+    )
+    assert (
+        'feature_flag_evaluation_duration_seconds_count{feature_flag_key="flag"} 1'
+        in (lines)
+    )
+    assert lines[-1] == "# EOF"
+
+
+def test_openmetrics_exporter_serves_metrics_over_http(client):
+    # Given
+    hook = MetricsHook()
+    client.add_hooks([hook])
+    client.get_integer_value("missing", 1)
+    exporter = OpenMetricsExporter(hook, namespace="app")
+    server = exporter.start_http_server()
+    host, port = server.server_address[:2]
+
+    # When
+    try:
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics") as response:
+            content_type = response.headers["Content-Type"]
+            body = response.read().decode()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # Then
+    assert content_type == OpenMetricsExporter.CONTENT_TYPE
+    assert body == exporter.render()
+    assert 'app_evaluations_total{feature_flag_key="missing"' in body
+
+
+def test_metrics_hook_requires_increasing_buckets():
+    with pytest.raises(GeneralError):
+        MetricsHook(buckets=(1.0, 0.5))
+
+
+def test_metrics_hook_only_implements_the_stages_it_needs():
+    assert get_overridden_stages(MetricsHook()) == {
+        HookType.BEFORE,
+        HookType.FINALLY_AFTER,
+    }
@@ -0,0 +1,188 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from openfeature import api
+from openfeature.exception import GeneralError
+from openfeature.hook.summary_hook import (
+    EvaluationSummary,
+    SummaryHook,
+    SummaryKey,
+    SummaryWindow,
+)
+from openfeature.provider.in_memory_provider import InMemoryFlag, InMemoryProvider
+from openfeature.telemetry import TelemetryAttribute
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        self.now += 1
+        return self.now
+
+
+@pytest.fixture
+def client():
+    api.set_provider(
+        InMemoryProvider({"flag": InMemoryFlag("on", {"on": True, "off": False})})
+    )
+    return api.get_client()
+
+
+def test_summary_hook_counts_evaluations_of_a_window(client):
+    # Given
+    windows = []
+    hook = SummaryHook(windows.append, window=60, clock=FakeClock())
+    client.add_hooks([hook])
+
+    # When
+    client.get_boolean_value("flag", False)
+    client.get_boolean_value("flag", False)
+    client.get_boolean_value("missing", False)
+    hook.flush()
+
+    # Then
+    assert len(windows) == 1
+    window = windows[0]
+    assert (window.start, window.end) == (101.0, 105.0)
+    assert set(window.summaries) == {
+        EvaluationSummary(
+            SummaryKey("flag", "on", "static", None, "In-Memory Provider"),
+            count=2,
+            first_seen=102.0,
+            last_seen=103.0,
+        ),
+        EvaluationSummary(
+            SummaryKey(
+                "missing", None, "error", "flag_not_found", "In-Memory Provider"
+            ),
+            count=1,
+            first_seen=104.0,
+            last_seen=104.0,
+        ),
+    }
+
+
+def test_summary_hook_starts_a_new_window_on_flush(client):
+    # Given
+    windows = []
+    hook = SummaryHook(windows.append, window=60, clock=FakeClock())
+    client.add_hooks([hook])
+    client.get_boolean_value("flag", False)
+    hook.flush()
+
+    # When
+    client.get_boolean_value("flag", False)
+    hook.flush()
+    hook.flush()
+
+    # Then
+    assert len(windows) == 2
+    assert windows[1].start == windows[0].end
+    assert [s.count for s in windows[1].summaries] == [1]
+
+
+def test_summary_hook_rotates_windows_on_a_background_thread(client):
+    # Given
+    rotated = threading.Event()
+    windows = []
+
+    def sink(window: SummaryWindow):
+        windows.append(window)
+        rotated.set()
+
+    hook = SummaryHook(sink, window=0.01)
+    client.add_hooks([hook])
+
+    # When
+    client.get_boolean_value("flag", False)
+
+    # Then
+    assert rotated.wait(1)
+    hook.shutdown()
+    assert sum(s.count for w in windows for s in w.summaries) == 1
+
+
+def test_shutdown_hands_the_current_window_of_summary_hooks_over(client):
+    # Given
+    windows = []
+    hook = SummaryHook(windows.append, window=60)
+    client.add_hooks([hook])
+    client.get_boolean_value("flag", False)
+
+    # When
+    api.shutdown()
+
+    # Then
+    assert [s.count for w in windows for s in w.summaries] == [1]
+
+
+def test_shutdown_logs_the_evaluations_of_a_summary_hook_stuck_in_its_sink(
+    client, caplog, monkeypatch
+):
+    # Given
+    monkeypatch.setattr(api, "_SHUTDOWN_TIMEOUT", 0.01)
+    started = threading.Event()
+    release = threading.Event()
+
+    def sink(window: SummaryWindow):
+        started.set()
+        release.wait(1)
+
+    hook = SummaryHook(sink, window=0.01)
+    client.add_hooks([hook])
+    client.get_boolean_value("flag", False)
+    assert started.wait(1)
+    client.get_boolean_value("flag", False)
+
+    # When
+    api.shutdown()
+    release.set()
+
+    # Then
+    assert (
+        "1 evaluations were still summarized by a summary hook after 0.01 seconds"
+        in caplog.text
+    )
+
+
+def test_summary_hook_logs_sink_exceptions(client):
+    # Given
+    sink = MagicMock(side_effect=Exception("sink down"))
+    hook = SummaryHook(sink, window=60)
+    client.add_hooks([hook])
+    client.get_boolean_value("flag", False)
+
+    # When
+    hook.flush()
+
+    # Then
+    sink.assert_called_once()
+
+
+def test_evaluation_summary_attributes():
+    # Given
+    summary = EvaluationSummary(
+        SummaryKey("flag", None, "error", "general", None),
+        count=1,
+        first_seen=0.0,
+        last_seen=0.0,
+    )
+
+    # When
+    attributes = summary.attributes
+
+    # Then
+    assert attributes == {
+        TelemetryAttribute.KEY: "flag",
+        TelemetryAttribute.EVALUATION_REASON: "error",
+        TelemetryAttribute.ERROR_TYPE: "general",
+    }
+
+
+def test_summary_hook_rejects_a_non_positive_window():
+    with pytest.raises(GeneralError):
+        SummaryHook(MagicMock(), window=0)
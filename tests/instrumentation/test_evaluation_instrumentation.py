@@ -0,0 +1,148 @@
+import time
+
+import pytest
+
+from openfeature import api
+from openfeature.exception import GeneralError
+from openfeature.flag_evaluation import FlagEvaluationOptions, FlagType
+from openfeature.hook import Hook
+from openfeature.instrumentation import (
+    EvaluationInstrumentation,
+    EvaluationStage,
+    SlowEvaluation,
+)
+from openfeature.provider.in_memory_provider import InMemoryFlag, InMemoryProvider
+
+
+class SlowAfterHook(Hook):
+    def after(self, hook_context, details, hints):
+        time.sleep(0.01)
+
+
+@pytest.fixture()
+def provider():
+    provider = InMemoryProvider({"flag": InMemoryFlag("on", {"on": True})})
+    api.set_provider(provider, "instrumented")
+    return provider
+
+
+def test_should_record_every_stage_of_hooked_evaluations(provider):
+    # Given
+    instrumentation = EvaluationInstrumentation()
+    client = api.get_client("instrumented", instrumentation=instrumentation)
+    options = FlagEvaluationOptions(hooks=[SlowAfterHook()])
+
+    # When
+    client.get_boolean_value("flag", False, flag_evaluation_options=options)
+    client.get_boolean_value("flag", False, flag_evaluation_options=options)
+    snapshot = instrumentation.snapshot()
+
+    # Then
+    histograms = snapshot[("instrumented", FlagType.BOOLEAN)]
+    assert set(histograms) == {
+        EvaluationStage.CONTEXT_MERGE,
+        EvaluationStage.BEFORE_HOOKS,
+        EvaluationStage.RESOLVE,
+        EvaluationStage.TYPE_CHECK,
+        EvaluationStage.AFTER_HOOKS,
+        EvaluationStage.FINALLY_HOOKS,
+        EvaluationStage.TOTAL,
+    }
+    after_hooks = histograms[EvaluationStage.AFTER_HOOKS]
+    assert after_hooks.count == 2
+    assert sum(after_hooks.counts) == 2
+    assert after_hooks.max >= 0.01
+    assert histograms[EvaluationStage.TOTAL].sum >= after_hooks.sum
+
+
+@pytest.mark.asyncio
+async def test_should_record_evaluations_without_hooks(provider):
+    # Given
+    instrumentation = EvaluationInstrumentation()
+    client = api.get_client("instrumented", instrumentation=instrumentation)
+    handle = client.flag_handle("flag", FlagType.STRING, "default")
+
+    # When
+    await client.get_string_value_async("flag", "default")
+    handle.value()
+    snapshot = instrumentation.snapshot()
+
+    # Then
+    histograms = snapshot[("instrumented", FlagType.STRING)]
+    assert set(histograms) == {
+        EvaluationStage.CONTEXT_MERGE,
+        EvaluationStage.RESOLVE,
+        EvaluationStage.TYPE_CHECK,
+        EvaluationStage.TOTAL,
+    }
+    assert histograms[EvaluationStage.TOTAL].count == 2
+
+
+def test_should_report_slow_evaluations(provider):
+    # Given
+    slow_evaluations = []
+    instrumentation = EvaluationInstrumentation(
+        slow_threshold=0.005, on_slow_evaluation=slow_evaluations.append
+    )
+    client = api.get_client("instrumented", instrumentation=instrumentation)
+
+    # When
+    client.get_boolean_value("flag", False)
+    client.get_boolean_value(
+        "flag", False, flag_evaluation_options=FlagEvaluationOptions([SlowAfterHook()])
+    )
+
+    # Then
+    assert len(slow_evaluations) == 1
+    slow_evaluation = slow_evaluations[0]
+    assert isinstance(slow_evaluation, SlowEvaluation)
+    assert slow_evaluation.domain == "instrumented"
+    assert slow_evaluation.flag_key == "flag"
+    assert slow_evaluation.duration >= 0.01
+    assert slow_evaluation.stages[EvaluationStage.AFTER_HOOKS] >= 0.01
+
+
+def test_should_log_exceptions_of_the_slow_evaluation_callback(provider, caplog):
+    # Given
+    def fail(slow_evaluation):
+        raise RuntimeError("boom")
+
+    instrumentation = EvaluationInstrumentation(
+        slow_threshold=0, on_slow_evaluation=fail
+    )
+    client = api.get_client("instrumented", instrumentation=instrumentation)
+
+    # When
+    value = client.get_boolean_value("flag", False)
+
+    # Then
+    assert value is True
+    assert "Exception when reporting a slow flag evaluation" in caplog.text
+
+
+def test_should_place_durations_in_buckets_and_reset():
+    # Given
+    instrumentation = EvaluationInstrumentation(buckets=(0.001, 0.01))
+    timer = instrumentation.start("domain", FlagType.INTEGER, "flag")
+
+    # When
+    timer.stages[EvaluationStage.RESOLVE] = 0.005
+    timer.stages[EvaluationStage.TYPE_CHECK] = 0.5
+    timer.stop()
+    histograms = instrumentation.snapshot()[("domain", FlagType.INTEGER)]
+    instrumentation.reset()
+
+    # Then
+    assert histograms[EvaluationStage.RESOLVE].counts == (0, 1, 0)
+    assert histograms[EvaluationStage.TYPE_CHECK].counts == (0, 0, 1)
+    assert histograms[EvaluationStage.TYPE_CHECK].bounds == (0.001, 0.01)
+    assert instrumentation.snapshot() == {}
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    ({"slow_threshold": -1}, {"buckets": ()}, {"buckets": (0.1, 0.01)}),
+)
+def test_should_reject_invalid_settings(kwargs):
+    with pytest.raises(GeneralError):
+        EvaluationInstrumentation(**kwargs)
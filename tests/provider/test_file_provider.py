@@ -0,0 +1,283 @@
+import json
+import os
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from openfeature import api
+from openfeature.event import ProviderEvent, ProviderEventDetails
+from openfeature.exception import ErrorCode, ParseError
+from openfeature.flag_evaluation import Reason
+from openfeature.provider import file_provider
+from openfeature.provider.file_provider import FileProvider
+
+
+def write_flags(path, flags, **extra):
+    path.write_text(json.dumps({**extra, "flags": flags}, indent=2))
+    # make sure the modification is detected on coarse file system clocks
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def flag(default_variant="on", **kwargs):
+    return {
+        "variants": {"on": True, "off": False},
+        "defaultVariant": default_variant,
+        **kwargs,
+    }
+
+
+@pytest.fixture
+def flags_file(tmp_path):
+    path = tmp_path / "flags.json"
+    write_flags(path, {"first": flag(), "second": flag("off")})
+    return path
+
+
+def test_loads_flags_from_the_file(flags_file):
+    # Given
+    provider = FileProvider(flags_file)
+
+    # When
+    provider.initialize(None)
+
+    # Then
+    try:
+        first = provider.resolve_boolean_details("first", False)
+        second = provider.resolve_boolean_details("second", True)
+        assert (first.value, first.variant, first.reason) == (True, "on", Reason.STATIC)
+        assert (second.value, second.variant) == (False, "off")
+        assert provider.get_metadata().name == "File Provider"
+    finally:
+        provider.shutdown()
+
+
+def test_reload_only_rebuilds_changed_flags(flags_file):
+    # Given
+    provider = FileProvider(flags_file)
+    provider.reload()
+    first = provider._flags["first"]
+    provider._on_emit = MagicMock()
+
+    # When
+    write_flags(
+        flags_file,
+        {"first": flag(), "second": flag("on"), "third": flag()},
+        other={"ignored": [1, 2.5, None]},
+    )
+    flags_changed = provider.reload()
+
+    # Then
+    assert flags_changed == ["second", "third"]
+    assert provider._flags["first"] is first
+    assert provider.resolve_boolean_details("second", False).value is True
+    provider._on_emit.assert_called_once_with(
+        provider,
+        ProviderEvent.PROVIDER_CONFIGURATION_CHANGED,
+        ProviderEventDetails(flags_changed=["second", "third"]),
+    )
+
+
+def test_reload_reports_removed_flags(flags_file):
+    # Given
+    provider = FileProvider(flags_file)
+    provider.reload()
+
+    # When
+    write_flags(flags_file, {"first": flag()})
+    flags_changed = provider.reload()
+
+    # Then
+    assert flags_changed == ["second"]
+    assert (
+        provider.resolve_boolean_details("second", False).error_code
+        == ErrorCode.FLAG_NOT_FOUND
+    )
+
+
+def test_reload_skips_unchanged_files(flags_file):
+    # Given
+    provider = FileProvider(flags_file)
+    provider.reload()
+    provider._load = MagicMock()
+
+    # When
+    flags_changed = provider.reload()
+
+    # Then
+    assert flags_changed == []
+    provider._load.assert_not_called()
+
+
+def test_parses_files_larger_than_a_chunk(flags_file, monkeypatch):
+    # Given
+    monkeypatch.setattr(file_provider, "_CHUNK_SIZE", 7)
+    flags = {
+        f"flag-{i}": flag(metadata={"number": 12345.678, "text": "é" * i})
+        for i in range(50)
+    }
+    write_flags(flags_file, flags)
+    provider = FileProvider(flags_file)
+
+    # When
+    provider.reload()
+
+    # Then
+    assert sorted(provider._flags) == sorted(flags)
+    details = provider.resolve_boolean_details("flag-42", False)
+    assert details.flag_metadata == {"number": 12345.678, "text": "é" * 42}
+
+
+def test_decodes_large_flag_definitions_in_linear_time(flags_file, monkeypatch):
+    # Given
+    monkeypatch.setattr(file_provider, "_CHUNK_SIZE", 7)
+    decoder = MagicMock(wraps=file_provider._decoder)
+    monkeypatch.setattr(file_provider, "_decoder", decoder)
+    write_flags(flags_file, {"flag": flag(metadata={"text": "x" * 100_000})})
+    provider = FileProvider(flags_file)
+
+    # When
+    provider.reload()
+
+    # Then
+    assert provider._flags["flag"].flag_metadata == {"text": "x" * 100_000}
+    # rather than once per chunk of the definition
+    assert decoder.raw_decode.call_count < 50
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "",
+        "[]",
+        '{"flags": {"flag": {"variants": {"on": true}}}}',
+        '{"flags": {"flag": {"variants": {"on": true}, "defaultVariant": "off"}}}',
+        '{"flags": {"flag": ',
+        '{"flags": {}} trailing',
+    ],
+)
+def test_invalid_files_raise_a_parse_error_and_keep_the_flags(flags_file, content):
+    # Given
+    provider = FileProvider(flags_file)
+    provider.reload()
+
+    # When
+    flags_file.write_text(content)
+    with pytest.raises(ParseError):
+        provider.reload()
+
+    # Then
+    assert provider.resolve_boolean_details("first", False).value is True
+
+
+def test_reload_does_not_parse_an_unchanged_invalid_file_again(flags_file):
+    # Given
+    flags_file.write_text('{"flags": {"flag": ')
+    provider = FileProvider(flags_file)
+    with pytest.raises(ParseError) as first_error:
+        provider.reload()
+    provider._load = MagicMock(wraps=provider._load)
+
+    # When
+    with pytest.raises(ParseError) as second_error:
+        provider.reload()
+
+    # Then
+    provider._load.assert_not_called()
+    assert second_error.value.error_message == first_error.value.error_message
+
+
+def test_missing_files_raise_a_parse_error(tmp_path):
+    with pytest.raises(ParseError):
+        FileProvider(tmp_path / "missing.json").reload()
+
+
+def test_polls_the_file_for_changes(flags_file):
+    # Given
+    changed = threading.Event()
+    flags_changed = []
+
+    def on_configuration_changed(details):
+        flags_changed.append(details.flags_changed)
+        changed.set()
+
+    provider = FileProvider(flags_file, poll_interval=0.01)
+    api.set_provider_and_wait(provider)
+    api.add_handler(
+        ProviderEvent.PROVIDER_CONFIGURATION_CHANGED, on_configuration_changed
+    )
+    client = api.get_client()
+
+    # When
+    write_flags(flags_file, {"first": flag("off"), "second": flag("off")})
+
+    # Then
+    assert changed.wait(1)
+    assert flags_changed == [["first"]]
+    assert client.get_boolean_value("first", True) is False
+    api.shutdown()
+
+
+def test_becomes_ready_once_a_missing_file_appears(tmp_path):
+    # Given
+    flags_file = tmp_path / "flags.json"
+    provider = FileProvider(flags_file, poll_interval=0.01)
+    ready = threading.Event()
+    events = []
+
+    def on_emit(provider, event, details):
+        events.append(event)
+        if event == ProviderEvent.PROVIDER_READY:
+            ready.set()
+
+    provider._on_emit = on_emit
+
+    # When
+    with pytest.raises(ParseError):
+        provider.initialize(None)
+    threading.Event().wait(0.05)
+    flags_file.write_text("{")
+    threading.Event().wait(0.05)
+    write_flags(flags_file, {"first": flag()})
+
+    # Then
+    try:
+        assert ready.wait(1)
+        # the error was reported by initialize, and is not reported again
+        assert events == [
+            ProviderEvent.PROVIDER_CONFIGURATION_CHANGED,
+            ProviderEvent.PROVIDER_READY,
+        ]
+        assert provider.resolve_boolean_details("first", False).value is True
+    finally:
+        provider.shutdown()
+
+
+def test_reports_an_invalid_file_once(flags_file):
+    # Given
+    provider = FileProvider(flags_file, poll_interval=0.01)
+    provider.initialize(None)
+    errors = []
+    reported = threading.Event()
+
+    def on_emit(provider, event, details):
+        if event == ProviderEvent.PROVIDER_ERROR:
+            errors.append(details)
+            reported.set()
+
+    provider._on_emit = on_emit
+
+    # When
+    flags_file.write_text("{")
+    assert reported.wait(1)
+    flags_file.write_text("[")
+    threading.Event().wait(0.05)
+
+    # Then
+    provider.shutdown()
+    assert errors == [
+        ProviderEventDetails(
+            message=errors[0].message, error_code=ErrorCode.PARSE_ERROR
+        )
+    ]
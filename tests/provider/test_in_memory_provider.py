@@ -1,8 +1,13 @@
 from numbers import Number
+from unittest.mock import MagicMock
 
 import pytest
 
+from openfeature import api
+from openfeature.cache import EvaluationCache
+from openfeature.client import OpenFeatureClient
 from openfeature.evaluation_context import EvaluationContext
+from openfeature.event import ProviderEvent, ProviderEventDetails
 from openfeature.exception import ErrorCode
 from openfeature.flag_evaluation import FlagResolutionDetails, Reason
 from openfeature.provider.in_memory_provider import (
@@ -218,3 +223,106 @@ def test_should_track_event():
             value=1, details={"key": "value"}, eval_context_attributes={"key": "value"}
         )
     }
+
+
+def test_update_flags_adds_and_replaces_flags_and_emits_the_changed_keys():
+    # Given
+    provider = InMemoryProvider(
+        {
+            "kept": InMemoryFlag("on", {"on": True}),
+            "changed": InMemoryFlag("on", {"on": True, "off": False}),
+        }
+    )
+    provider._on_emit = MagicMock()
+
+    # When
+    flags_changed = provider.update_flags(
+        {
+            "kept": InMemoryFlag("on", {"on": True}),
+            "changed": InMemoryFlag("off", {"on": True, "off": False}),
+            "added": InMemoryFlag("on", {"on": "value"}),
+        }
+    )
+
+    # Then
+    assert flags_changed == ["added", "changed"]
+    assert provider.resolve_boolean_details("changed", True).value is False
+    assert provider.resolve_boolean_details("kept", False).value is True
+    assert provider.resolve_string_details("added", "default").value == "value"
+    provider._on_emit.assert_called_once_with(
+        provider,
+        ProviderEvent.PROVIDER_CONFIGURATION_CHANGED,
+        ProviderEventDetails(flags_changed=["added", "changed"]),
+    )
+
+
+def test_replace_flags_reports_removed_flags():
+    # Given
+    provider = InMemoryProvider(
+        {
+            "kept": InMemoryFlag("on", {"on": True}),
+            "removed": InMemoryFlag("on", {"on": True}),
+        }
+    )
+    provider._on_emit = MagicMock()
+
+    # When
+    flags_changed = provider.replace_flags({"kept": InMemoryFlag("on", {"on": True})})
+
+    # Then
+    assert flags_changed == ["removed"]
+    assert (
+        provider.resolve_boolean_details("removed", False).error_code
+        == ErrorCode.FLAG_NOT_FOUND
+    )
+    provider._on_emit.assert_called_once()
+
+
+def test_updates_without_changes_emit_no_event():
+    # Given
+    flags = {"flag": InMemoryFlag("on", {"on": True})}
+    provider = InMemoryProvider(flags)
+    provider._on_emit = MagicMock()
+
+    # When
+    flags_changed = provider.update_flags(dict(flags))
+
+    # Then
+    assert flags_changed == []
+    provider._on_emit.assert_not_called()
+
+
+def test_flags_are_copied_and_immutable():
+    # Given
+    flags = {"flag": InMemoryFlag("on", {"on": True})}
+    provider = InMemoryProvider(flags)
+
+    # When
+    flags["flag"] = InMemoryFlag("off", {"off": False})
+
+    # Then
+    assert provider.resolve_boolean_details("flag", False).value is True
+    with pytest.raises(TypeError):
+        provider._flags["flag"] = InMemoryFlag("off", {"off": False})
+
+
+def test_configuration_changed_event_invalidates_only_changed_flags_in_caches():
+    # Given
+    provider = InMemoryProvider(
+        {
+            "flag": InMemoryFlag("on", {"on": True, "off": False}),
+            "other-flag": InMemoryFlag("on", {"on": True, "off": False}),
+        }
+    )
+    api.set_provider(provider)
+    cache = EvaluationCache()
+    client = OpenFeatureClient(domain=None, version=None, cache=cache)
+    client.get_boolean_value("flag", False)
+    client.get_boolean_value("other-flag", False)
+
+    # When
+    provider.update_flags({"flag": InMemoryFlag("off", {"on": True, "off": False})})
+
+    # Then
+    assert client.get_boolean_value("flag", True) is False
+    assert client.get_boolean_details("other-flag", False).reason == Reason.CACHED
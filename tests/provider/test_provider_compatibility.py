@@ -2,7 +2,13 @@ import pytest
 
 from openfeature.api import get_client, set_provider
 from openfeature.evaluation_context import EvaluationContext
-from openfeature.flag_evaluation import FlagResolutionDetails
+from openfeature.exception import ErrorCode, FlagNotFoundError
+from openfeature.flag_evaluation import (
+    FlagEvaluationRequest,
+    FlagResolutionDetails,
+    FlagType,
+    Reason,
+)
 from openfeature.provider import AbstractProvider, Metadata
 
 
@@ -193,3 +199,30 @@ async def test_async_provider_not_implemented_exception_workaround():
     # Then
     assert flag is not None
     assert flag is True
+
+
+@pytest.mark.asyncio
+async def test_default_bulk_resolution_resolves_flags_one_by_one():
+    # Given
+    class PartiallyFailingProvider(SynchronousProvider):
+        def resolve_integer_details(self, flag_key, default_value, evaluation_context):
+            raise FlagNotFoundError(f"Flag '{flag_key}' not found")
+
+    provider = PartiallyFailingProvider()
+    flags = [
+        FlagEvaluationRequest("bool", FlagType.BOOLEAN, False),
+        FlagEvaluationRequest("int", FlagType.INTEGER, 3),
+        FlagEvaluationRequest("object", FlagType.OBJECT, {}),
+    ]
+
+    # When
+    sync_resolutions = provider.resolve_bulk_details(flags, EvaluationContext())
+    async_resolutions = await provider.resolve_bulk_details_async(flags)
+
+    # Then
+    for resolutions in (sync_resolutions, async_resolutions):
+        assert resolutions["bool"].value is True
+        assert resolutions["object"].value == {"key": "value"}
+        assert resolutions["int"].value == 3
+        assert resolutions["int"].reason == Reason.ERROR
+        assert resolutions["int"].error_code == ErrorCode.FLAG_NOT_FOUND
@@ -0,0 +1,181 @@
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from openfeature import api
+from openfeature.exception import GeneralError
+from openfeature.hook.telemetry_hook import TelemetryHook
+from openfeature.provider.in_memory_provider import InMemoryFlag, InMemoryProvider
+from openfeature.telemetry import EvaluationEvent, TelemetryAttribute
+from openfeature.telemetry.exporter import (
+    BatchingEventExporter,
+    ExporterStatistics,
+    InMemoryEventSink,
+    JsonLinesEventSink,
+)
+
+
+def event(flag_key):
+    return EvaluationEvent(
+        name="feature_flag.evaluation",
+        attributes={TelemetryAttribute.KEY: flag_key},
+        body={},
+    )
+
+
+class BlockingSink(InMemoryEventSink):
+    def __init__(self):
+        super().__init__()
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def export(self, events):
+        self.started.set()
+        self.release.wait(1)
+        super().export(events)
+
+
+def test_telemetry_hook_exports_an_event_per_evaluation():
+    # Given
+    sink = InMemoryEventSink()
+    exporter = BatchingEventExporter(sink, batch_size=2, flush_interval=60)
+    api.set_provider(InMemoryProvider({"flag": InMemoryFlag("on", {"on": True})}))
+    client = api.get_client()
+    client.add_hooks([TelemetryHook(exporter)])
+
+    # When
+    for _ in range(3):
+        client.get_boolean_value("flag", False)
+    assert exporter.flush(1)
+
+    # Then
+    assert [e.attributes[TelemetryAttribute.KEY] for e in sink.events] == ["flag"] * 3
+    assert sink.events[0].attributes[TelemetryAttribute.VARIANT] == "on"
+    assert sink.batches == 2
+    assert exporter.get_statistics() == ExporterStatistics(exported=3)
+
+
+def test_exporter_ships_batches_on_its_flush_interval():
+    # Given
+    sink = InMemoryEventSink()
+    exporter = BatchingEventExporter(sink, batch_size=100, flush_interval=0.01)
+
+    # When
+    exporter.export(event("flag"))
+    for _ in range(100):
+        if sink.events:
+            break
+        threading.Event().wait(0.01)
+
+    # Then
+    assert len(sink.events) == 1
+
+
+def test_exporter_overwrites_the_oldest_events_once_its_buffer_is_full():
+    # Given
+    sink = BlockingSink()
+    exporter = BatchingEventExporter(
+        sink, buffer_size=2, batch_size=1, flush_interval=60
+    )
+
+    # When
+    exporter.export(event("in-flight"))
+    assert sink.started.wait(1)
+    for flag_key in ("dropped", "kept-1", "kept-2"):
+        exporter.export(event(flag_key))
+    statistics = exporter.get_statistics()
+    sink.release.set()
+    exporter.shutdown(1)
+
+    # Then
+    assert statistics == ExporterStatistics(dropped=1, buffered=2)
+    assert [e.attributes[TelemetryAttribute.KEY] for e in sink.events] == [
+        "in-flight",
+        "kept-1",
+        "kept-2",
+    ]
+    exporter.export(event("closed"))
+    assert exporter.get_statistics() == ExporterStatistics(exported=3, dropped=2)
+
+
+def test_exporter_counts_the_events_of_failed_batches(caplog):
+    # Given
+    sink = MagicMock(spec=InMemoryEventSink)
+    sink.export.side_effect = RuntimeError("boom")
+    exporter = BatchingEventExporter(sink, batch_size=2, flush_interval=60)
+
+    # When
+    exporter.export(event("a"))
+    exporter.export(event("b"))
+    assert exporter.flush(1)
+
+    # Then
+    assert exporter.get_statistics() == ExporterStatistics(failed=2)
+    assert "Exception when exporting evaluation events" in caplog.text
+
+
+def test_json_lines_sink_appends_one_event_per_line(tmp_path):
+    # Given
+    path = tmp_path / "events.jsonl"
+    sink = JsonLinesEventSink(path)
+
+    # When
+    sink.export([event("a")])
+    sink.export([event("b")])
+
+    # Then
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert lines == [
+        {
+            "name": "feature_flag.evaluation",
+            "attributes": {"feature_flag.key": flag_key},
+            "body": {},
+        }
+        for flag_key in ("a", "b")
+    ]
+
+
+def test_shutdown_ships_the_events_of_every_exporter():
+    # Given
+    sink = InMemoryEventSink()
+    exporter = BatchingEventExporter(sink, batch_size=10, flush_interval=60)
+    exporter.export(event("flag"))
+
+    # When
+    api.shutdown()
+
+    # Then
+    assert [e.attributes[TelemetryAttribute.KEY] for e in sink.events] == ["flag"]
+    exporter.export(event("closed"))
+    assert exporter.get_statistics() == ExporterStatistics(exported=1, dropped=1)
+
+
+def test_shutdown_logs_the_events_still_buffered(caplog, monkeypatch):
+    # Given
+    monkeypatch.setattr(api, "_SHUTDOWN_TIMEOUT", 0.01)
+    sink = BlockingSink()
+    exporter = BatchingEventExporter(sink, batch_size=1, flush_interval=60)
+    exporter.export(event("in-flight"))
+    assert sink.started.wait(1)
+    exporter.export(event("buffered"))
+
+    # When
+    api.shutdown()
+    sink.release.set()
+
+    # Then
+    assert (
+        "1 evaluation events were still buffered by an exporter after 0.01 seconds"
+        in caplog.text
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    ({"batch_size": 0}, {"buffer_size": 1, "batch_size": 2}, {"flush_interval": 0}),
+)
+def test_exporter_rejects_invalid_settings(kwargs):
+    with pytest.raises(GeneralError):
+        BatchingEventExporter(InMemoryEventSink(), **kwargs)
@@ -0,0 +1,105 @@
+import pytest
+
+from openfeature.evaluation_context import EvaluationContext
+from openfeature.exception import ErrorCode, GeneralError
+from openfeature.flag_evaluation import FlagEvaluationDetails, FlagType, Reason
+from openfeature.hook import HookContext
+from openfeature.hook.telemetry_hook import TelemetryHook
+from openfeature.telemetry import TelemetryAttribute, TelemetryFlagMetadata
+from openfeature.telemetry.exporter import BatchingEventExporter, InMemoryEventSink
+from openfeature.telemetry.sampling import EvaluationEventSampler
+
+
+def hook_context(targeting_key, flag_key="flag"):
+    return HookContext(
+        flag_key, FlagType.BOOLEAN, False, EvaluationContext(targeting_key)
+    )
+
+
+def details(flag_key="flag", reason=Reason.STATIC, **kwargs):
+    return FlagEvaluationDetails(flag_key, True, reason=reason, **kwargs)
+
+
+def test_sampling_decision_is_the_same_for_every_evaluation_of_a_context():
+    # Given
+    sampler = EvaluationEventSampler(rate=0.5)
+    users = [f"user-{i}" for i in range(1000)]
+
+    # When
+    first = [sampler.get_weight(hook_context(user), details()) for user in users]
+    second = [
+        sampler.get_weight(hook_context(user, "other"), details("other"))
+        for user in users
+    ]
+
+    # Then
+    assert first == second
+    assert set(first) == {None, 2.0}
+    assert 400 < first.count(2.0) < 600
+
+
+def test_sampling_uses_the_context_id_of_the_flag_metadata():
+    # Given
+    sampler = EvaluationEventSampler(rate=0.5)
+    sampled = next(
+        f"user-{i}"
+        for i in range(100)
+        if sampler.get_weight(hook_context(f"user-{i}"), details())
+    )
+    dropped = next(
+        f"user-{i}"
+        for i in range(100)
+        if not sampler.get_weight(hook_context(f"user-{i}"), details())
+    )
+
+    # When
+    weight = sampler.get_weight(
+        hook_context(dropped),
+        details(flag_metadata={TelemetryFlagMetadata.CONTEXT_ID: sampled}),
+    )
+
+    # Then
+    assert weight == 2.0
+
+
+def test_sampling_applies_flag_rates_and_keeps_errors():
+    # Given
+    sampler = EvaluationEventSampler(rate=0.0, flag_rates={"important": 1.0})
+    error = details(reason=Reason.ERROR, error_code=ErrorCode.PROVIDER_NOT_READY)
+
+    # Then
+    assert sampler.get_weight(hook_context("user"), details()) is None
+    assert sampler.get_weight(hook_context("user"), details("important")) == 1.0
+    assert sampler.get_weight(hook_context("user"), error) == 1.0
+    assert (
+        EvaluationEventSampler(rate=0.0, keep_errors=False).get_weight(
+            hook_context("user"), error
+        )
+        is None
+    )
+
+
+def test_sampled_events_record_their_weight():
+    # Given
+    sink = InMemoryEventSink()
+    exporter = BatchingEventExporter(sink, flush_interval=60)
+    hook = TelemetryHook(exporter, EvaluationEventSampler(rate=0.25))
+
+    # When
+    for i in range(200):
+        hook.finally_after(hook_context(f"user-{i}"), details(), {})
+    exporter.flush(1)
+
+    # Then
+    assert 20 < len(sink.events) < 80
+    assert {e.attributes[TelemetryAttribute.SAMPLING_WEIGHT] for e in sink.events} == {
+        "4.0"
+    }
+
+
+@pytest.mark.parametrize(
+    "kwargs", ({"rate": 1.5}, {"rate": -0.1}, {"flag_rates": {"flag": 2}})
+)
+def test_sampler_rejects_invalid_rates(kwargs):
+    with pytest.raises(GeneralError):
+        EvaluationEventSampler(**kwargs)
@@ -1,10 +1,14 @@
+import asyncio
+import contextvars
 import inspect
+import logging
 import threading
 import time
+import tracemalloc
 import types
 import uuid
 from concurrent.futures import ThreadPoolExecutor
-from unittest.mock import MagicMock, Mock
+from unittest.mock import AsyncMock, MagicMock, Mock
 
 import pytest
 
@@ -18,13 +22,28 @@ from openfeature.api import (
     set_provider,
     set_transaction_context,
 )
+from openfeature.cache import CacheStatistics, EvaluationCache
 from openfeature.client import OpenFeatureClient, _typecheck_flag_value
-from openfeature.evaluation_context import EvaluationContext
+from openfeature.evaluation_context import (
+    EvaluationContext,
+    get_evaluation_context_version,
+)
 from openfeature.event import EventDetails, ProviderEvent, ProviderEventDetails
 from openfeature.exception import ErrorCode, OpenFeatureError, ProviderFatalError
-from openfeature.flag_evaluation import FlagResolutionDetails, FlagType, Reason
-from openfeature.hook import Hook
-from openfeature.provider import FeatureProvider, ProviderStatus
+from openfeature.flag_evaluation import (
+    FlagEvaluationDetails,
+    FlagEvaluationOptions,
+    FlagResolutionDetails,
+    FlagType,
+    Reason,
+)
+from openfeature.hook import AsyncHook, Hook
+from openfeature.provider import (
+    AbstractProvider,
+    FeatureProvider,
+    Metadata,
+    ProviderStatus,
+)
 from openfeature.provider._registry import provider_registry
 from openfeature.provider.in_memory_provider import InMemoryFlag, InMemoryProvider
 from openfeature.provider.no_op_provider import NoOpProvider
@@ -800,3 +819,1092 @@ def test_assert_provider_status_uses_passed_provider_not_current_registry_state(
         assert c._assert_provider_status(ready_provider) is None
     finally:
         client_module.provider_registry = original
+
+
+def test_evaluation_plan_is_reused_between_evaluations(no_op_provider_client):
+    # Given
+    no_op_provider_client.get_boolean_value("Key", False)
+    plan = no_op_provider_client._evaluation_plan
+
+    # When
+    no_op_provider_client.get_string_value("Key", "default")
+
+    # Then
+    assert plan is not None
+    assert no_op_provider_client._evaluation_plan is plan
+
+
+@pytest.mark.parametrize(
+    "change",
+    (
+        pytest.param(lambda client: api.add_hooks([Hook()]), id="api_add_hooks"),
+        pytest.param(lambda client: api.clear_hooks(), id="api_clear_hooks"),
+        pytest.param(lambda client: client.add_hooks([Hook()]), id="client_add_hooks"),
+        pytest.param(lambda client: setattr(client, "hooks", []), id="client_hooks"),
+        pytest.param(
+            lambda client: client.hooks.append(Hook()), id="client_hooks_in_place"
+        ),
+        pytest.param(
+            lambda client: api.get_hooks().append(Hook()), id="api_hooks_in_place"
+        ),
+        pytest.param(lambda client: api.set_provider(NoOpProvider()), id="provider"),
+        pytest.param(
+            lambda client: api.set_provider(NoOpProvider(), "other-domain"),
+            id="domain_provider",
+        ),
+        pytest.param(lambda client: api.clear_providers(), id="clear_providers"),
+    ),
+)
+def test_evaluation_plan_is_rebuilt_when_hooks_or_providers_change(
+    no_op_provider_client, change
+):
+    # Given
+    no_op_provider_client.get_boolean_value("Key", False)
+    plan = no_op_provider_client._evaluation_plan
+
+    # When
+    change(no_op_provider_client)
+    no_op_provider_client.get_boolean_value("Key", False)
+
+    # Then
+    assert no_op_provider_client._evaluation_plan is not plan
+    api.clear_hooks()
+
+
+def test_evaluation_plan_orders_invocation_hooks_between_client_and_provider_hooks():
+    # Given
+    api_hook, client_hook, invocation_hook, provider_hook = (
+        Hook(),
+        Hook(),
+        Hook(),
+        Hook(),
+    )
+    provider = NoOpProvider()
+    provider.get_provider_hooks = lambda: [provider_hook]
+    api.set_provider(provider)
+    api.add_hooks([api_hook])
+    client = get_client()
+    client.add_hooks([client_hook])
+
+    # When
+    plan = client._get_evaluation_plan()
+    hooks, reversed_hooks = plan.get_ordered_hooks([invocation_hook])
+
+    # Then
+    assert hooks == (api_hook, client_hook, invocation_hook, provider_hook)
+    assert reversed_hooks == hooks[::-1]
+    assert plan.get_ordered_hooks([]) == (plan.hooks, plan.reversed_hooks)
+    assert plan.hooks == (api_hook, client_hook, provider_hook)
+    api.clear_hooks()
+
+
+@pytest.mark.asyncio
+async def test_should_skip_hook_stages_when_there_are_no_hooks(monkeypatch):
+    # Given
+    api.set_provider(
+        InMemoryProvider({"Key": InMemoryFlag("on", {"on": True, "off": False})})
+    )
+    client = get_client()
+    hook_stages = MagicMock()
+    for stage in (
+        "run_before_hooks",
+        "run_after_hooks",
+        "run_error_hooks",
+        "run_after_all_hooks",
+    ):
+        monkeypatch.setattr(client_module, stage, getattr(hook_stages, stage))
+
+    # When
+    details_sync = client.get_boolean_details("Key", False)
+    details_async = await client.get_boolean_details_async("Key", False)
+
+    # Then
+    for details in (details_sync, details_async):
+        assert details.value is True
+        assert details.variant == "on"
+        assert details.reason == Reason.STATIC
+    assert not hook_stages.mock_calls
+
+
+@pytest.mark.asyncio
+async def test_fast_path_should_report_errors_like_the_hooked_path():
+    # Given
+    provider = MagicMock(spec=FeatureProvider)
+    provider.get_provider_hooks.return_value = []
+    provider.resolve_boolean_details.side_effect = Exception("boom")
+    provider.resolve_boolean_details_async.side_effect = Exception("boom")
+    provider.resolve_string_details.return_value = FlagResolutionDetails(
+        value="resolved",
+        reason=Reason.ERROR,
+        error_code=ErrorCode.PARSE_ERROR,
+        error_message="bad flag",
+    )
+    set_provider(provider)
+    client = get_client()
+
+    # When
+    generic_error_sync = client.get_boolean_details("Key", True)
+    generic_error_async = await client.get_boolean_details_async("Key", True)
+    resolution_error = client.get_string_details("Key", "default")
+
+    # Then
+    for details in (generic_error_sync, generic_error_async):
+        assert details.value is True
+        assert details.reason == Reason.ERROR
+        assert details.error_code == ErrorCode.GENERAL
+        assert details.error_message == "boom"
+    assert resolution_error.value == "default"
+    assert resolution_error.error_code == ErrorCode.PARSE_ERROR
+    assert resolution_error.error_message == "bad flag"
+
+
+BULK_FLAGS = {
+    "bool-flag": InMemoryFlag("on", {"on": True, "off": False}),
+    "string-flag": InMemoryFlag("greeting", {"greeting": "hi"}),
+    "int-flag": InMemoryFlag("one", {"one": 1}),
+}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_async", (False, True))
+async def test_should_evaluate_many_flags_in_one_call(use_async):
+    # Given
+    api.set_provider(InMemoryProvider(BULK_FLAGS))
+    client = get_client()
+    flags = [
+        ("bool-flag", FlagType.BOOLEAN, False),
+        ("string-flag", FlagType.STRING, "default"),
+        ("int-flag", FlagType.STRING, "default"),
+        ("missing-flag", FlagType.INTEGER, 42),
+    ]
+
+    # When
+    if use_async:
+        results = await client.evaluate_many_async(flags)
+    else:
+        results = client.evaluate_many(flags)
+
+    # Then
+    assert list(results) == ["bool-flag", "string-flag", "int-flag", "missing-flag"]
+    assert results["bool-flag"].value is True
+    assert results["bool-flag"].variant == "on"
+    assert results["string-flag"].value == "hi"
+    assert results["int-flag"].error_code == ErrorCode.TYPE_MISMATCH
+    assert results["missing-flag"].value == 42
+    assert results["missing-flag"].error_code == ErrorCode.FLAG_NOT_FOUND
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_async", (False, True))
+async def test_evaluate_many_should_resolve_the_batch_with_one_provider_call(use_async):
+    # Given
+    provider = InMemoryProvider(BULK_FLAGS)
+    provider.resolve_bulk_details = MagicMock(wraps=provider.resolve_bulk_details)
+    provider.resolve_bulk_details_async = MagicMock(
+        wraps=provider.resolve_bulk_details_async
+    )
+    api.set_provider(provider)
+    client = get_client()
+    evaluation_context = EvaluationContext("user", {"plan": "pro"})
+    flags = [
+        ("bool-flag", FlagType.BOOLEAN, False),
+        ("string-flag", FlagType.STRING, "default"),
+    ]
+
+    # When
+    if use_async:
+        await client.evaluate_many_async(flags, evaluation_context)
+        bulk_resolver = provider.resolve_bulk_details_async
+    else:
+        client.evaluate_many(flags, evaluation_context)
+        bulk_resolver = provider.resolve_bulk_details
+
+    # Then
+    bulk_resolver.assert_called_once()
+    requests, context = bulk_resolver.call_args.args
+    assert [request.flag_key for request in requests] == ["bool-flag", "string-flag"]
+    assert context.targeting_key == "user"
+    assert context.attributes["plan"] == "pro"
+
+
+def test_evaluate_many_should_run_hook_stages_for_every_flag():
+    # Given
+    api.set_provider(InMemoryProvider(BULK_FLAGS))
+    client = get_client()
+    spy_hook = MagicMock(spec=Hook)
+    spy_hook.before.return_value = None
+
+    # When
+    results = client.evaluate_many(
+        [
+            ("bool-flag", FlagType.BOOLEAN, False),
+            ("missing-flag", FlagType.BOOLEAN, False),
+        ],
+        flag_evaluation_options=FlagEvaluationOptions(hooks=[spy_hook]),
+    )
+
+    # Then
+    assert results["bool-flag"].value is True
+    assert spy_hook.before.call_count == 2
+    spy_hook.after.assert_called_once()
+    spy_hook.error.assert_called_once()
+    assert spy_hook.finally_after.call_count == 2
+    hook_contexts = [
+        call.kwargs["hook_context"] for call in spy_hook.before.call_args_list
+    ]
+    assert [hook_context.flag_key for hook_context in hook_contexts] == [
+        "bool-flag",
+        "missing-flag",
+    ]
+
+
+def test_evaluate_many_should_resolve_separately_flags_with_a_hook_context():
+    # Given
+    class TargetingHook(Hook):
+        def before(self, hook_context, hints):
+            if hook_context.flag_key == "string-flag":
+                return EvaluationContext("hooked-user")
+            return None
+
+    provider = InMemoryProvider(BULK_FLAGS)
+    provider.resolve_bulk_details = MagicMock(wraps=provider.resolve_bulk_details)
+    api.set_provider(provider)
+    client = get_client()
+    client.add_hooks([TargetingHook()])
+
+    # When
+    client.evaluate_many(
+        [
+            ("bool-flag", FlagType.BOOLEAN, False),
+            ("string-flag", FlagType.STRING, "default"),
+            ("int-flag", FlagType.INTEGER, 0),
+        ],
+        EvaluationContext("user"),
+    )
+
+    # Then
+    batches = {
+        context.targeting_key: [request.flag_key for request in requests]
+        for requests, context in (
+            call.args for call in provider.resolve_bulk_details.call_args_list
+        )
+    }
+    assert batches == {
+        "user": ["bool-flag", "int-flag"],
+        "hooked-user": ["string-flag"],
+    }
+
+
+def test_evaluate_many_should_shortcircuit_if_provider_is_not_ready(
+    no_op_provider_client, monkeypatch
+):
+    # Given
+    monkeypatch.setattr(
+        provider_registry,
+        "get_provider_status",
+        lambda provider: ProviderStatus.NOT_READY,
+    )
+    spy_hook = MagicMock(spec=Hook)
+    no_op_provider_client.add_hooks([spy_hook])
+
+    # When
+    results = no_op_provider_client.evaluate_many(
+        [("a", FlagType.BOOLEAN, True), ("b", FlagType.STRING, "b")]
+    )
+
+    # Then
+    assert {key: details.value for key, details in results.items()} == {
+        "a": True,
+        "b": "b",
+    }
+    for details in results.values():
+        assert details.error_code == ErrorCode.PROVIDER_NOT_READY
+    assert spy_hook.error.call_count == 2
+    spy_hook.before.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "evaluate_many",
+    (
+        pytest.param(lambda client, flags: client.evaluate_many(flags), id="sync"),
+        pytest.param(
+            lambda client, flags: client.evaluate_many_async(flags), id="async"
+        ),
+        pytest.param(
+            lambda client, flags: client.evaluate_many_concurrently_async(flags),
+            id="concurrent",
+        ),
+    ),
+)
+async def test_evaluate_many_should_reject_duplicate_flag_keys(evaluate_many):
+    # Given
+    api.set_provider(InMemoryProvider(BULK_FLAGS))
+    client = get_client()
+    flags = [
+        ("bool-flag", FlagType.BOOLEAN, False),
+        ("bool-flag", FlagType.STRING, "default"),
+    ]
+
+    # When
+    with pytest.raises(OpenFeatureError) as exc_info:
+        result = evaluate_many(client, flags)
+        if inspect.isawaitable(result):
+            await result
+
+    # Then
+    assert exc_info.value.error_code == ErrorCode.GENERAL
+
+
+def test_evaluate_many_should_isolate_a_failing_bulk_resolution():
+    # Given
+    provider = MagicMock(spec=AbstractProvider)
+    provider.get_provider_hooks.return_value = []
+    provider.resolve_bulk_details.side_effect = Exception("backend down")
+    set_provider(provider)
+    client = get_client()
+
+    # When
+    results = client.evaluate_many([("a", FlagType.BOOLEAN, True)])
+
+    # Then
+    assert results["a"].value is True
+    assert results["a"].error_code == ErrorCode.GENERAL
+    assert results["a"].error_message == "backend down"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_async", (False, True))
+async def test_evaluate_many_should_resolve_one_by_one_without_bulk_resolution(
+    use_async,
+):
+    # Given
+    class ProtocolProvider(FeatureProvider):
+        def get_metadata(self):
+            return Metadata(name="protocol")
+
+        def get_provider_hooks(self):
+            return []
+
+        def resolve_boolean_details(
+            self, flag_key, default_value, evaluation_context=None
+        ):
+            return FlagResolutionDetails(True, reason=Reason.STATIC)
+
+        async def resolve_boolean_details_async(
+            self, flag_key, default_value, evaluation_context=None
+        ):
+            return FlagResolutionDetails(True, reason=Reason.STATIC)
+
+    set_provider(ProtocolProvider())
+    client = get_client()
+    spy_hook = MagicMock(spec=Hook)
+    spy_hook.before.return_value = None
+    client.add_hooks([spy_hook])
+    flags = [("a", FlagType.BOOLEAN, False), ("b", FlagType.BOOLEAN, False)]
+
+    # When
+    if use_async:
+        results = await client.evaluate_many_async(flags)
+    else:
+        results = client.evaluate_many(flags)
+
+    # Then
+    assert [details.value for details in results.values()] == [True, True]
+    assert spy_hook.after.call_count == 2
+    assert spy_hook.finally_after.call_count == 2
+
+
+@pytest.mark.parametrize("resolutions", (None, ["a"], {"a": "not details"}))
+def test_evaluate_many_should_isolate_an_invalid_bulk_resolution(resolutions):
+    # Given
+    provider = MagicMock(spec=AbstractProvider)
+    provider.get_provider_hooks.return_value = []
+    provider.resolve_bulk_details.return_value = resolutions
+    set_provider(provider)
+    client = get_client()
+    spy_hook = MagicMock(spec=Hook)
+    spy_hook.before.return_value = None
+    client.add_hooks([spy_hook])
+
+    # When
+    results = client.evaluate_many([("a", FlagType.BOOLEAN, True)])
+
+    # Then
+    assert results["a"].value is True
+    assert results["a"].error_code == ErrorCode.GENERAL
+    spy_hook.error.assert_called_once()
+    spy_hook.finally_after.assert_called_once()
+
+
+class SlowAsyncProvider(InMemoryProvider):
+    def __init__(self, flags, delays):
+        super().__init__(flags)
+        self.delays = delays
+        self.running = 0
+        self.max_running = 0
+
+    async def _resolve_async(self, flag_key, default_value, evaluation_context):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delays.get(flag_key, 0))
+            if flag_key == "broken-flag":
+                raise Exception("backend down")
+            return self._resolve(flag_key, default_value, evaluation_context)
+        finally:
+            self.running -= 1
+
+
+@pytest.mark.asyncio
+async def test_evaluate_many_concurrently_should_cap_concurrent_resolutions():
+    # Given
+    flags = {
+        f"flag-{i}": InMemoryFlag("on", {"on": True, "off": False}) for i in range(6)
+    }
+    provider = SlowAsyncProvider(flags, dict.fromkeys(flags, 0.01))
+    api.set_provider(provider)
+    client = get_client()
+
+    # When
+    results = await client.evaluate_many_concurrently_async(
+        [(key, FlagType.BOOLEAN, False) for key in flags], max_concurrency=2
+    )
+
+    # Then
+    assert all(details.value is True for details in results.values())
+    assert provider.max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_evaluate_many_concurrently_should_isolate_errors_and_timeouts():
+    # Given
+    flags = {
+        "fast-flag": InMemoryFlag("on", {"on": True, "off": False}),
+        "broken-flag": InMemoryFlag("on", {"on": True, "off": False}),
+        "slow-flag": InMemoryFlag("on", {"on": True, "off": False}),
+    }
+    api.set_provider(SlowAsyncProvider(flags, {"slow-flag": 10}))
+    client = get_client()
+    spy_hook = MagicMock(spec=Hook)
+    spy_hook.before.return_value = None
+    client.add_hooks([spy_hook])
+
+    # When
+    results = await client.evaluate_many_concurrently_async(
+        [(key, FlagType.BOOLEAN, False) for key in flags], timeout=0.1
+    )
+
+    # Then
+    assert results["fast-flag"].value is True
+    assert results["broken-flag"].value is False
+    assert results["broken-flag"].error_code == ErrorCode.GENERAL
+    assert results["broken-flag"].error_message == "backend down"
+    assert results["slow-flag"].value is False
+    assert results["slow-flag"].error_code == ErrorCode.GENERAL
+    assert results["slow-flag"].reason == Reason.ERROR
+    spy_hook.after.assert_called_once()
+    assert spy_hook.error.call_count == 2
+    assert spy_hook.finally_after.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_evaluate_many_concurrently_should_reject_invalid_concurrency_limit():
+    client = get_client()
+    with pytest.raises(OpenFeatureError):
+        await client.evaluate_many_concurrently_async([], max_concurrency=0)
+
+
+def test_merged_context_prefix_is_reused_between_evaluations():
+    # Given
+    api.clear_transaction_context_propagator()
+    api.set_evaluation_context(EvaluationContext("api", {"api": True}))
+    client = OpenFeatureClient(
+        domain=None, version=None, context=EvaluationContext(attributes={"c": 1})
+    )
+    prefix = client._get_context_prefix()
+
+    # When
+    merged = client._merge_evaluation_context(EvaluationContext(attributes={"i": 2}))
+
+    # Then
+    assert client._get_context_prefix() is prefix
+    assert merged is not prefix
+    assert merged.targeting_key == "api"
+    assert merged.attributes == {"api": True, "c": 1, "i": 2}
+    api.clear_evaluation_context()
+
+
+@pytest.mark.parametrize(
+    "change",
+    (
+        pytest.param(
+            lambda client: api.set_evaluation_context(EvaluationContext("new")),
+            id="api_context",
+        ),
+        pytest.param(
+            lambda client: api.set_transaction_context(EvaluationContext("new")),
+            id="transaction_context",
+        ),
+        pytest.param(
+            lambda client: setattr(client, "context", EvaluationContext("new")),
+            id="client_context",
+        ),
+    ),
+)
+def test_merged_context_prefix_is_invalidated_when_a_context_is_set(change):
+    # Given
+    api.set_transaction_context_propagator(ContextVarsTransactionContextPropagator())
+    api.set_transaction_context(EvaluationContext())
+    client = get_client()
+    prefix = client._get_context_prefix()
+
+    # When
+    change(client)
+
+    # Then
+    assert client._get_context_prefix() is not prefix
+    assert client._get_context_prefix().targeting_key == "new"
+    api.clear_evaluation_context()
+    api.clear_transaction_context_propagator()
+
+
+def test_merged_context_prefix_is_kept_per_transaction_context():
+    # Given
+    api.set_transaction_context_propagator(ContextVarsTransactionContextPropagator())
+    client = get_client()
+
+    def enter_transaction(targeting_key):
+        api.set_transaction_context(EvaluationContext(targeting_key))
+        return client._get_context_prefix()
+
+    first_transaction = contextvars.copy_context()
+    second_transaction = contextvars.copy_context()
+    first_prefix = first_transaction.run(enter_transaction, "first")
+    second_prefix = second_transaction.run(enter_transaction, "second")
+
+    # When
+    prefixes = [
+        transaction.run(client._get_context_prefix)
+        for transaction in (first_transaction, second_transaction) * 2
+    ]
+
+    # Then
+    assert prefixes[0] is prefixes[2] is first_prefix
+    assert prefixes[1] is prefixes[3] is second_prefix
+    assert first_prefix.targeting_key == "first"
+    assert second_prefix.targeting_key == "second"
+    api.clear_transaction_context_propagator()
+
+
+def test_merged_context_prefix_sees_contexts_set_again_after_mutation():
+    # Given
+    api.clear_transaction_context_propagator()
+    api_context = EvaluationContext(attributes={"version": 1})
+    api.set_evaluation_context(api_context)
+    client = get_client()
+    client.get_boolean_value("Key", False)
+
+    # When
+    api_context.attributes = {"version": 2}
+    api.set_evaluation_context(api_context)
+
+    # Then
+    assert client._get_context_prefix().attributes == {"version": 2}
+    api.clear_evaluation_context()
+
+
+def test_merged_context_prefix_is_not_shared_with_evaluations():
+    # Given
+    api.clear_transaction_context_propagator()
+    api_context = EvaluationContext("api", {"api": True})
+    api.set_evaluation_context(api_context)
+    client = get_client()
+
+    # When
+    first = client._merge_evaluation_context(None)
+    first.attributes["hooked"] = True  # type: ignore[index]
+    second = client._merge_evaluation_context(None)
+
+    # Then
+    assert first.attributes is not second.attributes
+    assert second.attributes == {"api": True}
+    assert client._get_context_prefix().attributes == {"api": True}
+    assert api_context.attributes == {"api": True}
+    api.clear_evaluation_context()
+
+
+def test_set_evaluation_context_should_count_concurrent_changes():
+    # Given
+    version = get_evaluation_context_version()
+    context = EvaluationContext()
+
+    # When
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for _ in range(1000):
+            executor.submit(api.set_evaluation_context, context)
+
+    # Then
+    assert get_evaluation_context_version() == version + 1000
+    api.clear_evaluation_context()
+
+
+class CountingProvider(InMemoryProvider):
+    def __init__(self, flags):
+        super().__init__(flags)
+        self.resolutions = 0
+
+    def resolve_boolean_details(self, flag_key, default_value, evaluation_context=None):
+        self.resolutions += 1
+        return super().resolve_boolean_details(
+            flag_key, default_value, evaluation_context
+        )
+
+
+@pytest.mark.parametrize("with_hook", (False, True), ids=("fast_path", "hooks"))
+def test_cache_should_skip_the_provider_for_repeated_evaluations(with_hook):
+    # Given
+    provider = CountingProvider(
+        {"flag": InMemoryFlag("on", {"on": True, "off": False})}
+    )
+    set_provider(provider)
+    cache = EvaluationCache()
+    client = OpenFeatureClient(domain=None, version=None, cache=cache)
+    hook = MagicMock(spec=Hook)
+    hook.before.return_value = None
+    if with_hook:
+        client.add_hooks([hook])
+    context = EvaluationContext("user", {"plan": "pro"})
+
+    # When
+    first = client.get_boolean_details("flag", False, context)
+    second = client.get_boolean_details("flag", False, context)
+    other_user = client.get_boolean_details("flag", False, EvaluationContext("other"))
+
+    # Then
+    assert first.reason == Reason.STATIC
+    assert second.value is True
+    assert second.reason == Reason.CACHED
+    assert other_user.reason == Reason.STATIC
+    assert provider.resolutions == 2
+    assert cache.get_statistics() == CacheStatistics(hits=1, misses=2, size=2)
+    if with_hook:
+        assert hook.after.call_count == 3
+        assert hook.after.call_args_list[1].kwargs["details"].reason == Reason.CACHED
+
+
+@pytest.mark.parametrize(
+    ("flags_changed", "expected_resolutions"),
+    ((["flag"], 2), (["other-flag"], 1), (None, 2)),
+    ids=("changed_flag", "unrelated_flag", "all_flags"),
+)
+def test_cache_should_be_invalidated_when_provider_configuration_changes(
+    flags_changed, expected_resolutions
+):
+    # Given
+    provider = CountingProvider(
+        {"flag": InMemoryFlag("on", {"on": True, "off": False})}
+    )
+    set_provider(provider)
+    client = OpenFeatureClient(domain=None, version=None, cache=EvaluationCache())
+    client.get_boolean_value("flag", False)
+    client.get_boolean_value("flag", False)
+
+    # When
+    provider.emit_provider_configuration_changed(
+        ProviderEventDetails(flags_changed=flags_changed)
+    )
+    client.get_boolean_value("flag", False)
+
+    # Then
+    assert provider.resolutions == expected_resolutions
+
+
+def test_cache_should_not_serve_entries_of_a_replaced_provider():
+    # Given
+    set_provider(InMemoryProvider({"flag": InMemoryFlag("on", {"on": True})}))
+    client = OpenFeatureClient(domain=None, version=None, cache=EvaluationCache())
+    client.get_boolean_value("flag", False)
+
+    # When
+    set_provider(InMemoryProvider({"flag": InMemoryFlag("off", {"off": False})}))
+
+    # Then
+    assert client.get_boolean_value("flag", True) is False
+
+
+def test_cache_should_not_serve_the_default_value_of_another_call():
+    # Given
+    set_provider(NoOpProvider())
+    client = OpenFeatureClient(domain=None, version=None, cache=EvaluationCache())
+    client.get_string_details("flag", "a")
+
+    # When
+    details = client.get_string_details("flag", "b")
+
+    # Then
+    assert details.value == "b"
+    assert details.reason == Reason.DEFAULT
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_async", (False, True))
+async def test_cache_should_be_shared_with_bulk_evaluations(use_async):
+    # Given
+    provider = CountingProvider(
+        {
+            "flag": InMemoryFlag("on", {"on": True, "off": False}),
+            "other-flag": InMemoryFlag("off", {"on": True, "off": False}),
+        }
+    )
+    set_provider(provider)
+    cache = EvaluationCache()
+    client = OpenFeatureClient(domain=None, version=None, cache=cache)
+    flags = [("flag", FlagType.BOOLEAN, False), ("other-flag", FlagType.BOOLEAN, True)]
+    client.get_boolean_details("flag", False)
+
+    # When
+    if use_async:
+        results = await client.evaluate_many_async(flags)
+    else:
+        results = client.evaluate_many(flags)
+    other_flag = client.get_boolean_details("other-flag", True)
+
+    # Then
+    assert results["flag"].reason == Reason.CACHED
+    assert results["other-flag"].value is False
+    assert other_flag.reason == Reason.CACHED
+    assert cache.get_statistics() == CacheStatistics(hits=2, misses=2, size=2)
+
+
+@pytest.mark.asyncio
+async def test_flag_handle_should_evaluate_its_flag():
+    # Given
+    set_provider(
+        InMemoryProvider({"flag": InMemoryFlag("on", {"on": "yes", "off": "no"})})
+    )
+    client = OpenFeatureClient(domain=None, version=None)
+
+    # When
+    handle = client.flag_handle("flag", FlagType.STRING, "default")
+    missing = client.flag_handle("missing", FlagType.STRING, "default")
+
+    # Then
+    assert handle.value() == "yes"
+    assert await handle.value_async() == "yes"
+    assert handle.details(EvaluationContext("user")) == client.get_string_details(
+        "flag", "default", EvaluationContext("user")
+    )
+    assert (await missing.details_async()).error_code == ErrorCode.FLAG_NOT_FOUND
+    assert missing.value() == "default"
+
+
+@pytest.mark.asyncio
+async def test_flag_handle_should_follow_provider_and_hook_changes():
+    # Given
+    set_provider(InMemoryProvider({"flag": InMemoryFlag("on", {"on": True})}))
+    client = OpenFeatureClient(domain=None, version=None)
+    handle = client.flag_handle("flag", FlagType.BOOLEAN, False)
+    assert handle.value() is True
+
+    # When
+    set_provider(InMemoryProvider({"flag": InMemoryFlag("off", {"off": False})}))
+    hook = MagicMock(spec=Hook)
+    hook.before.return_value = None
+    client.add_hooks([hook])
+    invocation_hook = MagicMock(spec=Hook)
+    invocation_hook.before.return_value = None
+
+    # Then
+    assert handle.value() is False
+    assert (
+        await handle.value_async(
+            flag_evaluation_options=FlagEvaluationOptions(hooks=[invocation_hook])
+        )
+        is False
+    )
+    assert hook.after.call_count == 2
+    assert invocation_hook.after.call_count == 1
+
+
+class EvaluationDetailsProvider(NoOpProvider):
+    def __init__(self, details):
+        self.details = details
+
+    def resolve_boolean_details(self, flag_key, default_value, evaluation_context=None):
+        return self.details
+
+
+def test_should_use_evaluation_details_returned_by_the_provider_without_copying():
+    # Given
+    details = FlagEvaluationDetails("flag", True, reason=Reason.STATIC)
+    set_provider(EvaluationDetailsProvider(details))
+    client = OpenFeatureClient(domain=None, version=None)
+
+    # When
+    result = client.get_boolean_details("flag", False)
+
+    # Then
+    assert result is details
+
+
+@pytest.mark.parametrize(
+    ("details", "expected_error_code"),
+    (
+        (FlagEvaluationDetails("flag", "yes", reason=Reason.STATIC), "TYPE_MISMATCH"),
+        (
+            FlagEvaluationDetails("flag", True, error_code=ErrorCode.FLAG_NOT_FOUND),
+            "FLAG_NOT_FOUND",
+        ),
+    ),
+    ids=("type_mismatch", "error"),
+)
+def test_should_not_modify_erroneous_evaluation_details_returned_by_the_provider(
+    details, expected_error_code
+):
+    # Given
+    set_provider(EvaluationDetailsProvider(details))
+    client = OpenFeatureClient(domain=None, version=None)
+
+    # When
+    result = client.get_boolean_details("flag", False)
+
+    # Then
+    assert result is not details
+    assert result.value is False
+    assert result.error_code == expected_error_code
+    assert details.value is not False
+
+
+def test_evaluation_should_allocate_little_memory():
+    # Given
+    set_provider(InMemoryProvider({"flag": InMemoryFlag("on", {"on": True})}))
+    client = OpenFeatureClient(domain=None, version=None)
+    for _ in range(10):
+        client.get_boolean_details("flag", False)
+
+    # When
+    tracemalloc.start()
+    try:
+        allocated = []
+        for _ in range(10):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            client.get_boolean_details("flag", False)
+            _, peak = tracemalloc.get_traced_memory()
+            allocated.append(peak - before)
+    finally:
+        tracemalloc.stop()
+
+    # Then
+    # the hook-free path allocates about 600 bytes on CPython 3.11
+    assert min(allocated) < 700
+
+
+def test_hook_chain_should_only_keep_stages_hooks_implement_for_the_flag_type():
+    # Given
+    class AfterHook(Hook):
+        def __init__(self):
+            self.supports_flag_value_type = MagicMock(
+                side_effect=lambda flag_type: flag_type == FlagType.BOOLEAN
+            )
+            self.after = MagicMock()
+
+    after_hook = AfterHook()
+    set_provider(InMemoryProvider({"flag": InMemoryFlag("on", {"on": True})}))
+    client = OpenFeatureClient(domain=None, version=None, hooks=[after_hook, Hook()])
+
+    # When
+    for _ in range(3):
+        client.get_boolean_value("flag", False)
+        client.get_string_value("flag", "default")
+    plan = client._get_evaluation_plan()
+
+    # Then
+    assert after_hook.after.call_count == 3
+    assert after_hook.supports_flag_value_type.call_count == 2
+    assert plan.get_hook_chain(FlagType.BOOLEAN) == (
+        FlagType.BOOLEAN,
+        (after_hook,),
+        (),
+        (0,),
+        (),
+        (),
+        (),
+    )
+    assert not plan.get_hook_chain(FlagType.STRING).hooks
+
+
+def test_hook_chain_should_be_reused_for_the_same_invocation_hooks():
+    # Given
+    class AfterHook(Hook):
+        def after(self, hook_context, details, hints):
+            pass
+
+    set_provider(InMemoryProvider({"flag": InMemoryFlag("on", {"on": True})}))
+    client = OpenFeatureClient(domain=None, version=None)
+    invocation_hook = AfterHook()
+    plan = client._get_evaluation_plan()
+
+    # When
+    chain = plan.get_hook_chain(FlagType.BOOLEAN, [invocation_hook])
+    other_chain = plan.get_hook_chain(FlagType.BOOLEAN, [AfterHook()])
+
+    # Then
+    assert plan.get_hook_chain(FlagType.BOOLEAN, [invocation_hook]) is chain
+    assert chain.hooks == (invocation_hook,)
+    assert other_chain.hooks != chain.hooks
+    assert plan.get_hook_chain(FlagType.STRING, [invocation_hook]) is not chain
+
+
+@pytest.mark.asyncio
+async def test_async_evaluation_should_await_async_hooks_alongside_sync_hooks():
+    # Given
+    calls = []
+
+    class RecordingAsyncHook(AsyncHook):
+        async def before_async(self, hook_context, hints):
+            await asyncio.sleep(0)
+            calls.append("async before")
+            return EvaluationContext("user")
+
+        async def finally_after_async(self, hook_context, details, hints):
+            await asyncio.sleep(0)
+            calls.append("async finally_after")
+
+    class RecordingHook(Hook):
+        def before(self, hook_context, hints):
+            calls.append("sync before")
+
+        def finally_after(self, hook_context, details, hints):
+            calls.append("sync finally_after")
+
+    provider = InMemoryProvider({"flag": InMemoryFlag("on", {"on": True})})
+    provider.resolve_boolean_details_async = AsyncMock(
+        wraps=provider.resolve_boolean_details_async
+    )
+    set_provider(provider)
+    client = OpenFeatureClient(
+        domain=None, version=None, hooks=[RecordingAsyncHook(), RecordingHook()]
+    )
+
+    # When
+    details = await client.get_boolean_details_async("flag", False)
+    sync_details = client.get_boolean_details("flag", False)
+
+    # Then
+    assert details.value is True
+    assert sync_details.value is True
+    assert calls == [
+        "async before",
+        "sync before",
+        "sync finally_after",
+        "async finally_after",
+        # synchronous evaluations only run the synchronous stages
+        "sync before",
+        "sync finally_after",
+    ]
+    evaluation_context = provider.resolve_boolean_details_async.await_args.kwargs[
+        "evaluation_context"
+    ]
+    assert evaluation_context.targeting_key == "user"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "evaluate", ["evaluate_many_async", "evaluate_many_concurrently_async"]
+)
+async def test_bulk_async_evaluation_should_await_async_hooks(evaluate):
+    # Given
+    calls = []
+
+    class RecordingAsyncHook(AsyncHook):
+        async def before_async(self, hook_context, hints):
+            await asyncio.sleep(0)
+            calls.append(("before", hook_context.flag_key))
+
+        async def after_async(self, hook_context, details, hints):
+            await asyncio.sleep(0)
+            calls.append(("after", details.flag_key))
+
+        async def finally_after_async(self, hook_context, details, hints):
+            await asyncio.sleep(0)
+            calls.append(("finally_after", details.flag_key))
+
+    set_provider(
+        InMemoryProvider(
+            {
+                "flag": InMemoryFlag("on", {"on": True}),
+                "other-flag": InMemoryFlag("on", {"on": "value"}),
+            }
+        )
+    )
+    client = OpenFeatureClient(domain=None, version=None, hooks=[RecordingAsyncHook()])
+
+    # When
+    results = await getattr(client, evaluate)(
+        [("flag", FlagType.BOOLEAN, False), ("other-flag", FlagType.STRING, "")]
+    )
+
+    # Then
+    assert results["flag"].value is True
+    assert sorted(calls) == sorted(
+        (stage, flag_key)
+        for stage in ("before", "after", "finally_after")
+        for flag_key in ("flag", "other-flag")
+    )
+
+
+def test_sync_evaluation_should_warn_once_about_async_only_hooks(caplog):
+    # Given
+    class AsyncOnlyHook(AsyncHook):
+        async def after_async(self, hook_context, details, hints):
+            pass
+
+    set_provider(InMemoryProvider({"flag": InMemoryFlag("on", {"on": True})}))
+    client = OpenFeatureClient(
+        domain=None, version=None, hooks=[AsyncOnlyHook(), AsyncOnlyHook()]
+    )
+
+    # When
+    with caplog.at_level(logging.WARNING, logger="openfeature"):
+        client.get_boolean_value("flag", False)
+        client.evaluate_many([("flag", FlagType.BOOLEAN, False)])
+
+    # Then
+    warnings = [
+        record for record in caplog.records if "AsyncOnlyHook" in record.getMessage()
+    ]
+    assert len(warnings) == 1
+    assert "after" in warnings[0].getMessage()
+
+
+@pytest.mark.asyncio
+async def test_evaluate_many_concurrently_should_run_hooks_when_the_caller_is_cancelled():
+    # Given
+    flags = {
+        "fast-flag": InMemoryFlag("on", {"on": True, "off": False}),
+        "slow-flag": InMemoryFlag("on", {"on": True, "off": False}),
+    }
+    provider = SlowAsyncProvider(flags, {"slow-flag": 10})
+    api.set_provider(provider)
+    client = get_client()
+    spy_hook = MagicMock(spec=Hook)
+    spy_hook.before.return_value = None
+    client.add_hooks([spy_hook])
+
+    # When
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(
+            client.evaluate_many_concurrently_async(
+                [(key, FlagType.BOOLEAN, False) for key in flags]
+            ),
+            timeout=0.1,
+        )
+
+    # Then
+    spy_hook.after.assert_called_once()
+    spy_hook.error.assert_called_once()
+    assert spy_hook.error.call_args.kwargs["hook_context"].flag_key == "slow-flag"
+    assert spy_hook.finally_after.call_count == 2
+    assert provider.running == 0
@@ -1,5 +1,17 @@
+import copy
+import pickle
+
+import pytest
+
+from openfeature.evaluation_context import EvaluationContext
+from openfeature.event import EventDetails, ProviderEventDetails
 from openfeature.exception import ErrorCode
-from openfeature.flag_evaluation import FlagEvaluationDetails, Reason
+from openfeature.flag_evaluation import (
+    FlagEvaluationDetails,
+    FlagResolutionDetails,
+    Reason,
+)
+from openfeature.track import TrackingEventDetails
 
 
 def test_evaluation_details_reason_should_be_a_string():
@@ -58,3 +70,33 @@ def test_evaluation_details_reason_should_be_a_string_when_set():
 
 def test_reason_str():
     assert str(Reason.DEFAULT) == "DEFAULT"
+
+
+@pytest.mark.parametrize(
+    "value",
+    (
+        FlagEvaluationDetails("flag", True, "on", {"a": 1}, Reason.STATIC),
+        FlagResolutionDetails(True, None, None, Reason.STATIC, "on", {"a": 1}),
+        EvaluationContext("user", {"a": 1}),
+        ProviderEventDetails(["flag"], "message", ErrorCode.GENERAL, {"a": 1}),
+        EventDetails("provider", ["flag"], "message", None, {"a": 1}),
+    ),
+    ids=lambda value: type(value).__name__,
+)
+def test_data_classes_should_be_slotted_and_picklable(value):
+    # Then
+    assert not hasattr(value, "__dict__")
+    assert pickle.loads(pickle.dumps(value)) == value  # noqa: S301
+    assert copy.deepcopy(value) == value
+
+
+def test_tracking_event_details_should_be_slotted_and_picklable():
+    # Given
+    details = TrackingEventDetails(1.5).add("currency", "USD")
+
+    # When
+    restored = pickle.loads(pickle.dumps(details))  # noqa: S301
+
+    # Then
+    assert not hasattr(details, "__dict__")
+    assert (restored.value, restored.attributes) == (1.5, {"currency": "USD"})
@@ -1,18 +1,24 @@
 import asyncio
 import threading
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from openfeature.api import (
+    get_client,
     get_transaction_context,
+    set_provider,
     set_transaction_context,
     set_transaction_context_propagator,
 )
 from openfeature.evaluation_context import EvaluationContext
+from openfeature.flag_evaluation import FlagType, Reason
+from openfeature.provider.in_memory_provider import InMemoryFlag, InMemoryProvider
 from openfeature.transaction_context import (
     ContextVarsTransactionContextPropagator,
+    EvaluationScope,
     TransactionContextPropagator,
+    get_evaluation_scope,
 )
 from openfeature.transaction_context.no_op_transaction_context_propagator import (
     NoOpTransactionContextPropagator,
@@ -173,3 +179,111 @@ async def test_context_vars_transaction_context_propagator_asyncio():
     for i in range(number_of_tasks):
         assert results[i].targeting_key == f"context_{i}"
         assert results[i].attributes == {"async": i}
+
+
+def _create_counting_client():
+    provider = InMemoryProvider(
+        {"flag": InMemoryFlag("on", {"on": True, "off": False})}
+    )
+    provider.resolve_boolean_details = MagicMock(
+        side_effect=provider.resolve_boolean_details
+    )
+    provider.resolve_boolean_details_async = AsyncMock(
+        side_effect=provider.resolve_boolean_details_async
+    )
+    set_provider(provider)
+    return provider, get_client()
+
+
+def test_evaluation_scope_should_reuse_results_within_the_scope():
+    # Given
+    provider, client = _create_counting_client()
+
+    # When
+    with EvaluationScope():
+        first = client.get_boolean_details("flag", False)
+        provider.update_flags({"flag": InMemoryFlag("off", {"on": True, "off": False})})
+        second = client.get_boolean_details("flag", False)
+        other_context = client.get_boolean_details(
+            "flag", False, EvaluationContext("user")
+        )
+    outside = client.get_boolean_details("flag", False)
+
+    # Then
+    assert get_evaluation_scope() is None
+    assert first.value is True
+    assert (second.value, second.reason) == (True, Reason.CACHED)
+    assert other_context.value is False
+    assert outside.value is False
+    assert provider.resolve_boolean_details.call_count == 3
+
+
+def test_evaluation_scope_should_be_shared_with_bulk_evaluations():
+    # Given
+    provider, client = _create_counting_client()
+
+    # When
+    with EvaluationScope():
+        first = client.get_boolean_details("flag", False)
+        provider.update_flags({"flag": InMemoryFlag("off", {"on": True, "off": False})})
+        results = client.evaluate_many([("flag", FlagType.BOOLEAN, False)])
+
+    # Then
+    assert first.value is True
+    assert (results["flag"].value, results["flag"].reason) == (True, Reason.CACHED)
+    assert provider.resolve_boolean_details.call_count == 1
+
+
+def test_evaluation_scope_should_not_be_shared_between_threads():
+    # Given
+    provider, client = _create_counting_client()
+    scopes = []
+
+    # When
+    with EvaluationScope():
+        client.get_boolean_value("flag", False)
+        thread = threading.Thread(target=lambda: scopes.append(get_evaluation_scope()))
+        thread.start()
+        thread.join()
+        client.get_boolean_value("flag", False)
+
+    # Then
+    assert scopes == [None]
+    assert provider.resolve_boolean_details.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_evaluation_scope_should_be_shared_with_tasks_created_inside():
+    # Given
+    provider, client = _create_counting_client()
+
+    # When
+    async with EvaluationScope():
+        results = await asyncio.gather(
+            *(
+                asyncio.create_task(client.get_boolean_details_async("flag", False))
+                for _ in range(3)
+            ),
+            client.get_boolean_details_async("flag", False),
+        )
+        results.append(await client.get_boolean_details_async("flag", False))
+
+    # Then
+    assert [result.value for result in results] == [True] * 5
+    assert results[-1].reason == Reason.CACHED
+    assert provider.resolve_boolean_details_async.await_count == 1
+
+
+def test_evaluation_scope_should_set_and_restore_the_transaction_context():
+    # Given
+    set_transaction_context_propagator(ContextVarsTransactionContextPropagator())
+    outer_context = EvaluationContext("outer")
+    set_transaction_context(outer_context)
+
+    # When
+    with EvaluationScope(EvaluationContext("request")):
+        inner = get_transaction_context()
+
+    # Then
+    assert inner.targeting_key == "request"
+    assert get_transaction_context() is outer_context